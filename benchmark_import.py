@@ -0,0 +1,151 @@
+"""
+Banc d'essai du temps d'import de video_scraper
+
+Chaque processus du crawl multi-processus (et chaque outil qui ne fait
+qu'importer le module) paie l'import de video_scraper. Ce script lance
+`python -c "import video_scraper"` dans des interpréteurs neufs, depuis un
+répertoire temporaire, et vérifie que l'import reste rapide et sans effet
+de bord: aucun module lourd chargé (pilotes Selenium, requests, asyncio,
+fake_useragent, webdriver_manager...) et aucun fichier video_scraper.log créé.
+
+Usage:
+    python benchmark_import.py                  # 10 imports
+    python benchmark_import.py --runs 30 --top 15
+    python benchmark_import.py --max-ms 150     # code de sortie 1 si la médiane dépasse 150 ms
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Modules qui ne doivent être chargés qu'à la demande (start(), validation, CDP, crawl)
+HEAVY_MODULES = [
+    'asyncio',
+    'multiprocessing',
+    'requests',
+    'fake_useragent',
+    'webdriver_manager',
+    'websocket',
+    'selenium.webdriver.remote.webdriver',
+    'selenium.webdriver.chrome.webdriver',
+    'selenium.webdriver.firefox.webdriver',
+    'selenium.webdriver.edge.webdriver',
+    'selenium.webdriver.support.wait',
+]
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import video_scraper\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed)\n"
+    "print(','.join(m for m in {heavy!r} if m in sys.modules))\n"
+)
+
+
+def _environment() -> dict:
+    """Environnement du sous-processus: le module est importé depuis ce dépôt"""
+    env = dict(os.environ)
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_dir, env.get('PYTHONPATH')]))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def measure(runs: int, cwd: str):
+    """Importe le module runs fois dans des interpréteurs neufs
+
+    Returns:
+        Liste des durées d'import (secondes) et ensemble des modules lourds chargés
+    """
+    env = _environment()
+    probe = PROBE.format(heavy=HEAVY_MODULES)
+    timings, loaded = [], set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', probe], cwd=cwd, env=env,
+            capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        timings.append(float(output[0]))
+        loaded.update(filter(None, output[1].split(',')))
+    return timings, loaded
+
+
+def import_profile(cwd: str, top: int):
+    """Modules les plus coûteux selon -X importtime (temps cumulé, en µs)
+
+    Returns:
+        Liste (cumulé µs, module) triée par coût décroissant
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import video_scraper'],
+        cwd=cwd, env=_environment(), capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        rows.append((int(cumulative), name[1:]))
+
+    # Les imports imbriqués précèdent leur parent: on ne garde que le sous-arbre
+    # de video_scraper (et non site, chargé par l'interpréteur lui-même)
+    end = next(i for i, (_, name) in enumerate(rows) if name == 'video_scraper')
+    begin = end
+    while begin > 0 and rows[begin - 1][1].startswith(' '):
+        begin -= 1
+    subtree = [(cumulative, name.strip()) for cumulative, name in rows[begin:end + 1]]
+    subtree.sort(reverse=True)
+    return subtree[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help="Nombre d'imports mesurés")
+    parser.add_argument('--top', type=int, default=10, help="Nombre de modules affichés (-X importtime)")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="Seuil de la médiane en millisecondes (code de sortie 1 si dépassé)")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as cwd:
+        # Premier import hors mesure: compilation du bytecode
+        measure(1, cwd)
+        start = time.perf_counter()
+        timings, loaded = measure(args.runs, cwd)
+        wall = time.perf_counter() - start
+        profile = import_profile(cwd, args.top)
+        log_created = os.path.exists(os.path.join(cwd, 'video_scraper.log'))
+
+    median_ms = 1000 * statistics.median(timings)
+    print("=" * 70)
+    print(f"Imports mesurés:        {args.runs} ({wall:.2f} s avec le démarrage des interpréteurs)")
+    print(f"Temps d'import médian:  {median_ms:.1f} ms")
+    print(f"Temps d'import maximal: {1000 * max(timings):.1f} ms")
+    print("=" * 70)
+    print(f"{'cumulé (ms)':>12}  module")
+    for cumulative, name in profile:
+        print(f"{cumulative / 1000:>12.1f}  {name}")
+    print("=" * 70)
+
+    if loaded:
+        failures.append(f"modules lourds chargés à l'import: {', '.join(sorted(loaded))}")
+    if log_created:
+        failures.append("video_scraper.log créé à l'import")
+    if args.max_ms is not None and median_ms > args.max_ms:
+        failures.append(f"médiane {median_ms:.1f} ms > seuil {args.max_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✓ Import rapide et sans effet de bord")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+Banc d'essai hors ligne du scraper sur un site vidéo synthétique local
+
+Un serveur HTTP local sert un site généré (graphe de liens configurable,
+pages avec <video>/<source>, lecteurs chargés au scroll, manifestes HLS avec
+segments, MPD DASH, URLs leurres) dont on connaît tous les flux. Le scraper
+est lancé dessus (scrape_page sur chaque page, ou scrape_recursive depuis
+l'accueil) et le banc mesure: pages/s, latence p50/p95 par page, pic de
+mémoire (Python et navigateurs), précision et rappel des flux détectés.
+
+Usage:
+    python benchmark_scraper.py                          # crawl récursif de 60 pages, Chrome headless
+    python benchmark_scraper.py --mode page --pages 20
+    python benchmark_scraper.py --tabs 4 --blocking --tiered
+    python benchmark_scraper.py --json bench.json        # résultats pour comparer deux versions
+    python benchmark_scraper.py --baseline bench.json    # code de sortie 1 en cas de régression
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from video_scraper import VideoScraper, VideoScraperPool, _process_tree_rss
+
+
+# Types de pages et proportion de chaque type
+PAGE_KINDS = [
+    ('video', 3),    # <video src="...mp4">
+    ('source', 2),   # <video><source src="...webm"></video>
+    ('lazy', 2),     # lecteur HLS inséré au premier scroll
+    ('hls', 2),      # manifeste et segments chargés en JavaScript (comme hls.js)
+    ('dash', 2),     # MPD et segments chargés en JavaScript (comme dash.js)
+    ('plain', 3),    # aucune vidéo, seulement des leurres
+]
+
+SEGMENTS = 6
+
+HLS_MASTER = """#EXTM3U
+#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=640x360,CODECS="avc1.4d401e,mp4a.40.2"
+360p/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=2800000,RESOLUTION=1280x720,CODECS="avc1.4d401f,mp4a.40.2"
+720p/index.m3u8
+"""
+
+DASH_MPD = """<?xml version="1.0"?>
+<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="static" mediaPresentationDuration="PT{duration}S">
+ <Period>
+  <AdaptationSet mimeType="video/mp4" codecs="avc1.64001f">
+   <SegmentTemplate timescale="1000" duration="4000" media="chunk-$RepresentationID$-$Number$.m4s" initialization="init-$RepresentationID$.m4s"/>
+   <Representation id="v1" bandwidth="1000000" width="1280" height="720"/>
+   <Representation id="v2" bandwidth="3000000" width="1920" height="1080"/>
+  </AdaptationSet>
+ </Period>
+</MPD>
+"""
+
+# Chargement d'un flux par script, à la manière d'hls.js/dash.js
+FETCH_PLAYER = """<script>
+fetch('{manifest}').then(r => r.text()).then(() => {{
+  for (const segment of {segments}) fetch(segment);
+}});
+</script>"""
+
+LAZY_PLAYER = """<div id="player"></div>
+<script>
+window.addEventListener('scroll', () => {{
+  const video = document.createElement('video');
+  video.src = '{manifest}';
+  document.getElementById('player').appendChild(video);
+}}, {{once: true}});
+</script>"""
+
+
+class SyntheticSite:
+    """Site vidéo généré, avec la liste des flux de chaque page"""
+
+    def __init__(self, pages: int = 60, fanout: int = 4, seed: int = 42):
+        """
+        Args:
+            pages: Nombre de pages HTML
+            fanout: Nombre de liens vers d'autres pages sur chaque page
+            seed: Graine du générateur
+        """
+        rng = random.Random(seed)
+        kinds = [kind for kind, weight in PAGE_KINDS for _ in range(weight)]
+        self.base_url = ''
+        self.kinds = [rng.choice(kinds) for _ in range(pages)]
+        self.kinds[0] = 'plain'
+        # Une page sur cinq porte un nom de page "vidéo" (leurre pour le classifieur)
+        self.paths = ['/' if n == 0 else (f"/videos/{n}-trailer" if n % 5 == 0 else f"/page/{n}")
+                      for n in range(pages)]
+        self.links = [
+            sorted({(n + 1) % pages} | {rng.randrange(pages) for _ in range(fanout - 1)} - {n})
+            for n in range(pages)
+        ]
+        self._by_path = {path: n for n, path in enumerate(self.paths)}
+
+    def streams(self, n: int):
+        """Chemins des flux attendus sur la page n"""
+        kind = self.kinds[n]
+        if kind == 'video':
+            return [f"/files/{n}.mp4"]
+        if kind == 'source':
+            return [f"/files/{n}.webm"]
+        if kind in ('lazy', 'hls'):
+            return [f"/hls/{n}/master.m3u8"]
+        if kind == 'dash':
+            return [f"/dash/{n}/manifest.mpd"]
+        return []
+
+    def truth(self, urls=None):
+        """
+        URLs absolues des flux attendus
+
+        Args:
+            urls: Pages visitées (None = toutes les pages du site)
+        """
+        pages = range(len(self.paths)) if urls is None else (
+            self._by_path[path] for path in (url[len(self.base_url):] or '/' for url in urls)
+            if path in self._by_path
+        )
+        return {self.base_url + stream for n in pages for stream in self.streams(n)}
+
+    def page_html(self, n: int) -> str:
+        """HTML de la page n"""
+        kind = self.kinds[n]
+        links = '\n'.join(f'<li><a href="{self.paths[target]}">Page {target}</a></li>'
+                          for target in self.links[n])
+
+        if kind == 'video':
+            player = f'<video src="/files/{n}.mp4" controls preload="none"></video>'
+        elif kind == 'source':
+            player = f'<video controls preload="none"><source src="/files/{n}.webm" type="video/webm"></video>'
+        elif kind == 'lazy':
+            player = LAZY_PLAYER.format(manifest=f"/hls/{n}/master.m3u8")
+        elif kind == 'hls':
+            segments = [f"/hls/{n}/360p/seg-{k}.ts" for k in range(3)]
+            player = FETCH_PLAYER.format(manifest=f"/hls/{n}/master.m3u8", segments=json.dumps(segments))
+        elif kind == 'dash':
+            segments = [f"/dash/{n}/chunk-v1-{k}.m4s" for k in range(1, 4)]
+            player = FETCH_PLAYER.format(manifest=f"/dash/{n}/manifest.mpd", segments=json.dumps(segments))
+        else:
+            player = '<p>Aucune vidéo sur cette page.</p>'
+
+        return f"""<!DOCTYPE html>
+<html><head><title>Page {n}</title>
+<link rel="stylesheet" href="/assets/css/video-player.css">
+<script src="/assets/js/hls.min.js"></script>
+</head><body>
+<h1>Page {n}</h1>
+<img src="/media/{n}/thumbnail.jpg" alt="">
+{player}
+<ul>
+{links}
+</ul>
+</body></html>"""
+
+    def resource(self, path: str):
+        """
+        Contenu servi pour un chemin
+
+        Returns:
+            Tuple (type MIME, contenu), ou None si le chemin n'existe pas
+        """
+        if path in self._by_path:
+            return 'text/html; charset=utf-8', self.page_html(self._by_path[path]).encode()
+        if path == '/assets/js/hls.min.js':
+            return 'application/javascript', b'/* leurre */'
+        if path == '/assets/css/video-player.css':
+            return 'text/css', b'video { width: 100%; }'
+        if re.fullmatch(r'/media/\d+/thumbnail\.jpg', path):
+            return 'image/jpeg', b'\xff\xd8\xff\xe0' + b'\0' * 512
+        if re.fullmatch(r'/files/\d+\.(mp4|webm)', path):
+            mime = 'video/mp4' if path.endswith('.mp4') else 'video/webm'
+            return mime, b'\0\0\0\x18ftypmp42' + b'\0' * 4096
+        if re.fullmatch(r'/hls/\d+/master\.m3u8', path):
+            return 'application/vnd.apple.mpegurl', HLS_MASTER.encode()
+        if re.fullmatch(r'/hls/\d+/\d+p/index\.m3u8', path):
+            playlist = ['#EXTM3U', '#EXT-X-TARGETDURATION:4']
+            for k in range(SEGMENTS):
+                playlist += ['#EXTINF:4.0,', f"seg-{k}.ts"]
+            return 'application/vnd.apple.mpegurl', ('\n'.join(playlist + ['#EXT-X-ENDLIST']) + '\n').encode()
+        if re.fullmatch(r'/hls/\d+/\d+p/seg-\d+\.ts', path):
+            return 'video/mp2t', b'\x47' + b'\0' * 187
+        if re.fullmatch(r'/dash/\d+/manifest\.mpd', path):
+            return 'application/dash+xml', DASH_MPD.format(duration=4 * SEGMENTS).encode()
+        if re.fullmatch(r'/dash/\d+/(chunk|init)-v\d+(-\d+)?\.m4s', path):
+            return 'video/iso.segment', b'\0' * 1024
+        return None
+
+
+def serve(site: SyntheticSite, latency: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Démarre le serveur du site sur un port libre (thread en arrière-plan)
+
+    Args:
+        site: Site à servir (site.base_url est renseigné)
+        latency: Délai ajouté à chaque réponse (secondes)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self, body: bool):
+            if latency:
+                time.sleep(latency)
+            found = site.resource(self.path.split('?', 1)[0])
+            if found is None:
+                self.send_error(404)
+                return
+            mime, content = found
+            self.send_response(200)
+            self.send_header('Content-Type', mime)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            if body:
+                self.wfile.write(content)
+
+        def do_GET(self):
+            self._respond(True)
+
+        def do_HEAD(self):
+            self._respond(False)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class MemorySampler:
+    """Pic de mémoire résidente du processus et de ses descendants (navigateurs)"""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_tree = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def _tree_rss() -> int:
+        """Somme des RSS (octets) de ce processus et de ses descendants (Linux, /proc)"""
+        return _process_tree_rss(os.getpid()) or 0
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.peak_tree = max(self.peak_tree, self._tree_rss())
+            except OSError:
+                return
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if os.path.isdir('/proc'):
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    @staticmethod
+    def peak_python() -> int:
+        """Pic de RSS du processus Python (octets)"""
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def percentile(values, q: float) -> float:
+    """Percentile (plus proche rang) d'une liste de durées"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def _record_latencies(scrapers, latencies):
+    """Relève la durée de chaque page mesurée par les ScrapeStats des scrapers"""
+    for scraper in scrapers:
+        end_page = scraper.stats.end_page
+
+        def _end_page(url, total, *args, _end_page=end_page, **kwargs):
+            latencies.append(total)
+            return _end_page(url, total, *args, **kwargs)
+
+        scraper.stats.end_page = _end_page
+
+
+def _scrape_pages(scraper: VideoScraper, urls, wait_time: float):
+    """scrape_page sur chaque URL avec un même navigateur; renvoie les flux détectés"""
+    detected = set()
+    for url in urls:
+        scraper.scrape_page(url, wait_time=wait_time)
+        detected.update(stream.url for stream in scraper.streams)
+    return detected
+
+
+def run(args, site: SyntheticSite):
+    """Lance le scraper sur le site et calcule les mesures"""
+    options = dict(browser=args.browser, headless=not args.show, tiered=args.tiered,
+                   blocking=args.blocking or None)
+    if args.workers > 1:
+        scraper = VideoScraperPool(workers=args.workers, **options)
+        scrapers = scraper.scrapers
+    else:
+        scraper = VideoScraper(tabs=args.tabs, **options)
+        scrapers = [scraper]
+
+    latencies = []
+    _record_latencies(scrapers, latencies)
+    detected = set()
+
+    with MemorySampler() as memory:
+        started = time.perf_counter()
+        try:
+            if args.mode == 'page':
+                visited = [site.base_url + path for path in site.paths[:args.pages]]
+                if args.workers > 1:
+                    # Le pool n'a pas de scrape_page: pages réparties entre ses navigateurs
+                    scraper.start()
+                    workers = scraper.scrapers
+                    with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+                        shares = [visited[i::len(workers)] for i in range(len(workers))]
+                        for found in executor.map(_scrape_pages, workers, shares,
+                                                  [args.wait_time] * len(workers)):
+                            detected.update(found)
+                else:
+                    detected.update(_scrape_pages(scraper, visited, args.wait_time))
+            else:
+                scraper.scrape_recursive(site.base_url + '/', max_depth=args.max_depth,
+                                         wait_time=args.wait_time, delay_between_requests=0,
+                                         max_pages=args.pages)
+                visited = list(scraper.visited_urls)
+                detected.update(stream.url for stream in scraper.streams)
+            elapsed = time.perf_counter() - started
+        finally:
+            scraper.close()
+
+    truth = site.truth(visited)
+    found = detected & truth
+    return {
+        'mode': args.mode,
+        'browser': args.browser,
+        'pages': len(visited),
+        'elapsed': round(elapsed, 3),
+        'pages_per_second': round(len(visited) / elapsed, 3) if elapsed else 0.0,
+        'p50': round(percentile(latencies, 0.50), 3),
+        'p95': round(percentile(latencies, 0.95), 3),
+        'peak_rss_mb': round(memory.peak_tree / 2 ** 20, 1),
+        'peak_python_mb': round(MemorySampler.peak_python() / 2 ** 20, 1),
+        'streams_expected': len(truth),
+        'streams_detected': len(detected),
+        'precision': round(len(found) / len(detected), 4) if detected else 1.0,
+        'recall': round(len(found) / len(truth), 4) if truth else 1.0,
+        'false_positives': sorted(detected - truth)[:20],
+        'missed': sorted(truth - detected)[:20],
+    }
+
+
+def regressions(result, baseline, tolerance: float):
+    """Liste des mesures dégradées par rapport à une exécution de référence"""
+    problems = []
+    if result['pages_per_second'] < baseline['pages_per_second'] * (1 - tolerance):
+        problems.append(f"débit {result['pages_per_second']} < {baseline['pages_per_second']} pages/s")
+    if result['p95'] > baseline['p95'] * (1 + tolerance):
+        problems.append(f"latence p95 {result['p95']}s > {baseline['p95']}s")
+    if baseline['peak_rss_mb'] and result['peak_rss_mb'] > baseline['peak_rss_mb'] * (1 + tolerance):
+        problems.append(f"mémoire {result['peak_rss_mb']} > {baseline['peak_rss_mb']} Mo")
+    for metric in ('precision', 'recall'):
+        if result[metric] < baseline[metric] - 0.01:
+            problems.append(f"{metric} {result[metric]} < {baseline[metric]}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mode', choices=['recursive', 'page'], default='recursive',
+                        help="scrape_recursive depuis l'accueil ou scrape_page sur chaque page")
+    parser.add_argument('--pages', type=int, default=60, help="Nombre de pages du site (et de pages visitées)")
+    parser.add_argument('--fanout', type=int, default=4, help="Liens par page")
+    parser.add_argument('--max-depth', type=int, default=10, help="Profondeur maximale (mode recursive)")
+    parser.add_argument('--seed', type=int, default=42, help="Graine du générateur de site")
+    parser.add_argument('--latency', type=float, default=0.0, help="Délai ajouté à chaque réponse HTTP (secondes)")
+    parser.add_argument('--browser', choices=['chrome', 'firefox', 'edge'], default='chrome')
+    parser.add_argument('--show', action='store_true', help="Affiche le navigateur (pas de mode headless)")
+    parser.add_argument('--wait-time', type=float, default=10, help="Attente maximale par page (secondes)")
+    parser.add_argument('--tabs', type=int, default=1, help="Onglets en parallèle (VideoScraper)")
+    parser.add_argument('--workers', type=int, default=1, help="Navigateurs en parallèle (VideoScraperPool)")
+    parser.add_argument('--tiered', action='store_true', help="HTTP d'abord, navigateur si nécessaire")
+    parser.add_argument('--blocking', action='store_true', help="Profil de blocage par défaut")
+    parser.add_argument('--json', help="Écrit les résultats dans ce fichier")
+    parser.add_argument('--baseline', help="Résultats de référence (--json d'une version précédente)")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="Dégradation tolérée face à la référence")
+    parser.add_argument('--verbose', action='store_true', help="Affiche le log du scraper")
+    args = parser.parse_args()
+
+    # Le module n'installe plus de handler à l'import: journal sur la console
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    if not args.verbose:
+        logging.getLogger('video_scraper').setLevel(logging.WARNING)
+
+    site = SyntheticSite(args.pages, args.fanout, args.seed)
+    server = serve(site, args.latency)
+    print(f"Site synthétique: {args.pages} pages, {len(site.truth())} flux, sur {site.base_url}")
+    try:
+        result = run(args, site)
+    finally:
+        server.shutdown()
+
+    print("=" * 70)
+    print(f"Pages visitées:     {result['pages']} en {result['elapsed']:.1f}s "
+          f"({result['pages_per_second']:.2f} pages/s)")
+    print(f"Latence par page:   p50 {result['p50']:.2f}s   p95 {result['p95']:.2f}s")
+    print(f"Pic de mémoire:     {result['peak_rss_mb']:.0f} Mo (navigateurs compris), "
+          f"Python {result['peak_python_mb']:.0f} Mo")
+    print(f"Flux:               {result['streams_detected']} détecté(s) / {result['streams_expected']} attendu(s)")
+    print(f"Précision:          {100 * result['precision']:.1f}%   Rappel: {100 * result['recall']:.1f}%")
+    for url in result['false_positives']:
+        print(f"  faux positif: {url}")
+    for url in result['missed']:
+        print(f"  manqué:       {url}")
+    print("=" * 70)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            problems = regressions(result, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"RÉGRESSION: {problem}")
+        if problems:
+            sys.exit(1)
+        print("Aucune régression par rapport à la référence")
+
+
+if __name__ == "__main__":
+    main()
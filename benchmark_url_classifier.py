@@ -0,0 +1,115 @@
+"""
+Micro-benchmark du classifieur d'URLs vidéo
+
+Compare l'ancienne détection par sous-chaînes (deux any(...) sur
+VIDEO_EXTENSIONS et VIDEO_PATTERNS) avec VideoUrlClassifier sur des URLs
+synthétiques étiquetées: débit (URLs/s) et taux de faux positifs/négatifs.
+
+Usage:
+    python benchmark_url_classifier.py              # 2 000 000 URLs
+    python benchmark_url_classifier.py --count 5000000
+"""
+
+import argparse
+import random
+import time
+
+from video_scraper import VideoScraper, VideoUrlClassifier
+
+
+HOSTS = [
+    'www.example.com', 'media.cdn-example.net', 'video.example.org',
+    'static.example.com', 'stream-edge-03.example.tv', 'img.example.com',
+]
+
+# (gabarit, est un flux vidéo)
+TEMPLATES = [
+    # Flux réels
+    ('/hls/{id}/index.m3u8', True),
+    ('/hls/{id}/master.m3u8?token={tok}', True),
+    ('/vod/{id}/seg-{n}.ts', True),
+    ('/dash/{id}/manifest.mpd', True),
+    ('/dash/{id}/chunk-{n}.m4s', True),
+    ('/files/{id}.mp4', True),
+    ('/files/{id}.webm?expires={tok}', True),
+    ('/download?file={id}.mp4&sig={tok}', True),
+    ('/audio/{id}.m4a', True),
+    ('/live/{id}/playlist', True),
+    # Pages et ressources ordinaires
+    ('/posts/{id}', False),
+    ('/posts/{id}/comments?page={n}', False),
+    ('/media/{id}/thumbnail.jpg', False),
+    ('/assets/js/hls.min.js', False),
+    ('/assets/css/video-player.css', False),
+    ('/static/fonts/streamline.woff2', False),
+    ('/multimedia/gallery/{id}', False),
+    ('/video/{id}-trailer', False),
+    ('/videos/', False),
+    ('/api/stats?ts={tok}', False),
+    ('/artists/{id}/contacts', False),
+    ('/', False),
+]
+
+
+def legacy_is_video_url(url: str) -> bool:
+    """Détection historique par sous-chaînes (avant VideoUrlClassifier)"""
+    url_lower = url.lower()
+    if any(ext in url_lower for ext in VideoScraper.VIDEO_EXTENSIONS):
+        return True
+    if any(pattern in url_lower for pattern in VideoScraper.VIDEO_PATTERNS):
+        return True
+    return False
+
+
+def generate_urls(count: int, seed: int = 42):
+    """Génère count URLs synthétiques avec leur étiquette"""
+    rng = random.Random(seed)
+    urls, labels = [], []
+    for _ in range(count):
+        template, label = rng.choice(TEMPLATES)
+        path = template.format(
+            id=rng.randrange(10 ** 6),
+            n=rng.randrange(1000),
+            tok=format(rng.getrandbits(64), 'x'),
+        )
+        urls.append(f"https://{rng.choice(HOSTS)}{path}")
+        labels.append(label)
+    return urls, labels
+
+
+def run(name: str, classify, urls, labels):
+    """Mesure le débit et les erreurs d'une fonction de classification"""
+    start = time.perf_counter()
+    predictions = classify(urls)
+    elapsed = time.perf_counter() - start
+
+    false_positives = sum(1 for p, l in zip(predictions, labels) if p and not l)
+    false_negatives = sum(1 for p, l in zip(predictions, labels) if l and not p)
+    negatives = labels.count(False) or 1
+    positives = labels.count(True) or 1
+
+    print(f"{name:<28} {len(urls) / elapsed:>14,.0f} URLs/s   "
+          f"faux positifs: {100 * false_positives / negatives:6.2f}%   "
+          f"faux négatifs: {100 * false_negatives / positives:6.2f}%")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=2_000_000, help="Nombre d'URLs synthétiques")
+    parser.add_argument('--seed', type=int, default=42, help="Graine du générateur")
+    args = parser.parse_args()
+
+    print(f"Génération de {args.count:,} URLs...")
+    urls, labels = generate_urls(args.count, args.seed)
+    classifier = VideoUrlClassifier()
+
+    print("=" * 90)
+    legacy = run("Sous-chaînes (historique)", lambda batch: [legacy_is_video_url(u) for u in batch], urls, labels)
+    compiled = run("VideoUrlClassifier", classifier.classify_many, urls, labels)
+    print("=" * 90)
+    print(f"Gain de débit: x{legacy / compiled:.2f}")
+
+
+if __name__ == "__main__":
+    main()
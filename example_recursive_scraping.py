@@ -157,8 +157,12 @@ def example_with_error_handling():
 
 if __name__ == "__main__":
     """Menu d'exécution des exemples"""
+    import logging
     import sys
     
+    # Le module n'installe plus de handler à l'import: journal sur la console
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     print("\n" + "="*60)
     print("EXEMPLES DE SCRAPING RÉCURSIF")
     print("="*60 + "\n")
@@ -3,37 +3,85 @@ Video Stream Scraper - Détecte et capture automatiquement les flux vidéo
 Supporte: Chrome, Firefox, Edge
 """
 
+import re
 import json
+import os
+import sys
+import math
+import heapq
+import random
+import shutil
+import signal
+import hashlib
 import time
 import logging
-from typing import List, Dict, Set
-from urllib.parse import urljoin, urlparse
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from selenium.common.exceptions import TimeoutException
-import requests
-from fake_useragent import UserAgent
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('video_scraper.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+import sqlite3
+import tempfile
+import argparse
+import importlib
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from xml.etree import ElementTree
+from typing import TYPE_CHECKING, List, Dict, Set, Optional, Tuple
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, unquote_plus
+# Exceptions seules: le reste de Selenium est importé au démarrage du navigateur choisi
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+class _LazyModule:
+    """
+    Module importé au premier accès à l'un de ses attributs
+    
+    Garde l'import de video_scraper rapide: requests, asyncio ou le client
+    WebSocket ne sont chargés que par le code qui s'en sert.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = _LazyModule('requests')
+asyncio = _LazyModule('asyncio')
+# Client WebSocket (dépendance de selenium) pour la capture réseau par événements
+websocket = _LazyModule('websocket')
+
+# Décodeur JSON rapide optionnel pour le log de performance
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Aucun handler à l'import: le journal est configuré par les points d'entrée
+# (voir _configure_logging) ou par l'application qui importe le module
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging(level: int = logging.INFO):
+    """Journal dans video_scraper.log et sur la console (utilisation en script)"""
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('video_scraper.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+
 class VideoScraper:
     """Classe principale pour scraper les flux vidéo"""
     
@@ -46,25 +94,353 @@ class VideoScraper:
         'video', 'stream', 'media', 'hls', 'dash'
     ]
     
-    def __init__(self, browser: str = 'chrome', headless: bool = False):
+    # Extraction DOM en un seul appel: URLs des <video>, <source>, <iframe> et <a>
+    DOM_EXTRACTION_SCRIPT = """
+        function attr(el, name) {
+            var value = el.getAttribute(name);
+            if (!value) { return ''; }
+            try { return new URL(value, document.baseURI).href; } catch (e) { return ''; }
+        }
+        function map(selector, fn) {
+            return Array.prototype.map.call(document.querySelectorAll(selector), fn);
+        }
+        return {
+            location: location.href,
+            videos: map('video', function (v) {
+                return {src: v.src, currentSrc: v.currentSrc, dataSrc: attr(v, 'data-src'), poster: v.poster};
+            }),
+            sources: map('source', function (s) {
+                return {src: s.src, dataSrc: attr(s, 'data-src'), type: s.type};
+            }),
+            iframes: map('iframe', function (f) {
+                return {src: f.src, dataSrc: attr(f, 'data-src')};
+            }),
+            links: map('a[href]', function (a) {
+                return {href: a.href, raw: a.getAttribute('href'),
+                        text: (a.textContent || '').trim().slice(0, 200)};
+            })
+        };
+    """
+    
+    # Ordonnancement du crawl: les liens moins profonds passent d'abord, puis
+    # ceux qui ressemblent à une page de lecture (URL ou texte du lien)
+    DEPTH_WEIGHT = 10
+    WATCH_URL_RE = re.compile(
+        r'/(?:watch|video|videos|embed|player|play|episode|episodes|live|stream|film|movie|vod|replay)'
+        r'(?:[/?#._-]|$)|[?&]v=',
+        re.IGNORECASE
+    )
+    WATCH_TEXT_RE = re.compile(
+        r'\b(?:regarder|watch|play|lecture|lire|vid[ée]o|[ée]pisode|live|direct|replay|trailer|'
+        r'bande-annonce|streaming)\b',
+        re.IGNORECASE
+    )
+    
+    # Pré-filtre sur le message brut du log de performance: seuls ces
+    # événements sont décodés, les autres sont rejetés sans json.loads
+    NETWORK_EVENT_RE = re.compile(
+        r'"method":\s*"(Network\.(?:requestWillBeSent|responseReceived|loadingFinished|loadingFailed))"'
+    )
+    REQUEST_ID_RE = re.compile(r'"requestId":\s*"([^"]+)"')
+    # Onglet (cible DevTools) d'origine d'une entrée du log
+    WEBVIEW_RE = re.compile(r'"webview":\s*"([^"]+)"')
+    
+    # Taille des lots d'événements réseau classés ensemble
+    LOG_BATCH_SIZE = 500
+    
+    # Attente adaptative: intervalle de scrutation et durée de calme réseau requise (secondes)
+    READY_POLL_INTERVAL = 0.25
+    NETWORK_IDLE_TIME = 0.5
+    
+    # Nombre de requêtes en cours tolérées pour considérer la page calme
+    # (connexions longues, websockets, analytics...)
+    MAX_INFLIGHT_REQUESTS = 2
+    
+    # Scroll progressif: budget total (secondes), nombre maximal de pas, et
+    # durée sans mutation du DOM ni ressource chargée qui clôt chaque pas
+    SCROLL_BUDGET = 15
+    SCROLL_MAX_STEPS = 30
+    SCROLL_QUIET_TIME = 0.3
+    
+    # Scroll par pas d'un écran, chaque pas attendant le calme (mutations du DOM,
+    # ressources chargées) au lieu d'une pause fixe; s'arrête quand la hauteur de
+    # la page ne grandit plus en bas de page, ou au budget. Renvoie son bilan à
+    # la fonction de rappel (execute_async_script) et dans window.__scrappeurScroll
+    # (lancement sans attente du mode multi-onglets)
+    SCROLL_SCRIPT = """
+        var options = arguments[0];
+        var callback = arguments[arguments.length - 1];
+        if (typeof callback !== 'function') {
+            callback = null;
+        }
+        var state = window.__scrappeurScroll = {done: false, result: null};
+        var started = Date.now();
+        var lastActivity = started, mutations = 0, resources = 0;
+        
+        var mutationObserver = new MutationObserver(function (records) {
+            mutations += records.length;
+            lastActivity = Date.now();
+        });
+        mutationObserver.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true,
+            attributeFilter: ['src', 'data-src', 'srcset', 'style', 'class']
+        });
+        var resourceObserver = null;
+        try {
+            resourceObserver = new PerformanceObserver(function (list) {
+                resources += list.getEntries().length;
+                lastActivity = Date.now();
+            });
+            resourceObserver.observe({entryTypes: ['resource']});
+        } catch (e) {}
+        
+        function height() {
+            return Math.max(document.body ? document.body.scrollHeight : 0,
+                            document.documentElement.scrollHeight);
+        }
+        function elapsed() {
+            return Date.now() - started;
+        }
+        
+        // Attend quietTime ms sans activité, au plus stepTimeout ms
+        function settle(next) {
+            var stepStart = Date.now();
+            (function poll() {
+                var now = Date.now();
+                if (now - lastActivity >= options.quietTime || now - stepStart >= options.stepTimeout ||
+                        elapsed() >= options.budget) {
+                    next();
+                } else {
+                    setTimeout(poll, 50);
+                }
+            })();
+        }
+        
+        function finish(reason, steps, maxHeight) {
+            mutationObserver.disconnect();
+            if (resourceObserver) {
+                resourceObserver.disconnect();
+            }
+            state.result = {
+                reason: reason, steps: steps, height: maxHeight, elapsed: elapsed() / 1000,
+                mutations: mutations, resources: resources
+            };
+            state.done = true;
+            if (callback) {
+                callback(state.result);
+            }
+        }
+        
+        var steps = 0, maxHeight = height();
+        (function step() {
+            if (steps >= options.maxSteps || elapsed() >= options.budget) {
+                window.scrollTo(0, 0);
+                return finish(steps >= options.maxSteps ? 'steps' : 'budget', steps, maxHeight);
+            }
+            var before = window.pageYOffset;
+            window.scrollBy(0, Math.max(window.innerHeight * 0.9, 200));
+            steps++;
+            lastActivity = Math.max(lastActivity, Date.now() - options.quietTime / 2);
+            settle(function () {
+                var grown = height() > maxHeight;
+                maxHeight = Math.max(maxHeight, height());
+                var atBottom = window.pageYOffset + window.innerHeight >= height() - 2;
+                if (!grown && (atBottom || window.pageYOffset === before)) {
+                    // Retour en haut (certains lecteurs se chargent à la réapparition)
+                    window.scrollTo(0, 0);
+                    settle(function () {
+                        finish(atBottom ? 'bottom' : 'stuck', steps, maxHeight);
+                    });
+                } else {
+                    step();
+                }
+            });
+        })();
+    """
+    
+    # État du scroll lancé sans attente (mode multi-onglets)
+    SCROLL_STATE_SCRIPT = """
+        var state = window.__scrappeurScroll;
+        return state ? (state.done ? state.result : false) : null;
+    """
+    
+    # Marge de l'échéance d'une page au-delà du chargement, de l'attente et du
+    # scroll (analyse du log réseau, du DOM, des iframes et des liens), en secondes
+    PAGE_DEADLINE_MARGIN = 30
+    
+    # Iframes analysées par page: profondeur d'imbrication et nombre maximal
+    FRAME_MAX_DEPTH = 3
+    FRAME_MAX_COUNT = 20
+    
+    # Script d'état de la page: readyState, présence d'une vidéo, nouvelles ressources chargées
+    READY_STATE_SCRIPT = """
+        var offset = arguments[0];
+        if (performance.setResourceTimingBufferSize) {
+            performance.setResourceTimingBufferSize(10000);
+        }
+        var resources = performance.getEntriesByType('resource');
+        var media = Array.prototype.some.call(document.querySelectorAll('video'), function (v) {
+            var src = v.currentSrc || v.src || '';
+            return src && src.indexOf('blob:') !== 0;
+        });
+        return {
+            readyState: document.readyState,
+            href: location.href,
+            timeOrigin: performance.timeOrigin,
+            media: media,
+            resourceCount: resources.length,
+            newResources: resources.slice(offset).map(function (r) { return r.name; })
+        };
+    """
+    
+    # Navigation non bloquante d'un onglet; renvoie l'identité du document
+    # quitté pour reconnaître le moment où la nouvelle page le remplace
+    TAB_NAVIGATE_SCRIPT = """
+        var previous = [location.href, performance.timeOrigin];
+        window.location.assign(arguments[0]);
+        return previous;
+    """
+    
+    def __init__(self, browser: str = 'chrome', headless: bool = False,
+                 classifier: 'VideoUrlClassifier' = None, tiered: bool = False,
+                 js_domains: List[str] = None, canonicalizer: 'UrlCanonicalizer' = None,
+                 fetch_manifests: bool = True, validate: bool = False, results_path: str = None,
+                 offline: bool = False, tabs: int = 1, blocking: 'BlockingProfile' = None,
+                 network_capture: str = 'auto', report_path: str = None,
+                 metrics_path: str = None, governor: 'ResourceGovernor' = None,
+                 page_load_strategy: str = 'normal', page_load_timeout: float = 30,
+                 script_timeout: float = 30, page_deadline: float = None, retries: int = 1,
+                 retry_backoff: float = 2):
         """
         Initialise le scraper
         
         Args:
             browser: Type de navigateur ('chrome', 'firefox', 'edge')
             headless: Mode sans interface graphique
+            classifier: Classifieur d'URLs vidéo (défaut: construit depuis
+                VIDEO_EXTENSIONS et VIDEO_PATTERNS)
+            tiered: Essaie d'abord une simple requête HTTP et n'utilise le
+                navigateur que si la page semble en avoir besoin
+            js_domains: Domaines toujours chargés dans le navigateur (mode tiered)
+            canonicalizer: Canonicaliseur d'URLs des liens (défaut: UrlCanonicalizer())
+            fetch_manifests: Télécharge les manifestes HLS/DASH détectés pour décrire
+                leurs variantes (sinon les segments sont regroupés par répertoire)
+            validate: Vérifie en fin d'analyse que chaque flux sert bien un média
+                (voir validate_streams)
+            results_path: Journal JSONL complété à chaque nouvelle détection (voir ResultSink)
+            offline: Utilise uniquement un driver déjà en cache (ou dans le PATH),
+                sans jamais appeler webdriver_manager (voir DriverCache)
+            tabs: Nombre d'onglets chargés en parallèle par scrape_recursive dans
+                un seul navigateur (1 = une page à la fois)
+            blocking: Ressources non téléchargées (images, polices, publicités,
+                segments vidéo...); True = BlockingProfile() par défaut
+            network_capture: 'log' (lecture du log de performance, Chrome/Edge),
+                'events' (événements poussés par DevTools/BiDi, tous navigateurs),
+                'auto' ('events' pour Firefox, 'log' sinon)
+            report_path: Rapport JSON des mesures écrit en fin d'analyse (voir ScrapeStats)
+            metrics_path: Fichier Prometheus (textfile collector) écrit en fin d'analyse
+            governor: Limites de ressources des longs crawls (redémarrage du
+                navigateur, ensembles d'URLs sur disque); True = ResourceGovernor() par défaut
+            page_load_strategy: 'normal' (attend l'événement load), 'eager'
+                (DOMContentLoaded) ou 'none' (rend la main aussitôt)
+            page_load_timeout: Durée maximale de driver.get (secondes); au-delà,
+                le chargement est arrêté et la page analysée en l'état
+            script_timeout: Durée maximale des scripts exécutés dans la page (secondes)
+            page_deadline: Échéance d'une page (secondes) au-delà de laquelle le
+                chien de garde tue le navigateur bloqué (défaut: chargement +
+                wait_time + scroll + PAGE_DEADLINE_MARGIN)
+            retries: Nouveaux essais d'une page après un délai dépassé ou un
+                navigateur bloqué ou tombé
+            retry_backoff: Délai avant le premier nouvel essai, doublé ensuite (secondes)
         """
+        if tabs < 1:
+            raise ValueError(f"Nombre d'onglets invalide: {tabs}")
+        if page_load_strategy not in ('normal', 'eager', 'none'):
+            raise ValueError(f"Stratégie de chargement invalide: {page_load_strategy}")
+        if retries < 0:
+            raise ValueError(f"Nombre d'essais invalide: {retries}")
+        if network_capture not in ('auto', 'log', 'events'):
+            raise ValueError(f"Mode de capture réseau invalide: {network_capture}")
         self.browser = browser.lower()
         self.headless = headless
         self.driver = None
-        self.video_urls: Set[str] = set()
-        self.ua = UserAgent()
+        self.classifier = classifier or VideoUrlClassifier(self.VIDEO_EXTENSIONS, self.VIDEO_PATTERNS)
+        self.governor: Optional['ResourceGovernor'] = ResourceGovernor() if governor is True else governor or None
+        # Pages chargées depuis le démarrage du navigateur, et lors du dernier relevé mémoire
+        self._browser_pages = 0
+        self._memory_checked = 0
+        self.video_urls: Set[str] = self._new_url_set()
+        # Flux regroupés par manifeste (voir collapse_streams)
+        self.streams: List['StreamRecord'] = []
+        self._streams_size = 0
+        self.fetch_manifests = fetch_manifests
+        self.validate = validate
+        # Résultats des sondes HTTP par URL (voir validate_streams)
+        self.validation: Dict[str, Dict] = {}
+        self.sink: Optional['ResultSink'] = ResultSink(results_path) if results_path else None
+        self.offline = offline
+        self.tabs = tabs
+        self._capture_required = network_capture == 'events'
+        if network_capture == 'auto':
+            network_capture = 'events' if browser.lower() == 'firefox' else 'log'
+        self.network_capture = network_capture
+        self._capture: Optional['NetworkCapture'] = None
+        # Levé pour abréger la page en cours (délai ou annulation côté asyncio)
+        self._interrupt = threading.Event()
+        # Échéances des pages: le chien de garde tue un navigateur bloqué
+        self.page_load_strategy = page_load_strategy
+        self.page_load_timeout = page_load_timeout
+        self.script_timeout = script_timeout
+        self.page_deadline = page_deadline
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self._watchdog = _Watchdog(self._kill_browser)
+        # Durée des phases de chaque page et compteurs
+        self.stats = ScrapeStats()
+        self.report_path = report_path
+        self.metrics_path = metrics_path
+        self.blocking: Optional['BlockingProfile'] = BlockingProfile() if blocking is True else blocking or None
+        # Mode multi-onglets: cible DevTools -> onglet, pour répartir le log réseau
+        self._tab_targets: Dict[str, '_Tab'] = {}
+        # Durée de chaque phase du dernier démarrage (secondes)
+        self.startup_timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        self.ua = UserAgentPool.shared()
+        self.startup_timings['user_agents'] = time.perf_counter() - started
         self.visited_urls: Set[str] = set()
-        self.found_links: Set[str] = set()
+        self.found_links: Set[str] = self._new_url_set()
+        self.canonicalizer = canonicalizer or UrlCanonicalizer()
+        # Liens réécrits par le canonicaliseur, et chargements ainsi évités
+        self.canonical_stats: Dict[str, int] = {'rewritten': 0, 'duplicates_avoided': 0}
+        self._rewritten_links: Set[str] = set()
+        self.tiered = tiered
+        self.js_domains = js_domains or []
+        self._http_fetcher: Optional['HttpFetcher'] = None
+        # Nombre de pages traitées par HTTP seul / par le navigateur
+        self.tier_stats: Dict[str, int] = {'http': 0, 'browser': 0}
+        # Pages du dernier crawl par statut dans la frontière ('done', 'failed'...)
+        self.crawl_counts: Dict[str, int] = {}
+        # Événements réseau lus pendant l'attente, pas encore analysés
+        self._pending_network_events: List[Dict] = []
+        # Page en cours, ses flux détectés (URLs et métadonnées) et le texte de ses liens
+        self._page_url: Optional[str] = None
+        self._page_depth = 0
+        self._page_videos: List[str] = []
+        self._page_records: List[Dict] = []
+        self._link_texts: Dict[str, str] = {}
+        # Résultat de DOM_EXTRACTION_SCRIPT pour la page en cours, et liens de ses iframes
+        self._dom_snapshot = None
+        self._frame_links: List[Dict] = []
+        # Compteurs du log de performance pour la page en cours
+        self.network_log_stats: Dict[str, int] = {'seen': 0, 'parsed': 0, 'matched': 0, 'blocked': 0}
         
-    def _setup_chrome(self) -> webdriver.Chrome:
+    def _setup_chrome(self) -> 'webdriver.Chrome':
         """Configure Chrome avec interception réseau"""
-        options = webdriver.ChromeOptions()
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.webdriver import WebDriver
+        
+        options = Options()
         
         if self.headless:
             options.add_argument('--headless=new')
@@ -75,26 +451,51 @@ class VideoScraper:
         options.add_argument(f'user-agent={self.ua.random}')
         
         # Active la capture du trafic réseau
-        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        if self.network_capture == 'log':
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        if self.blocking and self.blocking.chrome_prefs():
+            options.add_experimental_option('prefs', self.blocking.chrome_prefs())
         
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        # Multi-onglets: les navigations ne bloquent pas le driver
+        options.page_load_strategy = 'none' if self.tabs > 1 else self.page_load_strategy
+        
+        service = Service(self._driver_path())
+        return self._launch(WebDriver, service, options)
     
-    def _setup_firefox(self) -> webdriver.Firefox:
+    def _setup_firefox(self) -> 'webdriver.Firefox':
         """Configure Firefox avec interception réseau"""
-        options = webdriver.FirefoxOptions()
+        from selenium.webdriver.firefox.options import Options
+        from selenium.webdriver.firefox.service import Service
+        from selenium.webdriver.firefox.webdriver import WebDriver
+        
+        options = Options()
         
         if self.headless:
             options.add_argument('--headless')
         
         options.set_preference('general.useragent.override', self.ua.random)
+        if self.blocking:
+            for name, value in self.blocking.firefox_prefs().items():
+                options.set_preference(name, value)
         
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        # Capture réseau par WebDriver BiDi
+        if self.network_capture == 'events':
+            options.enable_bidi = True
+        
+        # Multi-onglets: les navigations ne bloquent pas le driver
+        options.page_load_strategy = 'none' if self.tabs > 1 else self.page_load_strategy
+        
+        service = Service(self._driver_path())
+        return self._launch(WebDriver, service, options)
     
-    def _setup_edge(self) -> webdriver.Edge:
+    def _setup_edge(self) -> 'webdriver.Edge':
         """Configure Edge avec interception réseau"""
-        options = webdriver.EdgeOptions()
+        from selenium.webdriver.edge.options import Options
+        from selenium.webdriver.edge.service import Service
+        from selenium.webdriver.edge.webdriver import WebDriver
+        
+        options = Options()
         
         if self.headless:
             options.add_argument('--headless=new')
@@ -104,14 +505,76 @@ class VideoScraper:
         options.add_argument(f'user-agent={self.ua.random}')
         
         # Active la capture du trafic réseau
-        options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+        if self.network_capture == 'log':
+            options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+        
+        if self.blocking and self.blocking.chrome_prefs():
+            options.add_experimental_option('prefs', self.blocking.chrome_prefs())
+        
+        # Multi-onglets: les navigations ne bloquent pas le driver
+        options.page_load_strategy = 'none' if self.tabs > 1 else self.page_load_strategy
+        
+        service = Service(self._driver_path())
+        return self._launch(WebDriver, service, options)
+    
+    def _driver_path(self) -> str:
+        """Chemin du driver (résolu une fois puis lu dans DriverCache)"""
+        started = time.perf_counter()
+        try:
+            return DriverCache.resolve(self.browser, offline=self.offline)
+        finally:
+            self.startup_timings['driver'] = time.perf_counter() - started
+    
+    def _apply_blocking(self):
+        """Installe les motifs d'URL bloqués dans l'onglet courant (Chrome/Edge)"""
+        if not self.blocking or self.browser not in ['chrome', 'edge']:
+            return
+        
+        patterns = self.blocking.chrome_patterns()
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            logger.warning(f"Blocage des ressources indisponible: {e}")
+            return
+        logger.info(f"ℹ {len(patterns)} motif(s) d'URL bloqué(s)")
+    
+    def _start_capture(self):
+        """Ouvre la capture réseau par événements (mode 'events')"""
+        if self.network_capture != 'events':
+            return
         
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        started = time.perf_counter()
+        try:
+            self._capture = NetworkCapture.connect(self.driver, self.browser, self.classifier)
+        except Exception as e:
+            if self._capture_required:
+                raise RuntimeError(f"Capture réseau par événements impossible: {e}") from e
+            logger.warning(f"Capture réseau indisponible ({e}): détection par le DOM uniquement")
+            return
+        finally:
+            self.startup_timings['capture'] = time.perf_counter() - started
+        logger.info(f"✓ Capture réseau par événements ({type(self._capture).__name__})")
+    
+    def _pause(self, seconds: float):
+        """Attend, en se réveillant dès qu'un flux arrive (capture par événements)"""
+        if self._capture is not None:
+            self._capture.wait(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def _launch(self, driver_class, service, options):
+        """Lance le navigateur en mesurant la durée du lancement"""
+        started = time.perf_counter()
+        try:
+            return driver_class(service=service, options=options)
+        finally:
+            self.startup_timings['launch'] = time.perf_counter() - started
     
     def start(self):
         """Démarre le navigateur"""
         logger.info(f"Démarrage du navigateur {self.browser}...")
+        started = time.perf_counter()
         
         try:
             if self.browser == 'chrome':
@@ -123,11 +586,115 @@ class VideoScraper:
             else:
                 raise ValueError(f"Navigateur non supporté: {self.browser}")
             
-            logger.info(f"Navigateur {self.browser} démarré avec succès")
+            self.driver.set_page_load_timeout(self.page_load_timeout)
+            self.driver.set_script_timeout(self.script_timeout)
+            self._apply_blocking()
+            self._start_capture()
+            self._browser_pages = self._memory_checked = 0
+            
+            timings = self.startup_timings
+            timings['total'] = time.perf_counter() - started
+            logger.info(f"Navigateur {self.browser} démarré avec succès "
+                        f"({timings['total']:.2f}s: driver {timings.get('driver', 0):.2f}s, "
+                        f"lancement {timings.get('launch', 0):.2f}s, "
+                        f"User-Agents {timings.get('user_agents', 0):.2f}s)")
         except Exception as e:
             logger.error(f"Erreur lors du démarrage du navigateur: {e}")
             raise
     
+    def _stop_driver(self):
+        """Ferme la capture réseau et le navigateur"""
+        if self._capture is not None:
+            self._capture.close()
+            self._capture = None
+        if self.driver:
+            logger.info("Fermeture du navigateur...")
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning(f"Fermeture du navigateur incomplète: {e}")
+            self.driver = None
+    
+    def _new_url_set(self):
+        """Ensemble d'URLs du crawl: set, ou SpillSet borné avec un ResourceGovernor"""
+        return self.governor.new_set() if self.governor is not None else set()
+    
+    def _recycle_reason(self) -> Optional[str]:
+        """
+        Vérifie les limites du ResourceGovernor avant de charger une nouvelle page
+        
+        La mémoire (navigateur et Python) n'est relevée que toutes les
+        governor.check_every pages; elle est publiée dans self.stats.
+        
+        Returns:
+            Raison du redémarrage du navigateur, ou None
+        """
+        governor = self.governor
+        if governor is None or not self.driver:
+            return None
+        if self._browser_pages >= governor.max_pages:
+            return f"{self._browser_pages} pages chargées"
+        if self._browser_pages - self._memory_checked < governor.check_every:
+            return None
+        
+        self._memory_checked = self._browser_pages
+        python_rss = _python_rss()
+        if python_rss is not None:
+            self.stats.gauge('python_rss_bytes', python_rss)
+        browser_rss = governor.browser_rss(self.driver)
+        if browser_rss is None:
+            return None
+        self.stats.gauge('browser_rss_bytes', browser_rss)
+        if browser_rss > governor.max_browser_mb * 2 ** 20:
+            return f"mémoire du navigateur {browser_rss / 2 ** 20:.0f} Mo"
+        return None
+    
+    def _recycle_driver(self, reason: str):
+        """
+        Redémarre le navigateur; l'état du crawl (frontière, pages visitées, flux) est conservé
+        
+        Args:
+            reason: Cause du redémarrage (journalisée)
+        """
+        logger.info(f"ℹ Redémarrage du navigateur: {reason}")
+        self._stop_driver()
+        self.start()
+        self.stats.count('recycles')
+    
+    def _discard_network_log(self):
+        """Vide le log de performance des entrées de la page précédente, sans les décoder"""
+        if self._capture is not None or self.browser not in ['chrome', 'edge']:
+            return
+        try:
+            self.stats.count('log_discarded', len(self.driver.get_log('performance')))
+        except Exception as e:
+            logger.debug(f"Log de performance non vidé: {e}")
+    
+    def _kill_browser(self):
+        """Tue le navigateur bloqué (appelé par le chien de garde, depuis son thread)"""
+        logger.warning("Page bloquée au-delà de son échéance: arrêt forcé du navigateur")
+        _kill_driver(self.driver)
+    
+    def _page_deadline(self, wait_time: float, scroll_pause: float) -> float:
+        """Échéance d'une page pour le chien de garde (secondes)"""
+        if self.page_deadline:
+            return self.page_deadline
+        return self.page_load_timeout + wait_time + self._scroll_timeout(scroll_pause) + self.PAGE_DEADLINE_MARGIN
+    
+    def _retryable(self, error: Exception) -> bool:
+        """
+        Échec dû au navigateur (délai dépassé, navigateur bloqué ou tombé)
+        
+        Les autres erreurs WebDriver (lien mort: net::ERR_NAME_NOT_RESOLVED,
+        argument invalide...) sont des échecs de la page: ni nouvel essai ni
+        redémarrage du navigateur.
+        """
+        return self._watchdog.fired or isinstance(error, TimeoutException) or _driver_lost(error)
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Délai avant le nouvel essai numéro attempt (backoff exponentiel avec gigue)"""
+        return self.retry_backoff * 2 ** (attempt - 1) * random.uniform(1, 1.5)
+    
     def _is_video_url(self, url: str) -> bool:
         """
         Détermine si une URL correspond à un flux vidéo
@@ -138,93 +705,285 @@ class VideoScraper:
         Returns:
             True si l'URL est un flux vidéo
         """
-        url_lower = url.lower()
-        
-        # Vérifie les extensions
-        if any(ext in url_lower for ext in self.VIDEO_EXTENSIONS):
-            return True
+        return self.classifier.is_video_url(url)
+    
+    def _record_video(self, url: str, label: str, source: str, mime_type: str = None,
+                      frame: str = None) -> bool:
+        """
+        Enregistre un flux vidéo détecté sur la page en cours
         
-        # Vérifie les patterns
-        if any(pattern in url_lower for pattern in self.VIDEO_PATTERNS):
-            return True
+        Args:
+            url: URL du flux
+            label: Libellé de la détection pour le log
+            source: Origine de la détection ('network-request', 'network-response',
+                'video-element', 'source-element', 'http')
+            mime_type: Type MIME annoncé par le serveur (si connu)
+            frame: URL de l'iframe d'où vient le flux (None = document principal)
+            
+        Returns:
+            True si le flux n'avait pas encore été détecté
+        """
+        if url in self.video_urls:
+            return False
         
-        return False
+        self.video_urls.add(url)
+        self._page_videos.append(url)
+        self.stats.count('streams')
+        record = {
+            'url': url,
+            'page': self._page_url,
+            'depth': self._page_depth,
+            'source': source,
+            'mime': mime_type or None,
+            'frame': frame,
+            'time': round(time.time(), 3),
+        }
+        self._page_records.append(record)
+        if self.sink is not None:
+            self.sink.write(record)
+        # Les segments sont regroupés par manifeste en fin d'analyse
+        log = logger.debug if ManifestExpander.is_segment(url) else logger.info
+        log(f"✓ {label}{' (iframe)' if frame else ''}: {url[:100]}...")
+        return True
     
     def _extract_network_logs(self):
-        """Extrait les URLs vidéo des logs réseau (Chrome/Edge uniquement)"""
-        if self.browser not in ['chrome', 'edge']:
+        """Extrait les URLs vidéo des logs réseau (log de performance ou capture par événements)"""
+        if self._capture is None and self.browser not in ['chrome', 'edge']:
             return
         
         try:
-            logs = self.driver.get_log('performance')
+            self._poll_network_log()
+            events, self._pending_network_events = self._pending_network_events, []
             
-            for entry in logs:
-                try:
-                    log = json.loads(entry['message'])
-                    message = log.get('message', {})
-                    method = message.get('method', '')
-                    
-                    # Capture les requêtes réseau
-                    if method == 'Network.requestWillBeSent':
-                        params = message.get('params', {})
-                        request = params.get('request', {})
-                        url = request.get('url', '')
-                        
-                        if url and self._is_video_url(url):
-                            self.video_urls.add(url)
-                            logger.info(f"✓ Flux vidéo détecté: {url[:100]}...")
-                    
-                    # Capture les réponses réseau
-                    elif method == 'Network.responseReceived':
-                        params = message.get('params', {})
-                        response = params.get('response', {})
-                        url = response.get('url', '')
-                        mime_type = response.get('mimeType', '')
-                        
-                        if url and (self._is_video_url(url) or 'video' in mime_type or 'mpegurl' in mime_type):
-                            self.video_urls.add(url)
-                            logger.info(f"✓ Flux vidéo détecté (réponse): {url[:100]}...")
-                
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    continue
+            for start in range(0, len(events), self.LOG_BATCH_SIZE):
+                self._process_network_events(events[start:start + self.LOG_BATCH_SIZE])
+            
+            stats = self.network_log_stats
+            logger.info(f"Log réseau: {stats['seen']} entrée(s) lue(s), {stats['parsed']} décodée(s), "
+                        f"{stats['matched']} correspondance(s), {stats['blocked']} requête(s) bloquée(s)")
         
         except Exception as e:
+            self.stats.count('errors')
             logger.error(f"Erreur lors de l'extraction des logs réseau: {e}")
     
+    def _decode_network_events(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Décode les événements réseau utiles d'entrées brutes du log de performance
+        
+        Les entrées sont d'abord filtrées sur la chaîne brute: les événements
+        sans intérêt (Network.dataReceived, Page.*, ...) ne sont jamais décodés,
+        et la fin des requêtes n'est lue que pour son requestId.
+        
+        Args:
+            entries: Entrées renvoyées par driver.get_log('performance')
+            
+        Returns:
+            Liste de messages {'method': ..., 'params': ...}, avec 'webview'
+            (identifiant de l'onglet d'origine) quand le log le fournit
+        """
+        events = []
+        stats = self.network_log_stats
+        stats['seen'] += len(entries)
+        
+        for entry in entries:
+            raw = entry.get('message', '')
+            match = self.NETWORK_EVENT_RE.search(raw)
+            if not match:
+                continue
+            
+            method = match.group(1)
+            if method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                if '"blockedReason"' in raw:
+                    stats['blocked'] += 1
+                request_id = self.REQUEST_ID_RE.search(raw)
+                if request_id:
+                    event = {'method': method, 'params': {'requestId': request_id.group(1)}}
+                    webview = self.WEBVIEW_RE.search(raw)
+                    if webview:
+                        event['webview'] = webview.group(1)
+                    events.append(event)
+                continue
+            
+            try:
+                decoded = _json_loads(raw)
+                message = decoded.get('message', {})
+            except (ValueError, AttributeError):
+                continue
+            
+            stats['parsed'] += 1
+            if 'webview' in decoded:
+                message['webview'] = decoded['webview']
+            events.append(message)
+        
+        return events
+    
+    def _process_network_events(self, events: List[Dict]):
+        """
+        Ajoute à self.video_urls les flux d'un lot d'événements réseau
+        
+        Les URLs du lot sont classées en un seul appel au classifieur.
+        
+        Args:
+            events: Messages décodés par _decode_network_events
+        """
+        # URL -> (réponse reçue, type MIME, iframe); la réponse complète la requête du même lot
+        candidates: Dict[str, Tuple[bool, str, Optional[str]]] = {}
+        for message in events:
+            method = message.get('method', '')
+            params = message.get('params', {})
+            
+            # Capture les requêtes réseau
+            if method == 'Network.requestWillBeSent':
+                url = params.get('request', {}).get('url', '')
+                if url:
+                    candidates.setdefault(url, (False, '', self._request_frame(message)))
+            
+            # Capture les réponses réseau
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                if url:
+                    frame = candidates[url][2] if url in candidates else None
+                    candidates[url] = (True, response.get('mimeType', ''), frame)
+        
+        flags = self.classifier.classify_many(candidates)
+        self.stats.count('urls_classified', len(candidates))
+        
+        for (url, (is_response, mime_type, frame)), is_video in zip(candidates.items(), flags):
+            if not (is_video or 'video' in mime_type or 'mpegurl' in mime_type):
+                continue
+            
+            self.network_log_stats['matched'] += 1
+            if is_response:
+                self._record_video(url, "Flux vidéo détecté (réponse)", 'network-response', mime_type, frame)
+            else:
+                self._record_video(url, "Flux vidéo détecté", 'network-request', frame=frame)
+    
+    @staticmethod
+    def _request_frame(message: Dict) -> Optional[str]:
+        """
+        Iframe à l'origine d'une requête réseau
+        
+        Le cadre principal d'un onglet porte l'identifiant de sa cible DevTools
+        ('webview'): une requête d'un autre frameId vient d'une iframe, dont
+        documentURL donne l'adresse.
+        
+        Returns:
+            URL du document de l'iframe, ou None (document principal ou inconnu)
+        """
+        params = message.get('params', {})
+        frame_id, webview = params.get('frameId'), message.get('webview')
+        if frame_id and webview and frame_id != webview:
+            return params.get('documentURL') or None
+        return None
+    
+    def _get_dom_snapshot(self) -> Dict[str, List[Dict]]:
+        """
+        Récupère en un seul aller-retour WebDriver les URLs des éléments utiles
+        
+        Le résultat est mis en cache jusqu'au prochain chargement de page, pour
+        que _extract_video_elements et _extract_links partagent le même appel.
+        
+        Returns:
+            Dictionnaire {'videos', 'sources', 'iframes', 'links'} de listes d'attributs
+        """
+        if self._dom_snapshot is None:
+            snapshot = self.driver.execute_script(self.DOM_EXTRACTION_SCRIPT) or {}
+            self._dom_snapshot = {
+                key: snapshot.get(key) or [] for key in ('videos', 'sources', 'iframes', 'links')
+            }
+        return self._dom_snapshot
+    
     def _extract_video_elements(self):
-        """Extrait les URLs des éléments vidéo HTML"""
-        try:
-            # Trouve les balises <video>
-            video_elements = self.driver.find_elements(By.TAG_NAME, 'video')
-            for video in video_elements:
-                src = video.get_attribute('src')
-                if src and self._is_video_url(src):
-                    self.video_urls.add(src)
-                    logger.info(f"✓ Élément vidéo trouvé: {src[:100]}...")
-            
-            # Trouve les balises <source>
-            source_elements = self.driver.find_elements(By.TAG_NAME, 'source')
-            for source in source_elements:
-                src = source.get_attribute('src')
-                if src and self._is_video_url(src):
-                    self.video_urls.add(src)
-                    logger.info(f"✓ Source vidéo trouvée: {src[:100]}...")
-            
-            # Trouve les iframes (peuvent contenir des vidéos)
-            iframe_elements = self.driver.find_elements(By.TAG_NAME, 'iframe')
-            for iframe in iframe_elements:
-                src = iframe.get_attribute('src')
-                if src:
-                    logger.info(f"ℹ Iframe détecté: {src[:100]}...")
+        """Extrait les URLs des éléments vidéo HTML (document principal et iframes)"""
+        try:
+            snapshot = self._get_dom_snapshot()
+            self._record_media(snapshot)
+            
+            # Iframes (lecteurs intégrés): analysées sur place
+            if snapshot['iframes']:
+                self._extract_frames()
         
         except Exception as e:
+            self.stats.count('errors')
             logger.error(f"Erreur lors de l'extraction des éléments vidéo: {e}")
     
+    def _record_media(self, snapshot: Dict, frame: str = None) -> int:
+        """
+        Enregistre les flux des balises <video> et <source> d'un relevé du DOM
+        
+        Args:
+            snapshot: Résultat de DOM_EXTRACTION_SCRIPT
+            frame: URL de l'iframe relevée (None = document principal)
+            
+        Returns:
+            Nombre de nouveaux flux
+        """
+        # Balises <video> (src, currentSrc, data-src, poster) et <source>
+        candidates = []
+        for video in snapshot.get('videos') or []:
+            for key in ('src', 'currentSrc', 'dataSrc', 'poster'):
+                if video.get(key):
+                    candidates.append((video[key], "Élément vidéo trouvé", 'video-element'))
+        for source in snapshot.get('sources') or []:
+            for key in ('src', 'dataSrc'):
+                if source.get(key):
+                    candidates.append((source[key], "Source vidéo trouvée", 'source-element'))
+        
+        flags = self.classifier.classify_many(src for src, _, _ in candidates)
+        self.stats.count('urls_classified', len(candidates))
+        found = 0
+        for (src, label, origin), is_video in zip(candidates, flags):
+            if is_video and self._record_video(src, label, origin, frame=frame):
+                found += 1
+        return found
+    
+    def _extract_frames(self):
+        """
+        Analyse les iframes de la page déjà chargée, sans les charger à part
+        
+        Le driver entre dans chaque iframe (même d'une autre origine), relève
+        ses <video>/<source> et ses liens avec DOM_EXTRACTION_SCRIPT puis
+        descend dans ses propres iframes, jusqu'à FRAME_MAX_DEPTH niveaux et
+        FRAME_MAX_COUNT iframes. Chaque flux trouvé est attribué à l'URL de son
+        iframe; les liens sont repris par _extract_links.
+        """
+        analyzed = 0
+        
+        def _walk(depth: int):
+            nonlocal analyzed
+            for element in self.driver.find_elements('tag name', 'iframe'):
+                if analyzed >= self.FRAME_MAX_COUNT:
+                    return
+                try:
+                    src = element.get_attribute('src') or 'about:blank'
+                    self.driver.switch_to.frame(element)
+                except Exception as e:
+                    logger.debug(f"Iframe inaccessible: {e}")
+                    continue
+                
+                analyzed += 1
+                try:
+                    snapshot = self.driver.execute_script(self.DOM_EXTRACTION_SCRIPT) or {}
+                    frame = snapshot.get('location') or src
+                    found = self._record_media(snapshot, frame)
+                    self._frame_links.extend(snapshot.get('links') or [])
+                    logger.info(f"ℹ Iframe analysée: {frame[:100]} ({found} flux)")
+                    if depth < self.FRAME_MAX_DEPTH and snapshot.get('iframes'):
+                        _walk(depth + 1)
+                except Exception as e:
+                    logger.debug(f"Analyse de l'iframe {src[:100]} impossible: {e}")
+                finally:
+                    self.driver.switch_to.parent_frame()
+        
+        try:
+            _walk(1)
+        finally:
+            self.driver.switch_to.default_content()
+    
     def _extract_links(self, base_url: str, allowed_domains: List[str] = None) -> Set[str]:
         """
-        Extrait tous les liens d'une page
+        Extrait tous les liens d'une page, y compris ceux de ses iframes
         
         Args:
             base_url: URL de base pour résoudre les liens relatifs
@@ -233,230 +992,4268 @@ class VideoScraper:
         Returns:
             Ensemble des URLs trouvées
         """
-        links = set()
+        links = []
         try:
             # Extrait tous les liens
-            link_elements = self.driver.find_elements(By.TAG_NAME, 'a')
-            
-            for link in link_elements:
-                href = link.get_attribute('href')
+            # Les liens d'iframe sont déjà absolus (résolus dans leur document)
+            for link in self._get_dom_snapshot()['links'] + self._frame_links:
+                href = link.get('raw') or ''
                 
                 if not href or href.startswith('#') or href.startswith('javascript:'):
                     continue
                 
-                # Convertit les liens relatifs en liens absolus
-                absolute_url = urljoin(base_url, href)
-                
-                # Vérifie les domaines autorisés
-                if allowed_domains:
-                    parsed_url = urlparse(absolute_url)
-                    domain = parsed_url.netloc
-                    
-                    if not any(allowed_domain in domain for allowed_domain in allowed_domains):
-                        continue
+                # Convertit les liens relatifs en liens absolus (le navigateur tient compte de <base>)
+                absolute_url = link.get('href') or urljoin(base_url, href)
+                links.append(absolute_url)
+                if link.get('text'):
+                    self._link_texts.setdefault(absolute_url, link['text'])
+            
+        except Exception as e:
+            self.stats.count('errors')
+            logger.error(f"Erreur lors de l'extraction des liens: {e}")
+        
+        return self._filter_links(links, allowed_domains)
+    
+    def _filter_links(self, links, allowed_domains: List[str] = None) -> Set[str]:
+        """
+        Garde les liens http(s) appartenant aux domaines autorisés, sous forme canonique
+        
+        Args:
+            links: Itérable d'URLs absolues
+            allowed_domains: Liste des domaines autorisés (None = tous les domaines)
+            
+        Returns:
+            Ensemble des URLs canoniques retenues
+        """
+        filtered = {}
+        for absolute_url in links:
+            parsed_url = urlparse(absolute_url)
+            if parsed_url.scheme not in ('http', 'https'):
+                continue
+            
+            # Vérifie les domaines autorisés
+            if allowed_domains:
+                domain = parsed_url.netloc
                 
-                links.add(absolute_url)
+                if not any(allowed_domain in domain for allowed_domain in allowed_domains):
+                    continue
+            
+            canonical_url = self.canonicalizer.canonicalize(absolute_url)
+            if canonical_url != absolute_url:
+                self.canonical_stats['rewritten'] += 1
+                self._rewritten_links.add(canonical_url)
+                if absolute_url in self._link_texts:
+                    self._link_texts.setdefault(canonical_url, self._link_texts[absolute_url])
+            
+            # Plusieurs variantes d'une même page sur la page en cours
+            variants = filtered.setdefault(canonical_url, set())
+            if variants and absolute_url not in variants:
+                self.canonical_stats['duplicates_avoided'] += 1
+            variants.add(absolute_url)
+        
+        logger.info(f"✓ {len(filtered)} lien(s) trouvé(s) sur la page")
+        return set(filtered)
+    
+    def _unvisited_links(self, links, visited) -> List[str]:
+        """
+        Retire les liens déjà visités
+        
+        Args:
+            links: URLs canoniques (résultat de _filter_links)
+            visited: Pages visitées (set ou BloomFilter)
+            
+        Returns:
+            Liste des liens restants
+        """
+        remaining = []
+        for link in links:
+            if link in visited:
+                # Sans canonicalisation, cette variante aurait été chargée à nouveau
+                if link in self._rewritten_links:
+                    self.canonical_stats['duplicates_avoided'] += 1
+                continue
+            remaining.append(link)
+        return remaining
+    
+    def _poll_network_log(self) -> List[Dict]:
+        """
+        Lit et décode les nouveaux événements réseau (log de performance
+        Chrome/Edge, ou événements reçus par la capture DevTools/BiDi)
+        
+        Les requêtes et réponses lues sont conservées pour _extract_network_logs,
+        car get_log() vide le tampon du navigateur.
+        
+        Returns:
+            Liste des nouveaux événements décodés
+        """
+        if self._capture is not None:
+            events = self._capture.drain()
+            self.stats.count('log_entries', len(events))
+            stats = self.network_log_stats
+            stats['seen'] += len(events)
+            stats['parsed'] += len(events)
+            stats['blocked'] += sum(1 for event in events if event['params'].get('blockedReason'))
+        elif self.browser not in ['chrome', 'edge'] or self.network_capture != 'log':
+            return []
+        else:
+            try:
+                entries = self.driver.get_log('performance')
+            except Exception:
+                return []
+            self.stats.count('log_entries', len(entries))
+            events = self._decode_network_events(entries)
+        
+        # Mode multi-onglets: chaque événement revient à l'onglet qui l'a émis
+        if self._tab_targets:
+            for event in events:
+                tab = self._tab_targets.get(event.get('webview'))
+                if tab is not None:
+                    tab.route(event)
+            return events
+        
+        self._pending_network_events.extend(
+            event for event in events
+            if event.get('method') in ('Network.requestWillBeSent', 'Network.responseReceived')
+        )
+        return events
+    
+    def _wait_for_page_ready(self, max_wait: float, previous: Optional[Tuple] = None) -> str:
+        """
+        Attend que la page soit prête, au plus max_wait secondes
+        
+        La page est considérée prête dès qu'un flux vidéo a été vu (requête
+        réseau ou élément <video>), ou dès que le document est chargé et que
+        le réseau est resté calme pendant NETWORK_IDLE_TIME secondes.
+        
+        Args:
+            max_wait: Temps d'attente maximal (secondes)
+            previous: (href, timeOrigin) du document quitté, si la navigation
+                n'a pas attendu le chargement (pageLoadStrategy 'none')
             
-            logger.info(f"✓ {len(links)} lien(s) trouvé(s) sur la page")
+        Returns:
+            Raison de la fin d'attente: 'stream', 'idle', 'timeout' ou 'interrupted'
+        """
+        tracker = _ReadinessTracker(max_wait, self.NETWORK_IDLE_TIME, self.MAX_INFLIGHT_REQUESTS, previous)
+        
+        while True:
+            if self._interrupt.is_set():
+                reason = 'interrupted'
+                break
+            
+            try:
+                state = self.driver.execute_script(self.READY_STATE_SCRIPT, tracker.resource_offset) or {}
+            except Exception:
+                state = {}
+            
+            reason = tracker.update(state, self._poll_network_log(), self.classifier)
+            if reason:
+                break
+            self._pause(tracker.sleep_time(self.READY_POLL_INTERVAL))
+        
+        logger.info(f"Page prête en {tracker.elapsed:.1f}s ({reason})")
+        return reason
+    
+    def _scroll_options(self, scroll_pause: float) -> Dict:
+        """Paramètres de SCROLL_SCRIPT (millisecondes)"""
+        return {
+            'quietTime': self.SCROLL_QUIET_TIME * 1000,
+            'stepTimeout': scroll_pause * 1000,
+            'budget': self.SCROLL_BUDGET * 1000,
+            'maxSteps': self.SCROLL_MAX_STEPS,
+        }
+    
+    def _scroll_timeout(self, scroll_pause: float) -> float:
+        """Durée maximale d'un scroll complet, retour en haut compris (secondes)"""
+        return self.SCROLL_BUDGET + 2 * scroll_pause + 5
+    
+    def _log_scroll(self, result: Dict):
+        """Journalise le bilan d'un scroll"""
+        logger.info(f"Scroll: {result.get('steps', 0)} pas, hauteur {result.get('height', 0)}px "
+                    f"({result.get('reason')}, {result.get('elapsed', 0):.1f}s)")
+    
+    def _scroll_page(self, scroll_pause: float) -> Dict:
+        """
+        Parcourt la page écran par écran pour déclencher le chargement lazy
+        
+        Un seul script dans la page (SCROLL_SCRIPT): chaque pas attend que le
+        DOM et le réseau se calment (au plus scroll_pause secondes), et le
+        parcours s'arrête quand la page ne grandit plus une fois en bas, ou
+        au budget SCROLL_BUDGET / SCROLL_MAX_STEPS.
+        
+        Args:
+            scroll_pause: Attente maximale après chaque pas (secondes)
             
+        Returns:
+            Bilan du scroll (reason, steps, height, elapsed, mutations, resources)
+        """
+        try:
+            self.driver.set_script_timeout(self._scroll_timeout(scroll_pause))
+            result = self.driver.execute_async_script(self.SCROLL_SCRIPT, self._scroll_options(scroll_pause)) or {}
         except Exception as e:
-            logger.error(f"Erreur lors de l'extraction des liens: {e}")
+            logger.warning(f"Scroll progressif impossible: {e}")
+            return {}
+        finally:
+            # Délai ordinaire des scripts pour la suite de la page
+            try:
+                self.driver.set_script_timeout(self.script_timeout)
+            except Exception:
+                pass
+        
+        self._log_scroll(result)
+        return result
+    
+    def _score_link(self, url: str, depth: int, text: str = '') -> float:
+        """
+        Priorité d'un lien dans la frontière (plus élevée = visité plus tôt)
+        
+        Args:
+            url: URL du lien
+            depth: Profondeur de la page liée
+            text: Texte du lien
+            
+        Returns:
+            Score du lien
+        """
+        score = -self.DEPTH_WEIGHT * depth
+        if self._is_video_url(url):
+            score += 5
+        if self.WATCH_URL_RE.search(url):
+            score += 3
+        if text and self.WATCH_TEXT_RE.search(text):
+            score += 2
+        return score
+    
+    def _link_entries(self, links, depth: int) -> List[Tuple[str, int, float]]:
+        """Tuples (url, profondeur, priorité) des liens de la page en cours pour la frontière"""
+        return [(link, depth, self._score_link(link, depth, self._link_texts.get(link, ''))) for link in links]
+    
+    def _analyze_page_http(self, url: str, allowed_domains: List[str] = None) -> Optional[Set[str]]:
+        """
+        Analyse une page par HTTP seul, sans navigateur
+        
+        Les flux trouvés sont ajoutés à self.video_urls. La page est renvoyée
+        au navigateur (None) si son domaine est dans js_domains, si elle n'est
+        pas du HTML, si elle contient un lecteur sans flux visible, ou si elle
+        semble entièrement rendue en JavaScript.
+        
+        Args:
+            url: URL de la page
+            allowed_domains: Liste des domaines autorisés pour les liens
+            
+        Returns:
+            Ensemble des liens trouvés, ou None s'il faut utiliser le navigateur
+        """
+        domain = urlparse(url).netloc
+        if any(js_domain in domain for js_domain in self.js_domains):
+            return None
+        
+        if self._http_fetcher is None:
+            self._http_fetcher = HttpFetcher(user_agent=self.ua.random)
+        
+        fetched = self._http_fetcher.fetch(url)
+        if fetched is None:
+            return None
+        
+        final_url, html = fetched
+        page = self._http_fetcher.parse(final_url, html)
+        streams = self.classifier.filter(page.media)
+        self.stats.count('urls_classified', len(page.media))
+        
+        if page.has_player and not streams:
+            logger.info("ℹ Lecteur détecté sans flux visible: passage au navigateur")
+            return None
+        if not page.links and not streams and page.script_count:
+            logger.info("ℹ Page rendue en JavaScript: passage au navigateur")
+            return None
+        
+        logger.info(f"✓ Page analysée par HTTP ({len(html)} caractères)")
+        for stream in streams:
+            self._record_video(stream, "Flux vidéo trouvé (HTTP)", 'http')
+        
+        for link, text in page.links:
+            if text:
+                self._link_texts.setdefault(link, text)
+        return self._filter_links((link for link, _ in page.links), allowed_domains)
+    
+    def _reset_page_state(self, url: str, depth: int = 0):
+        """
+        Réinitialise l'état propre à la page analysée
+        
+        Args:
+            url: URL de la page
+            depth: Profondeur de la page dans le crawl
+        """
+        self.network_log_stats = {'seen': 0, 'parsed': 0, 'matched': 0, 'blocked': 0}
+        self._pending_network_events = []
+        self._dom_snapshot = None
+        self._frame_links = []
+        self._page_url = url
+        self._page_depth = depth
+        self._page_videos = []
+        self._page_records = []
+        self._link_texts = {}
+        self._rewritten_links = set()
+    
+    def _analyze_page(self, url: str, wait_time: int, scroll_pause: float = 1,
+                      allowed_domains: List[str] = None, collect_links: bool = False,
+                      depth: int = 0) -> Set[str]:
+        """
+        Charge une page et en extrait les flux vidéo (et éventuellement les liens)
+        
+        Les flux détectés sont ajoutés à self.video_urls.
+        
+        Args:
+            url: URL de la page à charger
+            wait_time: Temps d'attente maximal pour le chargement (secondes)
+            scroll_pause: Attente maximale après chaque pas de scroll (secondes)
+            allowed_domains: Liste des domaines autorisés pour les liens
+            collect_links: Extrait aussi les liens de la page
+            depth: Profondeur de la page dans le crawl (enregistrée avec chaque flux)
+            
+        Returns:
+            Ensemble des liens trouvés (vide si collect_links est False)
+        """
+        with self.stats.page(url):
+            attempt = 0
+            while True:
+                try:
+                    return self._attempt_page(url, wait_time, scroll_pause, allowed_domains,
+                                              collect_links, depth)
+                except Exception as e:
+                    if attempt >= self.retries or not self._retryable(e):
+                        raise
+                    error = e
+                
+                attempt += 1
+                delay = self._retry_delay(attempt)
+                self.stats.count('retries')
+                logger.warning(f"Échec de {url} ({error}): nouvel essai {attempt}/{self.retries} "
+                               f"dans {delay:.1f}s")
+                if self._interrupt.wait(delay):
+                    raise RuntimeError(f"Analyse interrompue: {url}")
+    
+    def _attempt_page(self, url: str, wait_time: int, scroll_pause: float,
+                      allowed_domains: Optional[List[str]], collect_links: bool,
+                      depth: int) -> Set[str]:
+        """
+        Un essai de _analyze_page, sous la surveillance du chien de garde
+        
+        Si la page dépasse son échéance, le navigateur est tué (ce qui débloque
+        la commande WebDriver en cours) et l'essai échoue avec TimeoutException.
+        Après un échec dû au navigateur, il est redémarré au prochain essai.
+        """
+        deadline = self._page_deadline(wait_time, scroll_pause)
+        self._watchdog.arm(deadline)
+        try:
+            links = self._load_and_extract(url, wait_time, scroll_pause, allowed_domains,
+                                           collect_links, depth)
+        except Exception as e:
+            hung = self._watchdog.disarm()
+            if hung or isinstance(e, TimeoutException) or _driver_lost(e):
+                self._stop_driver()
+            if hung:
+                self.stats.count('hung')
+                raise TimeoutException(f"Page bloquée au-delà de {deadline:.0f}s: {url}") from e
+            raise
+        
+        if self._watchdog.disarm():
+            self.stats.count('hung')
+            self._stop_driver()
+            raise TimeoutException(f"Page bloquée au-delà de {deadline:.0f}s: {url}")
+        return links
+    
+    def _load_and_extract(self, url: str, wait_time: int, scroll_pause: float,
+                          allowed_domains: Optional[List[str]], collect_links: bool,
+                          depth: int) -> Set[str]:
+        """Étapes de _analyze_page, chacune mesurée dans self.stats"""
+        self._reset_page_state(url, depth)
+        self._interrupt.clear()
+        
+        # Voie rapide: simple requête HTTP
+        if self.tiered:
+            with self.stats.phase('http'):
+                links = self._analyze_page_http(url, allowed_domains)
+            if links is not None:
+                self.tier_stats['http'] += 1
+                return links if collect_links else set()
+        
+        if not self.driver:
+            self.start()
+        else:
+            reason = self._recycle_reason()
+            if reason:
+                self._recycle_driver(reason)
+        self.tier_stats['browser'] += 1
+        self._browser_pages += 1
+        
+        # Événements restés de la page précédente
+        if self._capture is not None:
+            self._capture.drain()
+            self._capture.stream_seen.clear()
+        else:
+            self._discard_network_log()
+        
+        # Charge la page (sans attente du driver en mode multi-onglets ou 'none')
+        previous = None
+        if self.tabs > 1 or self.page_load_strategy == 'none':
+            previous = self.driver.execute_script("return [location.href, performance.timeOrigin];")
+        with self.stats.phase('navigation'):
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                # Chargement interminable: arrêté, la page est analysée en l'état
+                self.stats.count('timeouts')
+                logger.warning(f"Chargement arrêté après {self.page_load_timeout}s: {url}")
+                self.driver.execute_script("window.stop();")
+        
+        # Attend le chargement (wait_time est un plafond, pas un minimum)
+        logger.info(f"Attente du chargement (max {wait_time} secondes)...")
+        with self.stats.phase('readiness'):
+            reason = self._wait_for_page_ready(wait_time, previous)
+        if reason == 'interrupted':
+            raise RuntimeError(f"Analyse interrompue: {url}")
+        
+        # Scroll pour déclencher le chargement lazy
+        logger.info("Scroll de la page pour charger le contenu...")
+        with self.stats.phase('scroll'):
+            self._scroll_page(scroll_pause)
+        
+        # Extrait les URLs vidéo
+        logger.info("Analyse des flux réseau...")
+        with self.stats.phase('network'):
+            self._extract_network_logs()
+        
+        logger.info("Analyse des éléments HTML...")
+        with self.stats.phase('dom'):
+            self._extract_video_elements()
+        
+        if not collect_links:
+            return set()
+        
+        logger.info("Extraction des liens pour récursion...")
+        with self.stats.phase('links'):
+            return self._extract_links(url, allowed_domains)
+    
+    def _complete_page(self, frontier: 'CrawlFrontier', url: str, depth: int, new_links):
+        """
+        Enregistre dans la frontière une page analysée, ses liens et ses flux
+        
+        Args:
+            frontier: Frontière du crawl
+            url: URL de la page
+            depth: Profondeur de la page
+            new_links: Liens canoniques trouvés sur la page
+        """
+        new_links = self._unvisited_links(new_links, self.visited_urls)
+        # Une page terminée n'est plus rejouée à la reprise: ses lignes JSONL
+        # doivent être écrites avant qu'elle soit enregistrée comme faite
+        if self.sink is not None and self._page_records:
+            self.sink.flush()
+        frontier.complete(url, links=self._link_entries(new_links, depth + 1),
+                          videos=self._page_videos)
+    
+    def _open_tabs(self) -> List['_Tab']:
+        """Ouvre les onglets du mode multi-onglets (le premier est la fenêtre courante)"""
+        tabs = [_Tab(self.driver.current_window_handle)]
+        for _ in range(self.tabs - 1):
+            self.driver.switch_to.new_window('tab')
+            # Network.setBlockedURLs ne vaut que pour l'onglet où il est appelé
+            self._apply_blocking()
+            tabs.append(_Tab(self.driver.current_window_handle))
+        self._tab_targets = {tab.target: tab for tab in tabs}
+        logger.info(f"✓ {len(tabs)} onglet(s) ouvert(s)")
+        return tabs
+    
+    def _close_tabs(self, tabs: List['_Tab']):
+        """Ferme les onglets supplémentaires et revient au premier"""
+        self._tab_targets = {}
+        for tab in tabs[1:]:
+            try:
+                self.driver.switch_to.window(tab.handle)
+                self.driver.close()
+            except Exception as e:
+                logger.debug(f"Fermeture d'onglet impossible: {e}")
+        try:
+            self.driver.switch_to.window(tabs[0].handle)
+        except Exception as e:
+            logger.debug(f"Retour au premier onglet impossible: {e}")
+    
+    def _start_tab(self, tab: '_Tab', url: str, depth: int, wait_time: float) -> None:
+        """
+        Lance sans attendre la navigation d'un onglet vers une page
+        
+        Args:
+            tab: Onglet libre
+            url: URL de la page
+            depth: Profondeur de la page
+            wait_time: Temps d'attente maximal du chargement (secondes)
+        """
+        started = time.perf_counter()
+        self.driver.switch_to.window(tab.handle)
+        previous = self.driver.execute_script(self.TAB_NAVIGATE_SCRIPT, url)
+        tab.load(url, depth, _ReadinessTracker(
+            wait_time, self.NETWORK_IDLE_TIME, self.MAX_INFLIGHT_REQUESTS, previous
+        ), started)
+        self._add_tab_timing(tab, 'navigation', time.perf_counter() - started)
+    
+    def _step_tab(self, tab: '_Tab', scroll_pause: float) -> bool:
+        """
+        Fait avancer la page d'un onglet: attente du chargement, scroll, puis fin
+        
+        Le scroll (SCROLL_SCRIPT) est lancé sans attente dans la page et
+        son état est relevé à chaque passage, pour ne pas bloquer les autres onglets.
+        
+        Args:
+            tab: Onglet occupé
+            scroll_pause: Attente maximale après chaque pas de scroll (secondes)
+            
+        Returns:
+            True si la page est prête à être analysée
+        """
+        self.driver.switch_to.window(tab.handle)
+        if tab.phase == 'scroll':
+            tab.new_events = []
+            try:
+                result = self.driver.execute_script(self.SCROLL_STATE_SCRIPT)
+            except Exception:
+                result = None
+            waited = time.perf_counter() - tab.scroll_started
+            # False: scroll en cours (None: état perdu, la page a changé)
+            if result is False and waited < self._scroll_timeout(scroll_pause):
+                return False
+            self._add_tab_timing(tab, 'scroll', waited)
+            if isinstance(result, dict):
+                self._log_scroll(result)
+            return True
+        
+        try:
+            state = self.driver.execute_script(self.READY_STATE_SCRIPT, tab.tracker.resource_offset) or {}
+        except Exception:
+            state = {}
+        
+        events, tab.new_events = tab.new_events, []
+        reason = tab.tracker.update(state, events, self.classifier)
+        if reason is None:
+            return False
+        
+        logger.info(f"Page prête en {tab.tracker.elapsed:.1f}s ({reason}): {tab.url}")
+        self._add_tab_timing(tab, 'readiness', tab.tracker.elapsed)
+        self.driver.execute_script(self.SCROLL_SCRIPT, self._scroll_options(scroll_pause))
+        tab.phase = 'scroll'
+        tab.scroll_started = time.perf_counter()
+        return False
+    
+    def _add_tab_timing(self, tab: '_Tab', phase: str, seconds: float):
+        """Mesure une phase d'un onglet (les pages des onglets se chevauchent)"""
+        self.stats.add(phase, seconds)
+        tab.timings[phase] = tab.timings.get(phase, 0.0) + seconds
+    
+    def _finish_tab(self, tab: '_Tab', allowed_domains: List[str], collect_links: bool) -> Set[str]:
+        """
+        Extrait flux et liens de la page chargée dans un onglet
+        
+        Args:
+            tab: Onglet dont la page est prête
+            allowed_domains: Liste des domaines autorisés pour les liens
+            collect_links: Extrait aussi les liens de la page
+            
+        Returns:
+            Ensemble des liens trouvés (vide si collect_links est False)
+        """
+        # Les compteurs du log réseau restent ceux de l'ensemble des onglets
+        log_stats = self.network_log_stats
+        self._reset_page_state(tab.url, tab.depth)
+        self.network_log_stats = log_stats
+        self._pending_network_events = tab.events
+        
+        tab.phase = 'extract'
+        with self.stats.page(tab.url, tab.started, tab.timings):
+            self.driver.switch_to.window(tab.handle)
+            with self.stats.phase('network'):
+                self._extract_network_logs()
+            with self.stats.phase('dom'):
+                self._extract_video_elements()
+            if not collect_links:
+                return set()
+            with self.stats.phase('links'):
+                return self._extract_links(tab.url, allowed_domains)
+    
+    def _crawl_tabs(self, frontier: 'CrawlFrontier', scheduler: 'CrawlScheduler', wait_time: float,
+                    allowed_domains: List[str], max_depth: int, scroll_pause: float = 1):
+        """
+        Boucle de crawl multi-onglets: jusqu'à self.tabs pages chargées en parallèle
+        
+        Les navigations sont lancées sans attente dans chaque onglet libre,
+        puis les onglets sont scrutés à tour de rôle. Le log de performance,
+        commun au navigateur, est réparti entre les onglets selon son champ
+        'webview' (identifiant de cible DevTools de l'onglet).
+        
+        Args:
+            frontier: Frontière du crawl
+            scheduler: Ordonnanceur (priorités, limites par hôte, budgets)
+            wait_time: Temps d'attente maximal du chargement de chaque page (secondes)
+            allowed_domains: Liste des domaines autorisés
+            max_depth: Profondeur maximale du crawl
+            scroll_pause: Attente maximale après chaque pas de scroll (secondes)
+        """
+        if not self.driver:
+            self.start()
+        
+        tabs = self._open_tabs()
+        self.network_log_stats = {'seen': 0, 'parsed': 0, 'matched': 0, 'blocked': 0}
+        recycle = None
+        # Pages à réessayer (heure du nouvel essai, url, profondeur) et essais par page
+        pending: List[Tuple[float, str, int]] = []
+        attempts: Dict[str, int] = {}
+        # Erreur de connexion au driver (processus du driver disparu)
+        lost: Optional[Exception] = None
+        deadline = self._page_deadline(wait_time, scroll_pause)
+        try:
+            while True:
+                # Navigateur bloqué au passage précédent (tué par le chien de garde) ou tombé
+                if self._watchdog.disarm():
+                    self.stats.count('hung')
+                    error = TimeoutException("Navigateur bloqué au-delà de l'échéance")
+                    tabs = self._restart_tabs(tabs, frontier, pending, attempts, error)
+                    lost = None
+                elif lost is not None:
+                    logger.warning(f"Connexion au navigateur perdue ({lost}): redémarrage")
+                    tabs = self._restart_tabs(tabs, frontier, pending, attempts, lost)
+                    lost = None
+                
+                # Redémarrage demandé par le ResourceGovernor: une fois les onglets libérés
+                recycle = recycle or self._recycle_reason()
+                if recycle and all(tab.url is None for tab in tabs):
+                    self._close_tabs(tabs)
+                    self._recycle_driver(recycle)
+                    tabs = self._open_tabs()
+                    recycle = None
+                
+                # Chaque passage (navigations lancées, onglets scrutés) a une échéance
+                self._watchdog.arm(deadline)
+                
+                # Remplit les onglets libres, en commençant par les nouveaux essais dus
+                wait = None
+                for tab in tabs:
+                    if tab.url is not None or recycle:
+                        continue
+                    if pending and pending[0][0] <= time.monotonic():
+                        _, url, depth = heapq.heappop(pending)
+                        logger.info(f"\n[Profondeur {depth}] Nouvel essai: {url}")
+                    else:
+                        item, wait = scheduler.try_next()
+                        if item is None:
+                            break
+                        
+                        url, depth = item
+                        self.visited_urls.add(url)
+                        logger.info(f"\n[Profondeur {depth}] Scraping: {url}")
+                        
+                        if self.tiered:
+                            self._reset_page_state(url, depth)
+                            http_started = time.perf_counter()
+                            with self.stats.phase('http'):
+                                links = self._analyze_page_http(url, allowed_domains)
+                            if links is not None:
+                                elapsed = time.perf_counter() - http_started
+                                self.stats.end_page(url, elapsed, phases={'http': elapsed})
+                                self.tier_stats['http'] += 1
+                                self._complete_page(frontier, url, depth, links if depth < max_depth else set())
+                                continue
+                    
+                    self.tier_stats['browser'] += 1
+                    self._browser_pages += 1
+                    try:
+                        self._start_tab(tab, url, depth, wait_time)
+                    except Exception as e:
+                        if _driver_lost(e):
+                            lost = e
+                        if not self._retry_tab_page(pending, attempts, url, depth, e):
+                            self.stats.count('errors')
+                            logger.error(f"Erreur lors du chargement de {url}: {e}")
+                            frontier.fail(url, str(e))
+                        tab.release()
+                        if lost is not None:
+                            break
+                
+                if lost is not None:
+                    continue
+                
+                if pending:
+                    due = max(pending[0][0] - time.monotonic(), 0)
+                    wait = due if wait is None else min(wait, due)
+                
+                busy = [tab for tab in tabs if tab.url is not None]
+                if not busy:
+                    if wait is None:
+                        break
+                    time.sleep(min(wait, self.READY_POLL_INTERVAL))
+                    continue
+                
+                # Un seul relevé du log pour tous les onglets, puis chaque onglet
+                try:
+                    self._poll_network_log()
+                except Exception as e:
+                    if not _driver_lost(e):
+                        raise
+                    lost = e
+                    continue
+                for tab in busy:
+                    try:
+                        if not self._step_tab(tab, scroll_pause):
+                            continue
+                        new_links = self._finish_tab(tab, allowed_domains, tab.depth < max_depth)
+                        self._complete_page(frontier, tab.url, tab.depth, new_links)
+                    except Exception as e:
+                        if _driver_lost(e):
+                            lost = e
+                        if not self._retry_tab_page(pending, attempts, tab.url, tab.depth, e):
+                            # Les erreurs d'extraction sont déjà comptées avec leur page
+                            if tab.phase != 'extract':
+                                self.stats.count('errors')
+                            logger.error(f"Erreur lors du scraping récursif de {tab.url}: {e}")
+                            frontier.fail(tab.url, str(e))
+                    tab.release()
+                    # Les autres onglets sont repris par _restart_tabs
+                    if lost is not None:
+                        break
+                
+                if lost is None:
+                    self._pause(self.READY_POLL_INTERVAL)
+        finally:
+            self._watchdog.disarm()
+            self._close_tabs(tabs)
+    
+    def _retry_tab_page(self, pending: List[Tuple[float, str, int]], attempts: Dict[str, int],
+                        url: str, depth: int, error: Exception) -> bool:
+        """
+        Programme un nouvel essai d'une page en échec (mode multi-onglets)
+        
+        Args:
+            pending: File des nouveaux essais (tas trié par heure)
+            attempts: Nombre de nouveaux essais déjà programmés par page
+            url: URL de la page
+            depth: Profondeur de la page
+            error: Cause de l'échec
+            
+        Returns:
+            False si l'échec n'est pas dû au navigateur ou si les essais sont épuisés
+        """
+        attempt = attempts.get(url, 0) + 1
+        if attempt > self.retries or not self._retryable(error):
+            return False
+        
+        attempts[url] = attempt
+        delay = self._retry_delay(attempt)
+        self.stats.count('retries')
+        logger.warning(f"Échec de {url} ({error}): nouvel essai {attempt}/{self.retries} dans {delay:.1f}s")
+        heapq.heappush(pending, (time.monotonic() + delay, url, depth))
+        return True
+    
+    def _restart_tabs(self, tabs: List['_Tab'], frontier: 'CrawlFrontier',
+                      pending: List[Tuple[float, str, int]], attempts: Dict[str, int],
+                      error: Exception) -> List['_Tab']:
+        """
+        Relance le navigateur (tué par le chien de garde ou tombé) et rouvre les onglets
+        
+        Les pages en cours sont réessayées plus tard, ou marquées en échec.
+        
+        Args:
+            error: Cause de l'échec des pages en cours
+        
+        Returns:
+            Nouveaux onglets
+        """
+        for tab in tabs:
+            if tab.url is None:
+                continue
+            if not self._retry_tab_page(pending, attempts, tab.url, tab.depth, error):
+                self.stats.count('errors')
+                frontier.fail(tab.url, str(error))
+            tab.release()
+        
+        self._tab_targets = {}
+        self._stop_driver()
+        self.start()
+        return self._open_tabs()
+    
+    def scrape_page(self, url: str, wait_time: int = 10) -> List[str]:
+        """
+        Scrape une page pour détecter les flux vidéo
+        
+        Args:
+            url: URL de la page à scraper
+            wait_time: Temps d'attente maximal pour le chargement (secondes)
+            
+        Returns:
+            Liste des URLs de flux vidéo détectées
+        """
+        # En mode tiered, le navigateur n'est lancé que si la voie HTTP ne suffit pas
+        if not self.driver and not self.tiered:
+            self.start()
+        
+        logger.info(f"Chargement de la page: {url}")
+        self.video_urls.clear()
+        
+        try:
+            self._analyze_page(url, wait_time, scroll_pause=2)
+            self.collapse_streams()
+            if self.validate:
+                self.validate_streams()
+            
+            # Résultats
+            if self.video_urls:
+                logger.info(f"\n{'='*60}")
+                logger.info(f"✓ {len(self.streams)} flux vidéo détecté(s) ({len(self.video_urls)} URL(s))")
+                logger.info(f"{'='*60}")
+                for i, stream in enumerate(self.streams, 1):
+                    logger.info(f"{i}. {stream.summary()}")
+            else:
+                logger.warning("Aucun flux vidéo détecté sur cette page")
+            
+            return list(self.video_urls)
+        
+        except Exception as e:
+            logger.error(f"Erreur lors du scraping: {e}")
+            return []
+        finally:
+            self.write_stats_report()
+    
+    def scrape_recursive(self, start_url: str, max_depth: int = 2, wait_time: int = 10, 
+                         allowed_domains: List[str] = None, delay_between_requests: int = 2,
+                         resume: str = None, max_pages: int = None,
+                         max_duration: float = None, bloom_capacity: int = None,
+                         bloom_error_rate: float = 0.001) -> List[str]:
+        """
+        Scrape récursivement plusieurs pages pour détecter les flux vidéo
+        
+        Les pages sont parcourues niveau par niveau à partir d'une frontière
+        SQLite, les liens qui ressemblent à une page de lecture en premier.
+        Avec resume, la frontière est enregistrée dans un fichier après chaque
+        page et un crawl interrompu reprend là où il s'était arrêté.
+        
+        Args:
+            start_url: URL de départ
+            max_depth: Profondeur maximale de récursion (0 = page actuelle uniquement)
+            wait_time: Temps d'attente maximal pour le chargement de chaque page (secondes)
+            allowed_domains: Liste des domaines autorisés (None = tous les domaines)
+            delay_between_requests: Délai entre deux requêtes vers un même hôte (secondes)
+            resume: Fichier de sauvegarde du crawl (créé s'il n'existe pas, repris sinon)
+            max_pages: Nombre maximal de pages à visiter (None = illimité)
+            max_duration: Durée maximale du crawl (secondes, None = illimitée)
+            bloom_capacity: Nombre de pages prévu; active un filtre de Bloom à la
+                place d'un set pour les pages visitées (très gros crawls)
+            bloom_error_rate: Taux de faux positifs du filtre de Bloom
+            
+        Returns:
+            Liste des URLs de flux vidéo détectées
+        """
+        if not self.driver and not self.tiered:
+            self.start()
+        
+        self.video_urls.clear()
+        self.visited_urls = _new_visited_set(bloom_capacity, bloom_error_rate, self.governor)
+        self.found_links.clear()
+        self.canonical_stats = {'rewritten': 0, 'duplicates_avoided': 0}
+        
+        # Un gros crawl garde sa frontière sur disque même sans reprise
+        frontier = CrawlFrontier(resume or (None if bloom_capacity or self.governor else ':memory:'))
+        start_url = self.canonicalizer.canonicalize(start_url)
+        allowed_domains = _open_crawl(frontier, start_url, max_depth, allowed_domains)
+        self.visited_urls.update(frontier.visited())
+        self.video_urls.update(frontier.videos())
+        scheduler = CrawlScheduler(frontier, delay_between_requests, max_pages=max_pages,
+                                   max_duration=max_duration, max_depth=max_depth)
+        
+        try:
+            if self.tabs > 1:
+                self._crawl_tabs(frontier, scheduler, wait_time, allowed_domains, max_depth)
+            else:
+                while True:
+                    item = scheduler.next_page()
+                    if item is None:
+                        break
+                    
+                    url, depth = item
+                    self.visited_urls.add(url)
+                    logger.info(f"\n[Profondeur {depth}] Scraping: {url}")
+                    
+                    try:
+                        # Extrait les liens seulement si pas au max de profondeur
+                        new_links = self._analyze_page(
+                            url, wait_time,
+                            allowed_domains=allowed_domains,
+                            collect_links=depth < max_depth,
+                            depth=depth
+                        )
+                        self._complete_page(frontier, url, depth, new_links)
+                    
+                    except Exception as e:
+                        logger.error(f"Erreur lors du scraping récursif de {url}: {e}")
+                        frontier.fail(url, str(e))
+            
+            if scheduler.budget_exhausted():
+                logger.warning(f"Budget atteint ({scheduler.pages_started} page(s)): "
+                               f"{frontier.counts().get('pending', 0)} page(s) restent en attente")
+        
+        except KeyboardInterrupt:
+            if resume:
+                logger.warning(f"Crawl interrompu: relancez avec resume='{resume}' pour le reprendre")
+            raise
+        finally:
+            self.crawl_counts = frontier.counts()
+            frontier.close()
+        
+        # Résultats
+        logger.info(f"\n{'='*60}")
+        logger.info(f"RÉSULTATS FINAUX")
+        logger.info(f"{'='*60}")
+        logger.info(f"Pages visitées: {len(self.visited_urls)}")
+        logger.info(f"Liens canonicalisés: {self.canonical_stats['rewritten']} "
+                    f"(chargements en double évités: {self.canonical_stats['duplicates_avoided']})")
+        if self.tiered:
+            logger.info(f"Pages analysées par HTTP seul: {self.tier_stats['http']} "
+                        f"(navigateur: {self.tier_stats['browser']})")
+        self.collapse_streams()
+        if self.validate:
+            self.validate_streams()
+        logger.info(f"Flux vidéo détectés: {len(self.streams)} ({len(self.video_urls)} URL(s))")
+        
+        if self.video_urls:
+            logger.info(f"\nListe des flux vidéo:")
+            for i, stream in enumerate(self.streams, 1):
+                logger.info(f"{i}. {stream.summary()}")
+        else:
+            logger.warning("Aucun flux vidéo détecté")
+        
+        self.write_stats_report()
+        logger.info(f"{'='*60}\n")
+        
+        return list(self.video_urls)
+    
+    def write_stats_report(self):
+        """Journalise la durée par phase et écrit report_path/metrics_path s'ils sont définis"""
+        _write_stats_reports(self.stats, self.report_path, self.metrics_path, extra={
+            'startup': {phase: round(value, 3) for phase, value in self.startup_timings.items()},
+            'tiers': dict(self.tier_stats),
+            'canonicalization': dict(self.canonical_stats),
+        })
+    
+    def collapse_streams(self) -> List['StreamRecord']:
+        """
+        Regroupe les URLs détectées par flux (manifeste HLS/DASH, fichier isolé)
+        
+        Les segments .ts/.m4s sont rattachés à leur manifeste au lieu d'être
+        listés un par un. Le résultat est aussi conservé dans self.streams.
+        
+        Returns:
+            Liste des flux
+        """
+        self.streams = _collapse_streams(self.video_urls, self.fetch_manifests, self.ua.random)
+        self._streams_size = len(self.video_urls)
+        return self.streams
+    
+    def validate_streams(self, urls=None, workers: int = 32) -> Dict[str, Dict]:
+        """
+        Vérifie par HTTP que les flux détectés servent bien un média
+        
+        Détecte les jetons expirés, les 403 et les pages d'erreur HTML avant
+        le téléchargement. Le résultat de chaque sonde est aussi rattaché au
+        StreamRecord correspondant (stream.probe) et conservé dans self.validation.
+        
+        Args:
+            urls: URLs à vérifier (défaut: une par flux de self.streams)
+            workers: Nombre de sondes simultanées
+            
+        Returns:
+            Dictionnaire URL -> résultat (ok, status, content_type,
+            content_length, latency...)
+        """
+        if urls is None and self._streams_size != len(self.video_urls):
+            self.collapse_streams()
+        results = _validate_streams(self.streams, urls, workers, self.ua.random)
+        self.validation.update(results)
+        return results
+    
+    def save_results(self, filename: str = 'video_urls.txt', valid_only: bool = False):
+        """
+        Sauvegarde les flux détectés dans un fichier (un flux par manifeste)
+        
+        Args:
+            filename: Nom du fichier de sortie
+            valid_only: N'écrit pas les flux dont la vérification a échoué
+        """
+        if not self.video_urls:
+            logger.warning("Aucune URL à sauvegarder")
+            return
+        
+        # Regroupement absent ou antérieur à de nouvelles détections
+        if self._streams_size != len(self.video_urls):
+            self.collapse_streams()
+        _save_streams(filename, self.streams, valid_only)
+    
+    def close(self):
+        """Ferme le navigateur"""
+        if self.sink is not None:
+            self.sink.close()
+        if self._http_fetcher is not None:
+            self._http_fetcher.close()
+            self._http_fetcher = None
+        for urls in (self.video_urls, self.visited_urls, self.found_links):
+            if isinstance(urls, SpillSet):
+                urls.close()
+        self._watchdog.close()
+        self._stop_driver()
+    
+    def __enter__(self):
+        """Support du context manager (navigateur lancé à la demande en mode tiered)"""
+        if not self.tiered:
+            self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Support du context manager"""
+        self.close()
+
+
+class _ReadinessTracker:
+    """
+    État de l'attente adaptative d'une page (voir VideoScraper._wait_for_page_ready)
+    
+    Chaque appel à update() prend un relevé de READY_STATE_SCRIPT et les
+    nouveaux événements réseau de la page, et renvoie la raison de fin
+    d'attente ('stream', 'idle', 'timeout') ou None pour continuer.
+    """
+    
+    def __init__(self, max_wait: float, idle_time: float, max_inflight: int,
+                 previous: Optional[Tuple] = None):
+        """
+        Args:
+            max_wait: Temps d'attente maximal (secondes)
+            idle_time: Durée de calme réseau requise (secondes)
+            max_inflight: Nombre de requêtes en cours tolérées pour une page calme
+            previous: (href, timeOrigin) du document précédent, ignoré tant que
+                la navigation n'a pas remplacé le document (navigation non bloquante)
+        """
+        self.previous = tuple(previous) if previous else None
+        self.idle_time = idle_time
+        self.max_inflight = max_inflight
+        self.start = time.monotonic()
+        self.deadline = self.start + max_wait
+        self.inflight: Set[str] = set()
+        self.resource_offset = 0
+        self.quiet_since = None
+    
+    @property
+    def elapsed(self) -> float:
+        """Durée écoulée depuis le début de l'attente (secondes)"""
+        return time.monotonic() - self.start
+    
+    def sleep_time(self, interval: float) -> float:
+        """Pause avant le prochain relevé, sans dépasser l'échéance"""
+        return min(interval, max(0, self.deadline - time.monotonic()))
+    
+    def update(self, state: Dict, events: List[Dict], classifier: 'VideoUrlClassifier') -> Optional[str]:
+        """
+        Intègre un relevé de la page
+        
+        Args:
+            state: Résultat de READY_STATE_SCRIPT ({} si indisponible)
+            events: Nouveaux événements réseau décodés de la page
+            classifier: Classifieur d'URLs vidéo
+            
+        Returns:
+            'stream', 'idle', 'timeout', ou None si la page n'est pas prête
+        """
+        now = time.monotonic()
+        if self.previous is not None:
+            if (state.get('href'), state.get('timeOrigin')) == self.previous:
+                state = {}
+            elif state:
+                self.previous = None
+        stream_seen = bool(state.get('media'))
+        network_busy = False
+        
+        # Ressources terminées depuis la dernière scrutation (tous navigateurs)
+        new_resources = state.get('newResources') or []
+        if new_resources:
+            network_busy = True
+            self.resource_offset = state.get('resourceCount', self.resource_offset)
+            if classifier.filter(new_resources):
+                stream_seen = True
+        
+        # Requêtes en cours d'après le log de performance (Chrome/Edge)
+        for event in events:
+            method = event.get('method', '')
+            params = event.get('params', {})
+            request_id = params.get('requestId')
+            
+            if method == 'Network.requestWillBeSent':
+                url = params.get('request', {}).get('url', '')
+                if url.startswith('data:'):
+                    continue
+                self.inflight.add(request_id)
+                network_busy = True
+                if classifier.is_video_url(url):
+                    stream_seen = True
+            elif method == 'Network.responseReceived':
+                mime_type = params.get('response', {}).get('mimeType', '')
+                if 'video' in mime_type or 'mpegurl' in mime_type:
+                    stream_seen = True
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self.inflight.discard(request_id)
+        
+        if stream_seen:
+            return 'stream'
+        
+        ready = state.get('readyState') == 'complete'
+        if ready and not network_busy and len(self.inflight) <= self.max_inflight:
+            if self.quiet_since is None:
+                self.quiet_since = now
+            if now - self.quiet_since >= self.idle_time:
+                return 'idle'
+        else:
+            self.quiet_since = None
+        
+        if now >= self.deadline:
+            return 'timeout'
+        return None
+
+
+class _Tab:
+    """Onglet du mode multi-onglets et page qui s'y charge"""
+    
+    NETWORK_METHODS = ('Network.requestWillBeSent', 'Network.responseReceived')
+    
+    def __init__(self, handle: str):
+        self.handle = handle
+        # Cible DevTools de l'onglet (champ 'webview' du log de performance)
+        self.target = handle[len('CDwindow-'):] if handle.startswith('CDwindow-') else handle
+        self.release()
+    
+    def load(self, url: str, depth: int, tracker: _ReadinessTracker, started: float):
+        """Associe une page en cours de chargement à l'onglet"""
+        self.url = url
+        self.depth = depth
+        self.tracker = tracker
+        self.phase = 'load'
+        self.started = started
+    
+    def release(self):
+        """Libère l'onglet pour la page suivante"""
+        self.url: Optional[str] = None
+        self.depth = 0
+        self.tracker: Optional[_ReadinessTracker] = None
+        self.phase = None
+        # Début de la page et du scroll (time.perf_counter()), durée de ses phases
+        self.started = 0.0
+        self.scroll_started = 0.0
+        self.timings: Dict[str, float] = {}
+        # Requêtes/réponses à analyser, et événements pas encore vus par l'attente
+        self.events: List[Dict] = []
+        self.new_events: List[Dict] = []
+    
+    def route(self, event: Dict):
+        """Reçoit un événement réseau émis par l'onglet"""
+        if self.url is None:
+            return
+        self.new_events.append(event)
+        if event.get('method') in self.NETWORK_METHODS:
+            self.events.append(event)
+
+
+class _Watchdog:
+    """
+    Chien de garde d'un VideoScraper (voir VideoScraper._attempt_page)
+    
+    Une commande WebDriver bloquée (page qui ne rend jamais la main,
+    navigateur figé) ne peut pas être interrompue depuis le thread qui
+    l'attend: à l'échéance, le chien de garde appelle on_expire depuis son
+    propre thread (qui tue le navigateur) et lève fired.
+    """
+    
+    def __init__(self, on_expire):
+        self.on_expire = on_expire
+        self.fired = False
+        self._deadline: Optional[float] = None
+        # Incrémenté par close(): le thread en cours se termine
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+    
+    def arm(self, seconds: float):
+        """Fixe l'échéance à seconds secondes et remet fired à False"""
+        with self._condition:
+            self.fired = False
+            self._deadline = time.monotonic() + seconds
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(self._generation,),
+                                                name='scrappeur-watchdog', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def disarm(self) -> bool:
+        """
+        Annule l'échéance
+        
+        Returns:
+            True si elle a été dépassée depuis le dernier arm()
+        """
+        with self._condition:
+            self._deadline = None
+            return self.fired
+    
+    def close(self):
+        """Arrête le thread du chien de garde"""
+        with self._condition:
+            self._generation += 1
+            self._deadline = None
+            self._thread = None
+            self._condition.notify_all()
+    
+    def _run(self, generation: int):
+        """Boucle du thread: attend l'échéance en cours jusqu'à close()"""
+        with self._condition:
+            while self._generation == generation:
+                if self._deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                
+                self._deadline = None
+                self.fired = True
+                try:
+                    self.on_expire()
+                except Exception as e:
+                    logger.error(f"Arrêt forcé du navigateur impossible: {e}")
+
+
+class VideoUrlClassifier:
+    """
+    Classifieur d'URLs de flux vidéo, compilé une seule fois
+    
+    L'extension est lue sur le dernier segment du chemin (et non cherchée
+    n'importe où dans l'URL), et les patterns sont recherchés comme mots
+    entiers dans le chemin et la query string, jamais dans le nom d'hôte:
+    '/posts' ne correspond plus à '.ts' et 'media.cdn.com' à 'media'.
+    """
+    
+    # Extensions de ressources statiques qui ne sont jamais des flux vidéo
+    STATIC_EXTENSIONS = {
+        '.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico', '.bmp', '.avif',
+        '.css', '.js', '.mjs', '.json', '.woff', '.woff2', '.ttf', '.otf', '.eot',
+        '.html', '.htm', '.xml', '.txt', '.map',
+    }
+    
+    def __init__(self, extensions=None, patterns=None, rules=None, static_extensions=None):
+        """
+        Initialise le classifieur
+        
+        Args:
+            extensions: Extensions de flux vidéo (défaut: VideoScraper.VIDEO_EXTENSIONS)
+            patterns: Mots-clés d'URLs vidéo (défaut: VideoScraper.VIDEO_PATTERNS)
+            rules: Expressions régulières supplémentaires, appliquées à l'URL complète
+            static_extensions: Extensions jamais considérées comme vidéo
+        """
+        self.extensions: Set[str] = set()
+        self.patterns: List[str] = []
+        self.rules: List[str] = []
+        self.static_extensions: Set[str] = set()
+        
+        self.add_extensions(*(VideoScraper.VIDEO_EXTENSIONS if extensions is None else extensions))
+        self.add_patterns(*(VideoScraper.VIDEO_PATTERNS if patterns is None else patterns))
+        self.add_rules(*(rules or []))
+        self.exclude_extensions(*(self.STATIC_EXTENSIONS if static_extensions is None else static_extensions))
+    
+    @staticmethod
+    def _normalize_extension(ext: str) -> str:
+        """Met une extension sous la forme '.ext' en minuscules"""
+        ext = ext.lower().strip()
+        return ext if ext.startswith('.') else '.' + ext
+    
+    def add_extensions(self, *extensions: str):
+        """Ajoute des extensions de flux vidéo"""
+        self.extensions.update(self._normalize_extension(ext) for ext in extensions)
+        self.static_extensions -= self.extensions
+        self._compile()
+    
+    def add_patterns(self, *patterns: str):
+        """Ajoute des mots-clés d'URLs vidéo"""
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if pattern not in self.patterns:
+                self.patterns.append(pattern)
+        self._compile()
+    
+    def add_rules(self, *rules: str):
+        """Ajoute des expressions régulières (insensibles à la casse) sur l'URL complète"""
+        self.rules.extend(rules)
+        self._compile()
+    
+    def exclude_extensions(self, *extensions: str):
+        """Déclare des extensions qui ne sont jamais des flux vidéo"""
+        self.static_extensions.update(self._normalize_extension(ext) for ext in extensions)
+        self.static_extensions -= self.extensions
+        self._compile()
+    
+    def _compile(self):
+        """
+        Compile toutes les règles en une seule expression régulière
+        
+        L'expression saute le schéma et l'hôte puis capture le groupe 'hit' si
+        le chemin se termine par une extension vidéo, ou si (hors extension
+        statique) une extension apparaît dans le chemin ou la query string, ou
+        un mot-clé dans le dernier segment du chemin ou la query string. Un
+        mot-clé de répertoire ('/video/42-trailer', '/media/') ne suffit pas.
+        Elle correspond toujours à la ligne entière, ce qui permet de classer
+        un lot d'URLs séparées par des retours à la ligne en un seul appel à
+        findall().
+        """
+        def _alternation(items):
+            return '|'.join(sorted((re.escape(item) for item in items), key=len, reverse=True))
+        
+        exts = _alternation(ext[1:] for ext in self.extensions) or '(?!)'
+        static = _alternation(ext[1:] for ext in self.static_extensions) or '(?!)'
+        words = _alternation(self.patterns) or '(?!)'
+        
+        # Mot entier: 'chunk_1' et 'playlist' correspondent, 'videos' et 'multimedia' non
+        word = rf'(?<![a-z0-9])(?:{words})(?![a-z])'
+        # Extension suivie d'une fin de segment (ex: '?file=a.m3u8&x=1'), mot-clé
+        # dans le nom de la ressource ('/live/1/playlist'), ou dans la query string
+        anywhere = (
+            rf'[^#\n]*?\.(?:{exts})(?=$|[/?#&;=,])'
+            rf'|(?:[^?#\n]*/)?[^/?#\n]*?{word}[^/?#\n]*(?=[?#\n]|$)'
+            rf'|[^?#\n]*\?[^#\n]*?{word}'
+        )
+        
+        self._matcher = re.compile(
+            r'^(?:[a-z][a-z0-9+.\-]*:)?(?://[^/?#\n]*)?'
+            r'(?:(?P<hit>'
+            rf'[^?#\n]*\.(?:{exts})(?=[?#\n]|$)'
+            rf'|(?![^?#\n]*\.(?:{static})(?=[?#\n]|$))(?:{anywhere})'
+            r')|)[^\n]*$',
+            re.MULTILINE
+        )
+        self._rules = re.compile('|'.join(f'(?:{rule})' for rule in self.rules), re.IGNORECASE) \
+            if self.rules else None
+    
+    def is_video_url(self, url: str) -> bool:
+        """
+        Détermine si une URL correspond à un flux vidéo
+        
+        Args:
+            url: URL à vérifier
+            
+        Returns:
+            True si l'URL est un flux vidéo
+        """
+        if self._rules is not None and self._rules.search(url):
+            return True
+        return self._matcher.match(url.lower()).group('hit') is not None
+    
+    __call__ = is_video_url
+    
+    def classify_many(self, urls) -> List[bool]:
+        """
+        Classe un lot d'URLs en un seul passage de l'expression régulière
+        
+        Args:
+            urls: Itérable d'URLs
+            
+        Returns:
+            Liste de booléens, dans le même ordre que les URLs
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        
+        text = '\n'.join(urls)
+        if self._rules is not None or text.count('\n') != len(urls) - 1:
+            is_video_url = self.is_video_url
+            return [is_video_url(url) for url in urls]
+        
+        return [bool(hit) for hit in self._matcher.findall(text.lower())]
+    
+    def filter(self, urls) -> List[str]:
+        """
+        Garde uniquement les URLs de flux vidéo d'un lot
+        
+        Args:
+            urls: Itérable d'URLs
+            
+        Returns:
+            Liste des URLs de flux vidéo
+        """
+        is_video_url = self.is_video_url
+        return [url for url in urls if url and is_video_url(url)]
+
+
+class DriverCache:
+    """
+    Cache des chemins de drivers résolus par webdriver_manager
+    
+    ChromeDriverManager().install() (et ses équivalents) interroge le réseau
+    pour trouver la version à utiliser à chaque appel. Le chemin obtenu est
+    gardé en mémoire pour le processus et sur disque pour les suivants; en
+    mode hors ligne, un driver en cache est utilisé sans jamais appeler le
+    manager.
+    """
+    
+    CACHE_DIR = os.environ.get('SCRAPPEUR_CACHE_DIR') or \
+        os.path.join(os.path.expanduser('~'), '.cache', 'scrappeur')
+    
+    # Durée de validité d'un chemin en cache avant nouvelle vérification (secondes)
+    MAX_AGE = 24 * 3600
+    
+    # Classe de webdriver_manager par navigateur (module, classe), importée à la demande
+    MANAGERS = {
+        'chrome': ('webdriver_manager.chrome', 'ChromeDriverManager'),
+        'firefox': ('webdriver_manager.firefox', 'GeckoDriverManager'),
+        'edge': ('webdriver_manager.microsoft', 'EdgeChromiumDriverManager'),
+    }
+    
+    # Nom de l'exécutable cherché dans le PATH en dernier recours (hors ligne)
+    EXECUTABLES = {'chrome': 'chromedriver', 'firefox': 'geckodriver', 'edge': 'msedgedriver'}
+    
+    _paths: Dict[str, str] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _cache_file(cls) -> str:
+        return os.path.join(cls.CACHE_DIR, 'drivers.json')
+    
+    @classmethod
+    def _load(cls) -> Dict[str, Dict]:
+        try:
+            with open(cls._cache_file(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @classmethod
+    def _store(cls, browser: str, path: str):
+        entries = cls._load()
+        entries[browser] = {'path': path, 'resolved': time.time()}
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            temporary = cls._cache_file() + '.tmp'
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(temporary, cls._cache_file())
+        except OSError as e:
+            logger.debug(f"Cache des drivers non écrit: {e}")
+    
+    @classmethod
+    def resolve(cls, browser: str, offline: bool = False) -> str:
+        """
+        Renvoie le chemin du driver d'un navigateur
+        
+        Args:
+            browser: 'chrome', 'firefox' ou 'edge'
+            offline: N'appelle jamais webdriver_manager (cache ou PATH uniquement)
+            
+        Returns:
+            Chemin de l'exécutable du driver
+        """
+        with cls._lock:
+            path = cls._paths.get(browser)
+            if path and os.path.exists(path):
+                return path
+            
+            entry = cls._load().get(browser, {})
+            path = entry.get('path')
+            fresh = time.time() - entry.get('resolved', 0) < cls.MAX_AGE
+            if path and os.path.exists(path) and (fresh or offline):
+                cls._paths[browser] = path
+                return path
+            
+            if offline:
+                path = shutil.which(cls.EXECUTABLES[browser])
+                if not path:
+                    raise RuntimeError(f"Mode hors ligne: aucun driver {browser} en cache ni dans le PATH")
+            else:
+                module, name = cls.MANAGERS[browser]
+                path = getattr(importlib.import_module(module), name)().install()
+                cls._store(browser, path)
+            
+            cls._paths[browser] = path
+            return path
+    
+    @classmethod
+    def clear(cls):
+        """Oublie les chemins en cache (mémoire et disque)"""
+        with cls._lock:
+            cls._paths.clear()
+            try:
+                os.remove(cls._cache_file())
+            except OSError:
+                pass
+
+
+class UserAgentPool:
+    """
+    Réserve de User-Agents construite une seule fois
+    
+    Construire fake_useragent.UserAgent() charge et analyse toute sa base à
+    chaque instanciation. Un échantillon est tiré une fois, partagé par tous
+    les scrapers du processus et gardé sur disque à côté du cache des drivers.
+    Expose .random comme UserAgent.
+    """
+    
+    SIZE = 50
+    MAX_AGE = 7 * 24 * 3600
+    DEFAULT_USER_AGENT = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+    )
+    
+    _shared: Optional['UserAgentPool'] = None
+    _lock = threading.Lock()
+    
+    def __init__(self, user_agents: List[str]):
+        self.user_agents = user_agents or [self.DEFAULT_USER_AGENT]
+    
+    @property
+    def random(self) -> str:
+        """Un User-Agent tiré au hasard"""
+        return random.choice(self.user_agents)
+    
+    @classmethod
+    def _build(cls) -> List[str]:
+        cache_file = os.path.join(DriverCache.CACHE_DIR, 'user_agents.json')
+        try:
+            if time.time() - os.path.getmtime(cache_file) < cls.MAX_AGE:
+                with open(cache_file, encoding='utf-8') as f:
+                    user_agents = json.load(f)
+                if user_agents:
+                    return user_agents
+        except (OSError, ValueError):
+            pass
+        
+        try:
+            from fake_useragent import UserAgent
+            generator = UserAgent()
+            user_agents = sorted({generator.random for _ in range(cls.SIZE)})
+        except Exception as e:
+            logger.warning(f"fake_useragent indisponible ({e}): User-Agent par défaut")
+            return [cls.DEFAULT_USER_AGENT]
+        
+        try:
+            os.makedirs(DriverCache.CACHE_DIR, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(user_agents, f)
+        except OSError as e:
+            logger.debug(f"Cache des User-Agents non écrit: {e}")
+        return user_agents
+    
+    @classmethod
+    def shared(cls) -> 'UserAgentPool':
+        """Réserve commune au processus (construite au premier appel)"""
+        with cls._lock:
+            if cls._shared is None:
+                cls._shared = cls(cls._build())
+            return cls._shared
+
+
+class BlockingProfile:
+    """
+    Ressources que le navigateur ne télécharge pas
+    
+    Seuls le lecteur et ses requêtes réseau comptent pour la détection: les
+    images, polices, publicités et scripts de mesure d'audience ne font que
+    ralentir les pages. Sous Chrome/Edge les motifs d'URL sont appliqués par
+    Network.setBlockedURLs (DevTools); une requête bloquée apparaît quand même
+    dans le log de performance, si bien qu'un flux dont on bloque les segments
+    reste détecté dès sa première requête, sans télécharger la vidéo. Firefox
+    ne bloque que par type (images, polices) via ses préférences.
+    """
+    
+    # Motifs DevTools ('*' = n'importe quelle suite de caractères) par type de ressource
+    RESOURCE_PATTERNS = {
+        'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp'],
+        'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+        'stylesheet': ['*.css'],
+    }
+    
+    # Segments et fichiers média: la première requête suffit à la détection
+    MEDIA_PATTERNS = ['*.ts', '*.m4s', '*.m4v', '*.m4a', '*.aac', '*.cmfv', '*.cmfa', '*.mp4', '*.webm']
+    
+    # Régies publicitaires et mesure d'audience courantes
+    AD_PATTERNS = [
+        '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*', '*adservice.google.*',
+        '*google-analytics.com*', '*googletagmanager.com*', '*amazon-adsystem.com*', '*adnxs.com*',
+        '*criteo.com*', '*criteo.net*', '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*',
+        '*hotjar.com*', '*facebook.net*', '*connect.facebook.*', '*quantserve.com*', '*smartadserver.com*',
+    ]
+    
+    def __init__(self, resource_types=('image', 'font'), url_patterns=None,
+                 abort_media_segments: bool = True):
+        """
+        Initialise le profil
+        
+        Args:
+            resource_types: Types bloqués parmi 'image', 'font', 'stylesheet'
+            url_patterns: Motifs d'URL bloqués (défaut: AD_PATTERNS, [] = aucun)
+            abort_media_segments: Bloque segments et fichiers média (leur
+                première requête reste visible dans le log réseau)
+        """
+        unknown = set(resource_types) - set(self.RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Type(s) de ressource inconnu(s): {', '.join(sorted(unknown))}")
+        
+        self.resource_types = tuple(resource_types)
+        self.url_patterns = list(self.AD_PATTERNS if url_patterns is None else url_patterns)
+        self.abort_media_segments = abort_media_segments
+    
+    def chrome_patterns(self) -> List[str]:
+        """Motifs pour Network.setBlockedURLs (avec et sans query string)"""
+        patterns = []
+        extensions = [pattern for resource_type in self.resource_types
+                      for pattern in self.RESOURCE_PATTERNS[resource_type]]
+        if self.abort_media_segments:
+            extensions += self.MEDIA_PATTERNS
+        for pattern in extensions:
+            patterns += [pattern, pattern + '?*']
+        return patterns + self.url_patterns
+    
+    def chrome_prefs(self) -> Dict[str, int]:
+        """Préférences Chrome/Edge (les images sont bloquées à la source)"""
+        if 'image' in self.resource_types:
+            return {'profile.managed_default_content_settings.images': 2}
+        return {}
+    
+    def firefox_prefs(self) -> Dict:
+        """Préférences Firefox équivalentes (par type uniquement)"""
+        prefs = {}
+        if 'image' in self.resource_types:
+            prefs['permissions.default.image'] = 2
+        if 'font' in self.resource_types:
+            prefs['gfx.downloadable_fonts.enabled'] = False
+        return prefs
+
+
+class NetworkCapture(ABC):
+    """
+    Capture réseau poussée par le navigateur (au lieu de scruter le log)
+    
+    Un thread lit en continu une connexion WebSocket vers le navigateur
+    (DevTools pour Chrome/Edge, WebDriver BiDi pour Firefox). Les événements
+    sont convertis au format du log de performance ('Network.requestWillBeSent'...,
+    avec 'webview' = onglet d'origine), si bien que le reste du scraper les
+    traite comme avant, et chaque requête est classée dès son arrivée:
+    stream_seen est levé au premier flux pour terminer l'attente aussitôt.
+    """
+    
+    NETWORK_METHODS = (
+        'Network.requestWillBeSent', 'Network.responseReceived',
+        'Network.loadingFinished', 'Network.loadingFailed',
+    )
+    
+    # Délai de lecture du WebSocket, pour que close() soit pris en compte
+    RECV_TIMEOUT = 0.5
+    
+    def __init__(self, ws_url: str, classifier: 'VideoUrlClassifier'):
+        """
+        Ouvre la connexion et démarre la lecture des événements
+        
+        Args:
+            ws_url: URL WebSocket du navigateur
+            classifier: Classifieur d'URLs vidéo
+        """
+        try:
+            importlib.import_module('websocket')
+        except ImportError:
+            raise RuntimeError("websocket-client est requis pour la capture réseau par événements") from None
+        
+        self.classifier = classifier
+        self.stream_seen = threading.Event()
+        self.stats: Dict[str, int] = {'events': 0, 'streams': 0}
+        self._events = deque()
+        self._send_lock = threading.Lock()
+        self._next_id = 0
+        self._closed = threading.Event()
+        
+        self.ws = websocket.create_connection(ws_url, timeout=10, suppress_origin=True)
+        self.ws.settimeout(self.RECV_TIMEOUT)
+        self._subscribe()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def connect(cls, driver, browser: str, classifier: 'VideoUrlClassifier') -> 'NetworkCapture':
+        """
+        Ouvre la capture adaptée au navigateur d'un driver déjà démarré
+        
+        Args:
+            driver: WebDriver démarré
+            browser: 'chrome', 'edge' ou 'firefox'
+            classifier: Classifieur d'URLs vidéo
+            
+        Returns:
+            CdpNetworkCapture (Chrome/Edge) ou BidiNetworkCapture (Firefox)
+        """
+        capabilities = driver.capabilities
+        if browser == 'firefox':
+            ws_url = capabilities.get('webSocketUrl')
+            if not isinstance(ws_url, str):
+                raise RuntimeError("WebDriver BiDi non activé (capacité webSocketUrl absente)")
+            return BidiNetworkCapture(ws_url, classifier)
+        
+        key = 'ms:edgeOptions' if browser == 'edge' else 'goog:chromeOptions'
+        address = capabilities.get(key, {}).get('debuggerAddress')
+        if not address:
+            raise RuntimeError("Adresse DevTools du navigateur inconnue")
+        return CdpNetworkCapture(address, classifier)
+    
+    def send(self, method: str, params: Dict = None, **extra) -> int:
+        """Envoie une commande au navigateur (sans attendre la réponse)"""
+        with self._send_lock:
+            self._next_id += 1
+            message = {'id': self._next_id, 'method': method, 'params': params or {}}
+            message.update(extra)
+            self.ws.send(json.dumps(message))
+            return self._next_id
+    
+    @abstractmethod
+    def _subscribe(self):
+        """Abonnement aux événements réseau (selon le protocole)"""
+    
+    @abstractmethod
+    def _handle(self, message: Dict):
+        """Traite un message reçu (selon le protocole)"""
+    
+    def _run(self):
+        """Boucle du thread de lecture: reçoit les messages jusqu'à close()"""
+        while not self._closed.is_set():
+            try:
+                raw = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            except (websocket.WebSocketException, OSError):
+                break
+            
+            try:
+                self._handle(_json_loads(raw))
+            except Exception as e:
+                logger.debug(f"Événement réseau ignoré: {e}")
+    
+    def _push(self, event: Dict):
+        """Ajoute un événement normalisé et signale les flux dès leur arrivée"""
+        self._events.append(event)
+        self.stats['events'] += 1
+        
+        params = event['params']
+        if event['method'] == 'Network.requestWillBeSent':
+            is_stream = self.classifier.is_video_url(params.get('request', {}).get('url', ''))
+        elif event['method'] == 'Network.responseReceived':
+            mime_type = params.get('response', {}).get('mimeType', '')
+            is_stream = 'video' in mime_type or 'mpegurl' in mime_type
+        else:
+            is_stream = False
+        
+        if is_stream:
+            self.stats['streams'] += 1
+            self.stream_seen.set()
+    
+    def drain(self) -> List[Dict]:
+        """Renvoie et oublie les événements reçus depuis le dernier appel"""
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        return events
+    
+    def wait(self, timeout: float) -> bool:
+        """
+        Attend au plus timeout secondes, moins si un flux arrive
+        
+        Returns:
+            True si un flux est arrivé pendant l'attente
+        """
+        if self.stream_seen.wait(timeout):
+            self.stream_seen.clear()
+            return True
+        return False
+    
+    def close(self):
+        """Arrête la lecture et ferme la connexion"""
+        self._closed.set()
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+        self._thread.join(timeout=2)
+
+
+class CdpNetworkCapture(NetworkCapture):
+    """Capture par le protocole DevTools (Chrome/Edge), tous onglets compris"""
+    
+    def __init__(self, debugger_address: str, classifier: 'VideoUrlClassifier'):
+        """
+        Args:
+            debugger_address: Adresse DevTools ('localhost:port', capacité debuggerAddress)
+            classifier: Classifieur d'URLs vidéo
+        """
+        version = requests.get(f"http://{debugger_address}/json/version", timeout=5).json()
+        # Session DevTools -> onglet (targetId, égal au handle de fenêtre)
+        self._sessions: Dict[str, str] = {}
+        super().__init__(version['webSocketDebuggerUrl'], classifier)
+    
+    def _subscribe(self):
+        """Découverte des onglets, qui sont suivis un par un (voir _handle)"""
+        # targetCreated est émis pour les onglets existants puis pour chaque nouvel onglet
+        self.send('Target.setDiscoverTargets', {'discover': True})
+    
+    def _handle(self, message: Dict):
+        """Relaie les événements Network.* et s'attache à chaque onglet et iframe hors processus"""
+        method = message.get('method')
+        params = message.get('params', {})
+        
+        if method in self.NETWORK_METHODS:
+            event = {'method': method, 'params': params}
+            target = self._sessions.get(message.get('sessionId'))
+            if target:
+                event['webview'] = target
+            self._push(event)
+        elif method == 'Target.targetCreated':
+            info = params.get('targetInfo', {})
+            if info.get('type') == 'page':
+                self.send('Target.attachToTarget', {'targetId': info['targetId'], 'flatten': True})
+        elif method == 'Target.attachedToTarget':
+            session_id = params['sessionId']
+            parent = message.get('sessionId')
+            if parent:
+                # Iframe hors processus, rattachée automatiquement à son onglet:
+                # ses requêtes sont attribuées à l'onglet (frameId désigne l'iframe)
+                self._sessions[session_id] = self._sessions.get(parent)
+            else:
+                self._sessions[session_id] = params.get('targetInfo', {}).get('targetId')
+            self.send('Network.enable', {}, sessionId=session_id)
+            self.send('Target.setAutoAttach', {'autoAttach': True, 'waitForDebuggerOnStart': False,
+                                               'flatten': True}, sessionId=session_id)
+        elif method == 'Target.detachedFromTarget':
+            self._sessions.pop(params.get('sessionId'), None)
+
+
+class BidiNetworkCapture(NetworkCapture):
+    """Capture par WebDriver BiDi (Firefox)"""
+    
+    # Événement BiDi -> méthode équivalente du log de performance
+    BIDI_EVENTS = {
+        'network.beforeRequestSent': 'Network.requestWillBeSent',
+        'network.responseStarted': 'Network.responseReceived',
+        'network.responseCompleted': 'Network.loadingFinished',
+        'network.fetchError': 'Network.loadingFailed',
+    }
+    
+    def _subscribe(self):
+        """Abonnement aux événements réseau BiDi de tous les onglets"""
+        self.send('session.subscribe', {'events': list(self.BIDI_EVENTS)})
+    
+    def _handle(self, message: Dict):
+        """Convertit un événement BiDi au format du log de performance"""
+        method = self.BIDI_EVENTS.get(message.get('method'))
+        if method is None:
+            return
+        
+        params = message.get('params', {})
+        request = params.get('request', {})
+        converted = {'requestId': request.get('request')}
+        if method == 'Network.requestWillBeSent':
+            converted['request'] = {'url': request.get('url', '')}
+        elif method == 'Network.responseReceived':
+            response = params.get('response', {})
+            converted['response'] = {'url': response.get('url') or request.get('url', ''),
+                                     'mimeType': response.get('mimeType', '')}
+        
+        event = {'method': method, 'params': converted}
+        if params.get('context'):
+            event['webview'] = params['context']
+        self._push(event)
+
+
+def _make_session(pool_size: int = 10, user_agent: str = None) -> 'requests.Session':
+    """
+    Crée une session HTTP dont les connexions sont réutilisées entre requêtes
+    
+    Args:
+        pool_size: Nombre de connexions conservées par hôte
+        user_agent: User-Agent envoyé (None = celui de requests)
+        
+    Returns:
+        Session requests configurée
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    return session
+
+
+class _PageParser(HTMLParser):
+    """Extrait liens, sources vidéo, iframes et scripts d'une page HTML"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.base_href = None
+        self.links: List[Tuple[str, str]] = []
+        self.media: List[str] = []
+        self.iframes: List[str] = []
+        self.scripts: List[str] = []
+        self.script_count = 0
+        self.has_video_tag = False
+        self._anchor = None
+        self._in_script = False
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'base' and attrs.get('href') and self.base_href is None:
+            self.base_href = attrs['href']
+        elif tag == 'a' and attrs.get('href'):
+            self._anchor = [attrs['href'], []]
+        elif tag in ('video', 'source', 'audio'):
+            self.has_video_tag = self.has_video_tag or tag == 'video'
+            self.media.extend(attrs[key] for key in ('src', 'data-src') if attrs.get(key))
+        elif tag == 'iframe':
+            self.iframes.extend(attrs[key] for key in ('src', 'data-src') if attrs.get(key))
+        elif tag == 'script':
+            self.script_count += 1
+            self._in_script = not attrs.get('src')
+            if attrs.get('src'):
+                self.scripts.append(attrs['src'])
+    
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._anchor is not None:
+            href, text = self._anchor
+            self.links.append((href, ' '.join(''.join(text).split())[:200]))
+            self._anchor = None
+        elif tag == 'script':
+            self._in_script = False
+    
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts.append(data)
+        elif self._anchor is not None:
+            self._anchor[1].append(data)
+
+
+class HttpPage:
+    """Résultat de l'analyse HTTP d'une page (sans navigateur)"""
+    
+    def __init__(self, url: str, links: List[Tuple[str, str]], media: Set[str],
+                 iframes: List[str], has_player: bool, script_count: int):
+        self.url = url
+        self.links = links
+        self.media = media
+        self.iframes = iframes
+        self.has_player = has_player
+        self.script_count = script_count
+
+
+class HttpFetcher:
+    """
+    Récupération légère des pages par HTTP, sans navigateur
+    
+    Sert de voie rapide pour les pages de navigation: liens et URLs de flux
+    évidentes (<video src>, .m3u8 dans les scripts inline) sont extraits du
+    HTML brut avec une session requests dont les connexions sont réutilisées.
+    """
+    
+    # Indices de la présence d'un lecteur vidéo dans le HTML
+    PLAYER_MARKERS = (
+        '<video', 'jwplayer', 'videojs', 'video-js', 'hls.js', 'hls.min.js', 'dash.js',
+        'dash.all.min.js', 'shaka-player', 'flowplayer', 'plyr', 'clappr', 'mediaelement',
+    )
+    
+    # Iframes de lecteurs intégrés (hébergeurs vidéo, sous-domaine ou chemin player/embed);
+    # les iframes de mesure d'audience, de publicité ou de consentement ne comptent pas
+    PLAYER_IFRAME_RE = re.compile(
+        r'^(?:https?:)?//(?:[^/?#]*\.)?(?:'
+        r'youtube(?:-nocookie)?\.com|vimeo\.com|dailymotion\.com|dai\.ly|twitch\.tv|'
+        r'streamable\.com|wistia\.(?:com|net)|brightcove\.net|jwplatform\.com|jwplayer\.com|'
+        r'vidyard\.com|kaltura\.com|rumble\.com|odysee\.com|(?:player|players|embed|video|vod)[.-][^/?#]*'
+        r')(?:[:/?#]|$)'
+        r'|/(?:embed|players?|videoembed|plugins/video)(?:[/._?#-]|$)',
+        re.IGNORECASE
+    )
+    
+    # URLs de flux dans les scripts inline (y compris JSON échappé: https:\/\/...)
+    INLINE_MEDIA_RE = re.compile(
+        r'''["'](?P<url>(?:https?:)?(?:\\?/){1,2}[^"'\s<>]*?\.(?:m3u8|mpd|mp4|webm)(?:\?[^"'\s<>]*)?)["']''',
+        re.IGNORECASE
+    )
+    
+    def __init__(self, user_agent: str = None, timeout: float = 10, pool_size: int = 10,
+                 max_bytes: int = 2_000_000):
+        """
+        Initialise le fetcher
+        
+        Args:
+            user_agent: User-Agent envoyé
+            timeout: Délai maximal par requête (secondes)
+            pool_size: Nombre de connexions conservées par hôte
+            max_bytes: Taille maximale lue par page (octets)
+        """
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.session = _make_session(pool_size, user_agent)
+    
+    def fetch(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        Télécharge une page HTML
+        
+        Args:
+            url: URL de la page
+            
+        Returns:
+            Tuple (URL finale après redirections, HTML), ou None si la page
+            n'est pas du HTML ou n'a pas pu être téléchargée
+        """
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status_code >= 400 or 'html' not in content_type:
+                    return None
+                
+                chunks, size = [], 0
+                for chunk in response.iter_content(65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+                
+                html = b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+                return response.url, html
+        except requests.RequestException as e:
+            logger.debug(f"Échec HTTP pour {url}: {e}")
+            return None
+    
+    def parse(self, url: str, html: str) -> HttpPage:
+        """
+        Analyse le HTML d'une page
+        
+        Args:
+            url: URL de la page (pour résoudre les liens relatifs)
+            html: Contenu HTML
+            
+        Returns:
+            HttpPage avec les liens (URL absolue, texte), les URLs de média et
+            la présence d'un lecteur
+        """
+        parser = _PageParser()
+        try:
+            parser.feed(html)
+            parser.close()
+        except Exception as e:
+            logger.debug(f"HTML mal formé sur {url}: {e}")
+        
+        base = urljoin(url, parser.base_href) if parser.base_href else url
+        
+        links = []
+        for href, text in parser.links:
+            if href.startswith('#') or href.startswith('javascript:'):
+                continue
+            links.append((urljoin(base, href), text))
+        
+        media = {urljoin(base, src) for src in parser.media}
+        for script in parser.scripts:
+            for match in self.INLINE_MEDIA_RE.finditer(script):
+                media.add(urljoin(base, match.group('url').replace('\\/', '/')))
+        
+        iframes = [urljoin(base, src) for src in parser.iframes]
+        html_lower = html.lower()
+        has_player = parser.has_video_tag or \
+            any(self.PLAYER_IFRAME_RE.search(src) for src in iframes) or \
+            any(marker in html_lower for marker in self.PLAYER_MARKERS)
+        
+        return HttpPage(
+            url=url,
+            links=links,
+            media=media,
+            iframes=iframes,
+            has_player=has_player,
+            script_count=parser.script_count,
+        )
+    
+    def close(self):
+        """Ferme les connexions de la session"""
+        self.session.close()
+
+
+class StreamRecord:
+    """
+    Un flux vidéo: manifeste HLS/DASH avec ses variantes, fichier isolé, ou
+    groupe de segments dont le manifeste n'a pas été vu
+    """
+    
+    def __init__(self, url: str, kind: str):
+        """
+        Args:
+            url: URL du manifeste, du fichier, ou répertoire des segments
+            kind: 'hls', 'dash', 'file' ou 'segments'
+        """
+        self.url = url
+        self.kind = kind
+        # Variantes: {'url', 'bandwidth', 'resolution', 'codecs', 'type', 'segments'}
+        self.variants: List[Dict] = []
+        # Nombre de segments annoncés par le(s) manifeste(s)
+        self.segment_count = 0
+        # Durée totale en secondes (si connue)
+        self.duration: Optional[float] = None
+        self.live = False
+        # URLs de segments détectées rattachées à ce flux
+        self.segments: List[str] = []
+        self.error: Optional[str] = None
+        # Résultat de StreamValidator.probe() (None = non vérifié)
+        self.probe: Optional[Dict] = None
+    
+    @property
+    def probe_url(self) -> str:
+        """URL à sonder pour vérifier le flux (premier segment pour un groupe de segments)"""
+        return self.segments[0] if self.kind == 'segments' and self.segments else self.url
+    
+    def to_dict(self) -> Dict:
+        """Représentation sérialisable (JSON) du flux"""
+        return {
+            'url': self.url,
+            'kind': self.kind,
+            'variants': self.variants,
+            'segment_count': self.segment_count,
+            'duration': self.duration,
+            'live': self.live,
+            'detected_segments': len(self.segments),
+            'error': self.error,
+            'probe': self.probe,
+        }
+    
+    def summary(self) -> str:
+        """Résumé d'une ligne pour le log et le fichier de résultats"""
+        details = []
+        if self.variants:
+            details.append(f"{len(self.variants)} variante(s)")
+            best = max(self.variants, key=lambda variant: variant.get('bandwidth') or 0)
+            if best.get('resolution'):
+                details.append(f"jusqu'à {best['resolution']}")
+        if self.segment_count:
+            details.append(f"{self.segment_count} segment(s)")
+        if self.live:
+            details.append("direct")
+        if self.segments:
+            details.append(f"{len(self.segments)} segment(s) capté(s)")
+        if self.error:
+            details.append(f"erreur: {self.error}")
+        if self.probe is not None and not self.probe['ok']:
+            details.append(f"invalide: {self.probe['error']}")
+        suffix = f" ({', '.join(details)})" if details else ''
+        return f"[{self.kind}] {self.url}{suffix}"
+
+
+class ManifestExpander:
+    """
+    Regroupe les URLs détectées par flux
+    
+    Les manifestes .m3u8/.mpd sont téléchargés en parallèle (session requests
+    partagée), leurs variantes décrites (débit, résolution, codecs, nombre de
+    segments) et chaque URL de segment (.ts, .m4s...) est rattachée à son
+    manifeste au lieu d'être listée seule.
+    """
+    
+    MANIFEST_RE = re.compile(r'\.(?P<ext>m3u8|mpd)(?:$|[?#])', re.IGNORECASE)
+    SEGMENT_RE = re.compile(r'\.(?:ts|m4s|m4v|m4a|aac|cmfv|cmfa|vtt)(?:$|[?#])', re.IGNORECASE)
+    
+    # Attributs HLS: CLE=valeur ou CLE="valeur, avec virgules"
+    HLS_ATTRIBUTE_RE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+    
+    # Durée ISO 8601 des MPD (ex: PT1H2M3.5S)
+    ISO_DURATION_RE = re.compile(
+        r'P(?:(?P<days>[\d.]+)D)?(?:T(?:(?P<hours>[\d.]+)H)?(?:(?P<minutes>[\d.]+)M)?(?:(?P<seconds>[\d.]+)S)?)?'
+    )
+    
+    def __init__(self, user_agent: str = None, timeout: float = 10, pool_size: int = 8,
+                 max_bytes: int = 5_000_000):
+        """
+        Initialise l'expandeur
+        
+        Args:
+            user_agent: User-Agent envoyé
+            timeout: Délai maximal par requête (secondes)
+            pool_size: Nombre de téléchargements simultanés (et de connexions par hôte)
+            max_bytes: Taille maximale lue par manifeste (octets)
+        """
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.pool_size = pool_size
+        self.session = _make_session(pool_size, user_agent)
+    
+    @classmethod
+    def is_manifest(cls, url: str) -> bool:
+        """True si l'URL désigne un manifeste HLS ou DASH"""
+        return bool(cls.MANIFEST_RE.search(urlsplit(url).path + '?'))
+    
+    @classmethod
+    def is_segment(cls, url: str) -> bool:
+        """True si l'URL désigne un segment de flux segmenté"""
+        return bool(cls.SEGMENT_RE.search(urlsplit(url).path + '?'))
+    
+    @staticmethod
+    def _strip_query(url: str) -> str:
+        """URL sans query ni fragment (les jetons changent d'un segment à l'autre)"""
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+    
+    @staticmethod
+    def _directory(url: str) -> str:
+        """Répertoire d'une URL (sans query), terminé par '/'"""
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path.rsplit('/', 1)[0] + '/', '', ''))
+    
+    def _fetch(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Télécharge un manifeste
+        
+        Returns:
+            Tuple (texte, erreur); le texte est None en cas d'échec
+        """
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code >= 400:
+                    return None, f"HTTP {response.status_code}"
+                
+                chunks, size = [], 0
+                for chunk in response.iter_content(65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+                return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace'), None
+        except requests.RequestException as e:
+            return None, type(e).__name__
+    
+    def _fetch_all(self, urls: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Télécharge plusieurs manifestes en parallèle"""
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self._fetch, urls)))
+    
+    def _parse_hls_attributes(self, line: str) -> Dict[str, str]:
+        """Attributs d'une balise HLS (#EXT-X-STREAM-INF:...)"""
+        attributes = line.split(':', 1)[1] if ':' in line else ''
+        return {key: value.strip('"') for key, value in self.HLS_ATTRIBUTE_RE.findall(attributes)}
+    
+    def _parse_hls(self, url: str, text: str) -> Tuple[List[Dict], List[str], Optional[float], bool]:
+        """
+        Analyse une playlist HLS
+        
+        Args:
+            url: URL de la playlist (pour résoudre les URIs relatives)
+            text: Contenu de la playlist
+            
+        Returns:
+            Tuple (variantes d'une playlist maître, segments d'une playlist
+            média, durée en secondes, playlist en direct)
+        """
+        variants, segments = [], []
+        duration, ended = 0.0, False
+        pending_variant = None
+        
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#EXT-X-STREAM-INF'):
+                attributes = self._parse_hls_attributes(line)
+                pending_variant = {
+                    'bandwidth': int(attributes['BANDWIDTH']) if attributes.get('BANDWIDTH', '').isdigit() else None,
+                    'resolution': attributes.get('RESOLUTION'),
+                    'codecs': attributes.get('CODECS'),
+                    'type': 'video',
+                }
+            elif line.startswith('#EXT-X-MEDIA'):
+                attributes = self._parse_hls_attributes(line)
+                if attributes.get('URI'):
+                    variants.append({
+                        'url': urljoin(url, attributes['URI']),
+                        'bandwidth': None,
+                        'resolution': None,
+                        'codecs': None,
+                        'type': attributes.get('TYPE', 'media').lower(),
+                    })
+            elif line.startswith('#EXT-X-MAP'):
+                attributes = self._parse_hls_attributes(line)
+                if attributes.get('URI'):
+                    segments.append(urljoin(url, attributes['URI']))
+            elif line.startswith('#EXTINF'):
+                try:
+                    duration += float(line.split(':', 1)[1].split(',', 1)[0])
+                except (IndexError, ValueError):
+                    pass
+            elif line.startswith('#EXT-X-ENDLIST'):
+                ended = True
+            elif not line.startswith('#'):
+                if pending_variant is not None:
+                    pending_variant['url'] = urljoin(url, line)
+                    variants.append(pending_variant)
+                    pending_variant = None
+                else:
+                    segments.append(urljoin(url, line))
+        
+        live = bool(segments) and not ended
+        return variants, segments, (round(duration, 3) if duration else None), live
+    
+    def _parse_iso_duration(self, value: Optional[str]) -> Optional[float]:
+        """Convertit une durée ISO 8601 (PT1M30S) en secondes"""
+        match = self.ISO_DURATION_RE.fullmatch(value or '')
+        if not match or not any(match.groupdict().values()):
+            return None
+        factors = {'days': 86400, 'hours': 3600, 'minutes': 60, 'seconds': 1}
+        return sum(float(match.group(name)) * factor for name, factor in factors.items() if match.group(name))
+    
+    def _parse_dash(self, url: str, text: str) -> Tuple[List[Dict], List[str], Optional[float], bool]:
+        """
+        Analyse un manifeste DASH (MPD)
+        
+        Returns:
+            Tuple (représentations, URLs de base des segments, durée en
+            secondes, manifeste dynamique)
+        """
+        root = ElementTree.fromstring(text)
+        duration = self._parse_iso_duration(root.get('mediaPresentationDuration'))
+        live = root.get('type') == 'dynamic'
+        
+        def _base(element, base):
+            base_url = element.find('{*}BaseURL')
+            return urljoin(base, base_url.text.strip()) if base_url is not None and base_url.text else base
+        
+        def _segment_count(*elements):
+            # La définition la plus proche de la représentation l'emporte
+            for element in elements:
+                segment_list = element.find('{*}SegmentList')
+                if segment_list is not None:
+                    return len(segment_list.findall('{*}SegmentURL'))
+                template = element.find('{*}SegmentTemplate')
+                if template is None:
+                    continue
+                timeline = template.find('{*}SegmentTimeline')
+                if timeline is not None:
+                    return sum(1 + max(int(s.get('r', 0)), 0) for s in timeline.findall('{*}S'))
+                if template.get('duration') and duration:
+                    timescale = int(template.get('timescale', 1))
+                    return math.ceil(duration * timescale / int(template.get('duration')))
+            return 0
+        
+        variants, bases = [], set()
+        base = _base(root, url)
+        for period in root.findall('{*}Period'):
+            period_base = _base(period, base)
+            for adaptation in period.findall('{*}AdaptationSet'):
+                adaptation_base = _base(adaptation, period_base)
+                for representation in adaptation.findall('{*}Representation'):
+                    representation_base = _base(representation, adaptation_base)
+                    bases.add(self._directory(representation_base))
+                    mime = representation.get('mimeType') or adaptation.get('mimeType') or ''
+                    width, height = representation.get('width'), representation.get('height')
+                    bandwidth = representation.get('bandwidth', '')
+                    variants.append({
+                        'url': representation_base if representation_base != url else None,
+                        'bandwidth': int(bandwidth) if bandwidth.isdigit() else None,
+                        'resolution': f"{width}x{height}" if width and height else None,
+                        'codecs': representation.get('codecs') or adaptation.get('codecs'),
+                        'type': mime.split('/', 1)[0] or adaptation.get('contentType') or 'media',
+                        'segments': _segment_count(representation, adaptation, period),
+                    })
+        
+        return variants, sorted(bases), duration, live
+    
+    def _expand_manifest(self, record: StreamRecord, text: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Remplit un StreamRecord depuis le manifeste téléchargé
+        
+        Returns:
+            Tuple (URLs de segments connues sans query, répertoires des segments)
+        """
+        known, directories = set(), {self._directory(record.url)}
+        
+        if record.kind == 'dash':
+            variants, bases, record.duration, record.live = self._parse_dash(record.url, text)
+            record.variants = variants
+            record.segment_count = sum(variant['segments'] for variant in variants)
+            # Profil « on-demand »: la BaseURL est le fichier média lui-même
+            known.update(self._strip_query(variant['url']) for variant in variants if variant['url'])
+            directories.update(bases)
+            return known, directories
+        
+        variants, segments, record.duration, record.live = self._parse_hls(record.url, text)
+        record.variants = variants
+        known.update(self._strip_query(segment) for segment in segments)
+        record.segment_count = len(segments)
+        
+        # Playlist maître: chaque variante est une playlist média à lire. Une même
+        # playlist peut être citée par plusieurs variantes (groupes AUDIO, CODECS)
+        playlists = list(dict.fromkeys(variant['url'] for variant in variants))
+        results = self._fetch_all(playlists)
+        counted = set()
+        for variant in variants:
+            directories.add(self._directory(variant['url']))
+            variant_text, error = results[variant['url']]
+            if variant_text is None:
+                variant['error'] = error
+                continue
+            _, variant_segments, variant_duration, live = self._parse_hls(variant['url'], variant_text)
+            variant['segments'] = len(variant_segments)
+            known.update(self._strip_query(segment) for segment in variant_segments)
+            if variant['url'] not in counted:
+                counted.add(variant['url'])
+                record.segment_count += len(variant_segments)
+            record.duration = record.duration or variant_duration
+            record.live = record.live or live
+        
+        return known, directories
+    
+    def collapse(self, urls, fetch: bool = True) -> List[StreamRecord]:
+        """
+        Regroupe des URLs détectées en flux
+        
+        Args:
+            urls: URLs détectées (manifestes, segments, fichiers)
+            fetch: Télécharge les manifestes pour décrire leurs variantes et
+                rattacher précisément leurs segments (sinon: par répertoire)
+            
+        Returns:
+            Liste de StreamRecord: un par manifeste, un par fichier isolé, un
+            par répertoire de segments orphelins
+        """
+        urls = sorted(set(urls))
+        manifests = [url for url in urls if self.is_manifest(url)]
+        records = {}
+        
+        fetched = self._fetch_all(manifests) if fetch else {}
+        
+        # Manifestes maîtres d'abord: une playlist de variante déjà décrite
+        # par une playlist maître ne fait pas l'objet d'un flux séparé
+        owners = []
+        for url in manifests:
+            kind = 'dash' if self.MANIFEST_RE.search(urlsplit(url).path + '?').group('ext').lower() == 'mpd' else 'hls'
+            record = StreamRecord(url, kind)
+            text, error = fetched.get(url, (None, None))
+            known, directories = set(), {self._directory(url)}
+            if text is not None:
+                try:
+                    known, directories = self._expand_manifest(record, text)
+                except (ElementTree.ParseError, ValueError) as e:
+                    record.error = f"manifeste invalide: {e}"
+            elif fetch:
+                record.error = error
+            records[url] = record
+            owners.append((record, known, directories))
+        
+        # Une playlist média citée par une playlist maître y est rattachée
+        variant_urls = {}
+        for record, _, _ in owners:
+            if record.kind != 'hls':
+                continue
+            for variant in record.variants:
+                if variant.get('url'):
+                    variant_urls.setdefault(self._strip_query(variant['url']), record)
+        for url in manifests:
+            owner = variant_urls.get(self._strip_query(url))
+            if owner is not None and owner is not records[url]:
+                del records[url]
+        owners = [owner for owner in owners if owner[0].url in records]
+        
+        orphans = {}
+        for url in urls:
+            if url in records or self._strip_query(url) in variant_urls:
+                continue
+            
+            stripped, directory = self._strip_query(url), self._directory(url)
+            owner = next((record for record, known, _ in owners if stripped in known), None)
+            if owner is None and self.is_segment(url):
+                owner = next((record for record, _, directories in owners
+                              if any(directory.startswith(d) for d in directories)), None)
+            
+            if owner is not None:
+                owner.segments.append(url)
+            elif self.is_segment(url):
+                if directory not in orphans:
+                    orphans[directory] = StreamRecord(directory, 'segments')
+                orphans[directory].segments.append(url)
+            else:
+                records[url] = StreamRecord(url, 'file')
+        
+        return list(records.values()) + list(orphans.values())
+    
+    def close(self):
+        """Ferme les connexions de la session"""
+        self.session.close()
+
+
+class StreamValidator:
+    """
+    Vérifie que des URLs de flux servent réellement un média
+    
+    Chaque URL est sondée par HEAD, puis par un GET limité à quelques octets
+    (en-tête Range) si le serveur refuse HEAD ou ne renseigne pas le type.
+    Les sondes partent en parallèle sur une session requests partagée dont
+    le pool de connexions est dimensionné sur le nombre de workers.
+    """
+    
+    # Types de contenu qui trahissent une page d'erreur plutôt qu'un média
+    ERROR_CONTENT_TYPES = ('text/html', 'application/xhtml', 'application/json', 'text/plain')
+    
+    # Types trop vagues: le début du contenu est lu pour trancher
+    GENERIC_CONTENT_TYPES = ('application/octet-stream', 'binary/octet-stream')
+    
+    # Début de fichier d'une page HTML renvoyée avec un statut 200
+    HTML_SIGNATURES = (b'<!doctype', b'<html', b'<head')
+    
+    CONTENT_RANGE_RE = re.compile(r'/\s*(\d+)\s*$')
+    
+    def __init__(self, user_agent: str = None, timeout: float = 10, workers: int = 32,
+                 range_bytes: int = 1024):
+        """
+        Initialise le validateur
+        
+        Args:
+            user_agent: User-Agent envoyé
+            timeout: Délai maximal par requête (secondes)
+            workers: Nombre de sondes simultanées
+            range_bytes: Nombre d'octets demandés par le GET de repli
+        """
+        self.timeout = timeout
+        self.workers = workers
+        self.range_bytes = range_bytes
+        self.session = _make_session(workers, user_agent)
+    
+    def _result(self, url: str, method: str, response, started: float, head: bytes = b'') -> Dict:
+        """Construit le résultat d'une sonde à partir de la réponse"""
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        
+        content_length = None
+        match = self.CONTENT_RANGE_RE.search(response.headers.get('Content-Range', ''))
+        if match:
+            content_length = int(match.group(1))
+        elif response.headers.get('Content-Length', '').isdigit() and response.status_code != 206:
+            content_length = int(response.headers['Content-Length'])
+        
+        error = None
+        if response.status_code >= 400:
+            error = f"HTTP {response.status_code}"
+        elif content_type.startswith(self.ERROR_CONTENT_TYPES) and not head.lstrip().startswith(b'#EXTM3U'):
+            error = f"type {content_type}"
+        elif head.lstrip()[:40].lower().startswith(self.HTML_SIGNATURES):
+            error = "page HTML"
+        
+        return {
+            'url': url,
+            'ok': error is None,
+            'status': response.status_code,
+            'content_type': content_type or None,
+            'content_length': content_length,
+            'final_url': response.url,
+            'latency': round(time.perf_counter() - started, 4),
+            'method': method,
+            'error': error,
+        }
+    
+    def probe(self, url: str) -> Dict:
+        """
+        Sonde une URL
+        
+        Args:
+            url: URL du flux
+            
+        Returns:
+            Dictionnaire: url, ok, status, content_type, content_length,
+            final_url, latency (secondes), method ('HEAD' ou 'GET'), error
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            response.close()
+            result = self._result(url, 'HEAD', response, started)
+            # HEAD refusé ou trop peu renseigné: un GET partiel tranche
+            if result['ok'] and result['content_type'] and \
+                    result['content_type'] not in self.GENERIC_CONTENT_TYPES:
+                return result
+        except requests.RequestException:
+            pass
+        
+        started = time.perf_counter()
+        try:
+            headers = {'Range': f"bytes=0-{self.range_bytes - 1}"}
+            with self.session.get(url, timeout=self.timeout, headers=headers, stream=True) as response:
+                head = next(response.iter_content(self.range_bytes), b'')
+                return self._result(url, 'GET', response, started, head)
+        except requests.RequestException as e:
+            return {
+                'url': url,
+                'ok': False,
+                'status': None,
+                'content_type': None,
+                'content_length': None,
+                'final_url': None,
+                'latency': round(time.perf_counter() - started, 4),
+                'method': 'GET',
+                'error': type(e).__name__,
+            }
+    
+    def validate(self, urls) -> Dict[str, Dict]:
+        """
+        Sonde plusieurs URLs en parallèle
+        
+        Args:
+            urls: URLs à vérifier
+            
+        Returns:
+            Dictionnaire URL -> résultat de probe()
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as executor:
+            results = dict(zip(urls, executor.map(self.probe, urls)))
+        
+        valid = sum(1 for result in results.values() if result['ok'])
+        logger.info(f"✓ {valid}/{len(urls)} flux valide(s) ({time.perf_counter() - started:.1f}s)")
+        return results
+    
+    def close(self):
+        """Ferme les connexions de la session"""
+        self.session.close()
+
+
+class ResultSink:
+    """
+    Journal JSONL des détections, écrit au fil de l'eau
+    
+    Chaque nouveau flux produit une ligne JSON (URL, page, profondeur, source
+    de la détection, type MIME, horodatage). Les lignes sont écrites par lots
+    et le fichier est ouvert en ajout: un long crawl (ou sa reprise) produit
+    un résultat exploitable à tout moment sans garder les métadonnées en mémoire.
+    """
+    
+    def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 5.0):
+        """
+        Ouvre le journal
+        
+        Args:
+            path: Fichier JSONL (complété s'il existe déjà)
+            batch_size: Nombre de lignes gardées en tampon avant écriture
+            flush_interval: Délai maximal avant écriture du tampon (secondes)
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def write(self, record: Dict):
+        """
+        Ajoute une détection au journal
+        
+        Args:
+            record: Dictionnaire sérialisable en JSON
+        """
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+    
+    def _flush_locked(self):
+        """Écrit le tampon (verrou déjà pris)"""
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._file.flush()
+            self.written += len(self._buffer)
+            self._buffer = []
+        self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Écrit immédiatement les détections en tampon"""
+        with self._lock:
+            if not self._file.closed:
+                self._flush_locked()
+    
+    def close(self):
+        """Écrit le tampon et ferme le fichier"""
+        with self._lock:
+            if not self._file.closed:
+                self._flush_locked()
+                self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    @staticmethod
+    def read(path: str):
+        """
+        Relit un journal JSONL
+        
+        Args:
+            path: Fichier JSONL
+            
+        Yields:
+            Un dictionnaire par détection (les lignes tronquées sont ignorées)
+        """
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    
+    @classmethod
+    def export_text(cls, path: str, filename: str = 'video_urls.txt', fetch_manifests: bool = True):
+        """
+        Génère le fichier texte de save_results() depuis un journal JSONL
+        
+        Args:
+            path: Fichier JSONL
+            filename: Fichier texte à écrire
+            fetch_manifests: Télécharge les manifestes pour décrire leurs variantes
+        """
+        urls = {record['url'] for record in cls.read(path) if record.get('url')}
+        _write_streams_text(filename, _collapse_streams(urls, fetch=fetch_manifests))
+        logger.info(f"✓ {len(urls)} URL(s) de {path} exportée(s) dans {filename}")
+
+
+def _collapse_streams(urls, fetch: bool = True, user_agent: str = None) -> List[StreamRecord]:
+    """
+    Regroupe des URLs détectées par flux (voir ManifestExpander.collapse)
+    
+    Args:
+        urls: URLs détectées
+        fetch: Télécharge les manifestes pour décrire leurs variantes
+        user_agent: User-Agent envoyé (défaut: tiré de la réserve commune)
+        
+    Returns:
+        Liste des flux
+    """
+    expander = ManifestExpander(user_agent=user_agent or UserAgentPool.shared().random)
+    try:
+        streams = expander.collapse(urls, fetch=fetch)
+    finally:
+        expander.close()
+    
+    segments = sum(len(stream.segments) for stream in streams)
+    if segments:
+        logger.info(f"ℹ {segments} segment(s) regroupé(s) dans {len(streams)} flux")
+    return streams
+
+
+def _validate_streams(streams: List[StreamRecord], urls=None, workers: int = 32,
+                      user_agent: str = None) -> Dict[str, Dict]:
+    """
+    Sonde des flux par HTTP et rattache chaque résultat à son StreamRecord (stream.probe)
+    
+    Args:
+        streams: Flux détectés
+        urls: URLs à vérifier (défaut: une par flux)
+        workers: Nombre de sondes simultanées
+        user_agent: User-Agent envoyé (défaut: tiré de la réserve commune)
+        
+    Returns:
+        Dictionnaire URL -> résultat de la sonde
+    """
+    if urls is None:
+        urls = [stream.probe_url for stream in streams]
+    
+    validator = StreamValidator(user_agent=user_agent or UserAgentPool.shared().random, workers=workers)
+    try:
+        results = validator.validate(urls)
+    finally:
+        validator.close()
+    
+    for stream in streams:
+        stream.probe = results.get(stream.probe_url, stream.probe)
+    return results
+
+
+def _save_streams(filename: str, streams: List[StreamRecord], valid_only: bool = False):
+    """Écrit les flux avec _write_streams_text et journalise le résultat (save_results)"""
+    try:
+        _write_streams_text(filename, streams, valid_only)
+        logger.info(f"✓ Résultats sauvegardés dans {filename}")
+    except Exception as e:
+        logger.error(f"Erreur lors de la sauvegarde: {e}")
+
+
+def _write_streams_text(filename: str, streams: List[StreamRecord], valid_only: bool = False):
+    """
+    Écrit la liste numérotée des flux (format de save_results)
+    
+    Args:
+        filename: Fichier de sortie
+        streams: Flux à écrire
+        valid_only: N'écrit pas les flux dont la vérification a échoué
+    """
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(f"Flux vidéo détectés - {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"{'='*80}\n\n")
+        streams = [stream for stream in streams
+                   if not valid_only or stream.probe is None or stream.probe['ok']]
+        for i, stream in enumerate(streams, 1):
+            f.write(f"{i}. {stream.summary()}\n")
+            for variant in stream.variants:
+                details = ', '.join(str(variant[key]) for key in ('type', 'resolution', 'bandwidth', 'codecs')
+                                    if variant.get(key))
+                if variant.get('url'):
+                    f.write(f"   - {details}: {variant['url']}\n")
+
+
+class ScrapeStats:
+    """
+    Mesures d'un scraper: durée de chaque phase des pages et compteurs
+    
+    Les durées sont agrégées dans des histogrammes à seaux fixes (mémoire
+    constante, même sur un très long crawl), d'où sont tirés les percentiles
+    du rapport JSON et l'export Prometheus. Les pages les plus lentes sont
+    conservées avec le détail de leurs phases.
+    """
+    
+    PHASES = ('navigation', 'readiness', 'scroll', 'network', 'dom', 'links', 'http')
+    COUNTERS = ('pages', 'log_entries', 'log_discarded', 'urls_classified', 'streams', 'errors',
+                'recycles', 'retries', 'timeouts', 'hung')
+    
+    # Bornes supérieures des seaux des histogrammes (secondes)
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+    
+    # Nombre de pages lentes gardées pour le rapport
+    SLOWEST_PAGES = 10
+    
+    def __init__(self):
+        self.counters: Dict[str, int] = {name: 0 for name in self.COUNTERS}
+        # Jauges (mémoire...) -> {'value', 'peak'}
+        self.gauges: Dict[str, Dict[str, float]] = {}
+        # Phase -> {'count', 'total', 'max', 'buckets'}
+        self.phases: Dict[str, Dict] = {}
+        self.slowest: List[Dict] = []
+        self.started = time.time()
+        self._page: Optional[Dict[str, float]] = None
+    
+    def count(self, name: str, value: int = 1):
+        """Incrémente un compteur"""
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def gauge(self, name: str, value: float):
+        """Relève la valeur courante d'une jauge (et son maximum)"""
+        entry = self.gauges.setdefault(name, {'value': value, 'peak': value})
+        entry['value'] = value
+        entry['peak'] = max(entry['peak'], value)
+    
+    def add(self, phase: str, seconds: float):
+        """Ajoute une durée mesurée à une phase (et à la page en cours)"""
+        entry = self.phases.get(phase)
+        if entry is None:
+            entry = self.phases[phase] = {'count': 0, 'total': 0.0, 'max': 0.0,
+                                          'buckets': [0] * len(self.BUCKETS)}
+        entry['count'] += 1
+        entry['total'] += seconds
+        entry['max'] = max(entry['max'], seconds)
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                entry['buckets'][i] += 1
+                break
+        
+        if self._page is not None:
+            self._page[phase] = self._page.get(phase, 0.0) + seconds
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Mesure la durée du bloc comme une phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+    
+    @contextmanager
+    def page(self, url: str, started: float = None, phases: Dict[str, float] = None):
+        """
+        Mesure une page: durée totale, détail des phases, erreur éventuelle
+        
+        Args:
+            url: URL de la page
+            started: Début de la page (time.perf_counter(), défaut: maintenant)
+            phases: Durées déjà mesurées et agrégées (mode multi-onglets)
+        """
+        started = time.perf_counter() if started is None else started
+        self._page = dict(phases or {})
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.end_page(url, time.perf_counter() - started, error)
+    
+    def end_page(self, url: str, total: float, error: bool = False, phases: Dict[str, float] = None):
+        """
+        Clôt la page en cours
+        
+        Args:
+            url: URL de la page
+            total: Durée totale de la page (secondes)
+            error: La page a échoué
+            phases: Détail des phases (défaut: celles mesurées depuis page())
+        """
+        if phases is None:
+            phases = self._page or {}
+        self._page = None
+        self.count('pages')
+        if error:
+            self.count('errors')
+        self.add('page', total)
+        
+        if len(self.slowest) < self.SLOWEST_PAGES or total > self.slowest[-1]['total']:
+            self.slowest.append({
+                'url': url,
+                'total': round(total, 3),
+                'phases': {name: round(value, 3) for name, value in phases.items()},
+                'error': error,
+            })
+            self.slowest.sort(key=lambda page: page['total'], reverse=True)
+            del self.slowest[self.SLOWEST_PAGES:]
+    
+    def merge(self, other: 'ScrapeStats'):
+        """Ajoute les mesures d'un autre scraper (pool)"""
+        for name, value in other.counters.items():
+            self.count(name, value)
+        # Jauges: valeur la plus haute des scrapers
+        for name, theirs in other.gauges.items():
+            entry = self.gauges.setdefault(name, dict(theirs))
+            entry['value'] = max(entry['value'], theirs['value'])
+            entry['peak'] = max(entry['peak'], theirs['peak'])
+        for phase, theirs in other.phases.items():
+            entry = self.phases.setdefault(phase, {'count': 0, 'total': 0.0, 'max': 0.0,
+                                                   'buckets': [0] * len(self.BUCKETS)})
+            entry['count'] += theirs['count']
+            entry['total'] += theirs['total']
+            entry['max'] = max(entry['max'], theirs['max'])
+            entry['buckets'] = [a + b for a, b in zip(entry['buckets'], theirs['buckets'])]
+        self.slowest = sorted(self.slowest + other.slowest, key=lambda page: page['total'],
+                              reverse=True)[:self.SLOWEST_PAGES]
+        self.started = min(self.started, other.started)
+    
+    @classmethod
+    def merged(cls, stats) -> 'ScrapeStats':
+        """Agrège les mesures de plusieurs scrapers"""
+        result = cls()
+        for item in stats:
+            result.merge(item)
+        return result
+    
+    def percentile(self, phase: str, q: float) -> Optional[float]:
+        """
+        Percentile approché d'une phase (interpolation dans son seau)
+        
+        Args:
+            phase: Nom de la phase
+            q: Quantile entre 0 et 1
+            
+        Returns:
+            Durée en secondes (None si la phase n'a pas été mesurée)
+        """
+        entry = self.phases.get(phase)
+        if not entry or not entry['count']:
+            return None
+        
+        rank = q * entry['count']
+        seen, lower = 0, 0.0
+        for bound, count in zip(self.BUCKETS, entry['buckets']):
+            if count and seen + count >= rank:
+                upper = min(bound, entry['max'])
+                return lower + (upper - lower) * max(rank - seen, 0) / count
+            seen += count
+            lower = bound
+        return entry['max']
+    
+    def to_dict(self) -> Dict:
+        """Rapport sérialisable (JSON)"""
+        phases = {}
+        for phase, entry in self.phases.items():
+            phases[phase] = {
+                'count': entry['count'],
+                'total': round(entry['total'], 3),
+                'mean': round(entry['total'] / entry['count'], 4) if entry['count'] else None,
+                'p50': round(self.percentile(phase, 0.5), 4),
+                'p95': round(self.percentile(phase, 0.95), 4),
+                'max': round(entry['max'], 4),
+            }
+        return {
+            'elapsed': round(time.time() - self.started, 3),
+            'counters': dict(self.counters),
+            'gauges': {name: dict(entry) for name, entry in self.gauges.items()},
+            'phases': phases,
+            'slowest_pages': self.slowest,
+        }
+    
+    def summary(self) -> str:
+        """Résumé d'une ligne: temps total passé dans chaque phase"""
+        parts = [f"{phase} {self.phases[phase]['total']:.1f}s"
+                 for phase in self.PHASES if phase in self.phases]
+        return ', '.join(parts) or 'aucune mesure'
+    
+    def write_json(self, path: str, extra: Dict = None):
+        """
+        Écrit le rapport JSON
+        
+        Args:
+            path: Fichier de sortie
+            extra: Sections ajoutées au rapport (démarrage, niveaux...)
+        """
+        report = self.to_dict()
+        report.update(extra or {})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    def write_prometheus(self, path: str, prefix: str = 'scrappeur'):
+        """
+        Écrit les mesures au format texte de Prometheus (textfile collector)
+        
+        Le fichier est remplacé atomiquement pour ne jamais être lu à moitié écrit.
+        
+        Args:
+            path: Fichier de sortie (.prom)
+            prefix: Préfixe des métriques
+        """
+        lines = []
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        for name, entry in self.gauges.items():
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {entry['value']}")
+            lines.append(f"# TYPE {prefix}_{name}_peak gauge")
+            lines.append(f"{prefix}_{name}_peak {entry['peak']}")
+        
+        metric = f"{prefix}_phase_duration_seconds"
+        lines.append(f"# HELP {metric} Durée des phases d'analyse des pages")
+        lines.append(f"# TYPE {metric} histogram")
+        for phase, entry in self.phases.items():
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS, entry['buckets']):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f'{metric}_bucket{{phase="{phase}",le="{le}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{phase="{phase}"}} {entry["total"]:.6f}')
+            lines.append(f'{metric}_count{{phase="{phase}"}} {entry["count"]}')
+        
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(temporary, path)
+
+
+def _write_stats_reports(stats: ScrapeStats, report_path: str = None, metrics_path: str = None,
+                         extra: Dict = None):
+    """
+    Écrit le rapport JSON et l'export Prometheus demandés
+    
+    Args:
+        stats: Mesures à exporter
+        report_path: Rapport JSON (None = aucun)
+        metrics_path: Fichier Prometheus (None = aucun)
+        extra: Sections ajoutées au rapport JSON
+    """
+    logger.info(f"Durée par phase: {stats.summary()}")
+    try:
+        if report_path:
+            stats.write_json(report_path, extra)
+            logger.info(f"✓ Rapport de performance écrit dans {report_path}")
+        if metrics_path:
+            stats.write_prometheus(metrics_path)
+            logger.info(f"✓ Métriques Prometheus écrites dans {metrics_path}")
+    except OSError as e:
+        logger.error(f"Erreur lors de l'écriture des mesures: {e}")
+
+
+def _run_profiled(func, *args, path: str = 'scrappeur.prof', **kwargs):
+    """
+    Exécute une fonction sous cProfile
+    
+    Le profil complet est écrit dans path (lisible avec pstats ou snakeviz)
+    et les fonctions les plus coûteuses sont affichées à la fin.
+    
+    Args:
+        func: Fonction à exécuter
+        path: Fichier du profil
+        
+    Returns:
+        Valeur renvoyée par func
+    """
+    import cProfile
+    import pstats
+    
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
+        logger.info(f"✓ Profil cProfile écrit dans {path}")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+
+class UrlCanonicalizer:
+    """
+    Met les URLs sous une forme canonique pour la déduplication
+    
+    Schéma et hôte en minuscules, port par défaut retiré, fragment supprimé,
+    paramètres de suivi et identifiants de session retirés, paramètres
+    restants triés et slash final retiré: '/a/?utm_source=x#top' et '/a'
+    désignent alors la même page et ne coûtent qu'un seul chargement.
+    """
+    
+    # Paramètres retirés de la query string (comparaison insensible à la casse)
+    STRIP_PARAMS = {
+        'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl',
+        'ref_src', 'sessionid', 'session_id', 'sid', 'phpsessid', 'jsessionid', 'aspsessionid',
+        'cfid', 'cftoken',
+    }
+    STRIP_PREFIXES = ('utm_',)
+    
+    DEFAULT_PORTS = {'http': '80', 'https': '443'}
+    
+    # Identifiant de session dans le chemin (ex: '/page;jsessionid=ABC')
+    PATH_SESSION_RE = re.compile(r';(?:jsessionid|sid|phpsessid)=[^/?#]*', re.IGNORECASE)
+    
+    def __init__(self, strip_params=None, strip_prefixes=None, sort_query: bool = True,
+                 strip_trailing_slash: bool = True):
+        """
+        Initialise le canonicaliseur
+        
+        Args:
+            strip_params: Paramètres de query à retirer (défaut: STRIP_PARAMS)
+            strip_prefixes: Préfixes de paramètres à retirer (défaut: STRIP_PREFIXES)
+            sort_query: Trie les paramètres restants
+            strip_trailing_slash: Retire le slash final des chemins (sauf '/')
+        """
+        self.strip_params = {p.lower() for p in (self.STRIP_PARAMS if strip_params is None else strip_params)}
+        self.strip_prefixes = tuple(p.lower() for p in (self.STRIP_PREFIXES if strip_prefixes is None else strip_prefixes))
+        self.sort_query = sort_query
+        self.strip_trailing_slash = strip_trailing_slash
+    
+    def _keep_param(self, pair: str) -> bool:
+        """True si le paramètre 'clé=valeur' (brut) doit être conservé"""
+        key = unquote_plus(pair.split('=', 1)[0]).lower()
+        return bool(pair) and key not in self.strip_params and not key.startswith(self.strip_prefixes)
+    
+    def canonicalize(self, url: str) -> str:
+        """
+        Renvoie la forme canonique d'une URL absolue
+        
+        Args:
+            url: URL à canonicaliser
+            
+        Returns:
+            URL canonique (l'URL d'origine si elle ne peut pas être analysée)
+        """
+        try:
+            parts = urlsplit(url.strip())
+            port = parts.port
+        except ValueError:
+            return url
+        
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            return url
+        
+        host = (parts.hostname or '').rstrip('.')
+        if ':' in host:
+            host = f'[{host}]'
+        netloc = host
+        if port is not None and str(port) != self.DEFAULT_PORTS.get(scheme):
+            netloc += f':{port}'
+        if parts.username is not None:
+            userinfo = parts.netloc.rpartition('@')[0]
+            netloc = f'{userinfo}@{netloc}'
+        
+        path = self.PATH_SESSION_RE.sub('', parts.path) or '/'
+        if self.strip_trailing_slash and len(path) > 1 and path.endswith('/'):
+            path = path.rstrip('/') or '/'
+        
+        params = [pair for pair in parts.query.split('&') if self._keep_param(pair)]
+        if self.sort_query:
+            params.sort()
+        
+        return urlunsplit((scheme, netloc, path, '&'.join(params), ''))
+    
+    __call__ = canonicalize
+
+
+class BloomFilter:
+    """
+    Ensemble probabiliste de taille fixe (filtre de Bloom)
+    
+    Remplace un set[str] pour les très gros crawls: la mémoire dépend de la
+    capacité et du taux de faux positifs choisis, pas de la longueur des
+    URLs. Un faux positif fait sauter une page jamais visitée; il n'y a
+    jamais de faux négatif.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialise le filtre
+        
+        Args:
+            capacity: Nombre d'éléments prévu
+            error_rate: Taux de faux positifs visé à pleine capacité
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError(f"Paramètres du filtre de Bloom invalides: {capacity}, {error_rate}")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str):
+        """Positions des bits d'un élément (double hachage)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, item: str) -> bool:
+        """
+        Ajoute un élément
+        
+        Returns:
+            True si l'élément n'était (probablement) pas encore présent
+        """
+        new = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+    
+    def update(self, items):
+        """Ajoute plusieurs éléments"""
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def clear(self):
+        """Vide le filtre"""
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Taille du tableau de bits en octets"""
+        return len(self.bits)
+
+
+class SpillSet:
+    """
+    Ensemble d'URLs à mémoire bornée
+    
+    Au-delà de limit éléments en mémoire, le contenu est déversé dans une
+    base SQLite temporaire, supprimée à la fermeture. Contrairement au
+    filtre de Bloom, le résultat reste exact et itérable.
+    """
+    
+    def __init__(self, limit: int = 100_000):
+        """
+        Initialise l'ensemble
+        
+        Args:
+            limit: Nombre maximal d'éléments gardés en mémoire
+        """
+        if limit < 1:
+            raise ValueError(f"Limite invalide: {limit}")
+        self.limit = limit
+        self._memory: Set[str] = set()
+        self._spilled = 0
+        self._path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _spill(self):
+        """Déverse les éléments en mémoire dans la base"""
+        if self._conn is None:
+            fd, self._path = tempfile.mkstemp(prefix='scrappeur-', suffix='.spill')
+            os.close(fd)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=OFF')
+            self._conn.execute('PRAGMA synchronous=OFF')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS items (item TEXT PRIMARY KEY) WITHOUT ROWID')
+        with self._conn:
+            self._conn.executemany('INSERT OR IGNORE INTO items VALUES (?)',
+                                   ((item,) for item in self._memory))
+        self._spilled += len(self._memory)
+        logger.debug(f"{len(self._memory)} URL(s) déversée(s) sur disque ({self._spilled} au total)")
+        self._memory = set()
+    
+    def add(self, item: str) -> bool:
+        """
+        Ajoute un élément
+        
+        Returns:
+            True si l'élément n'était pas encore présent
+        """
+        if item in self:
+            return False
+        self._memory.add(item)
+        if len(self._memory) > self.limit:
+            self._spill()
+        return True
+    
+    def update(self, items):
+        """Ajoute plusieurs éléments"""
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        if item in self._memory:
+            return True
+        if self._conn is None:
+            return False
+        return self._conn.execute('SELECT 1 FROM items WHERE item = ?', (item,)).fetchone() is not None
+    
+    def __len__(self) -> int:
+        return len(self._memory) + self._spilled
+    
+    def __iter__(self):
+        yield from list(self._memory)
+        if self._conn is not None:
+            for (item,) in self._conn.execute('SELECT item FROM items'):
+                yield item
+    
+    def clear(self):
+        """Vide l'ensemble et supprime la base temporaire"""
+        self._memory = set()
+        self._spilled = 0
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+    
+    def close(self):
+        """Libère la base temporaire"""
+        self.clear()
+
+
+def _python_rss() -> Optional[int]:
+    """Mémoire résidente du processus Python (octets, Linux; None ailleurs)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _process_tree(root: int) -> Optional[Dict[int, int]]:
+    """
+    Processus descendant d'un processus (lui compris) et leur mémoire résidente
+    
+    Args:
+        root: PID du processus racine
+        
+    Returns:
+        Dictionnaire PID -> RSS en octets (None sans /proc, hors Linux)
+    """
+    try:
+        entries = os.listdir('/proc')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+    except (OSError, AttributeError):
+        return None
+    
+    children, rss = {}, {}
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        pid = int(entry)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * page_size
+    
+    tree, pending = {}, [root]
+    while pending:
+        pid = pending.pop()
+        tree[pid] = rss.get(pid, 0)
+        pending.extend(children.get(pid, ()))
+    return tree
+
+
+def _process_tree_rss(root: int) -> Optional[int]:
+    """
+    Mémoire résidente d'un processus et de tous ses descendants
+    
+    Args:
+        root: PID du processus racine
+        
+    Returns:
+        Somme des RSS en octets (None sans /proc, hors Linux)
+    """
+    tree = _process_tree(root)
+    return sum(tree.values()) if tree is not None else None
+
+
+def _driver_lost(error: Exception) -> bool:
+    """
+    True si l'erreur signale que le processus du driver (ou sa session) a disparu
+    
+    Selenium lève alors l'erreur de connexion d'urllib3 (MaxRetryError...)
+    et non une WebDriverException. urllib3 n'est consulté que s'il est déjà
+    chargé (par Selenium), pour ne pas alourdir l'import du module.
+    """
+    if isinstance(error, (ConnectionError, InvalidSessionIdException)):
+        return True
+    exceptions = sys.modules.get('urllib3.exceptions')
+    return exceptions is not None and isinstance(error, exceptions.HTTPError)
+
+
+def _kill_driver(driver):
+    """
+    Tue sans délai un driver et ses processus (navigateur, rendu...)
+    
+    Une commande WebDriver en attente sur ce driver échoue aussitôt. Hors
+    Linux, seul le processus du driver est tué.
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None:
+        return
+    
+    for pid in (_process_tree(process.pid) or {}):
+        if pid != process.pid:
+            try:
+                os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            except OSError:
+                pass
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+class ResourceGovernor:
+    """
+    Limites de ressources des longs crawls (voir VideoScraper._recycle_reason)
+    
+    Le navigateur est redémarré après max_pages pages chargées, ou dès que la
+    mémoire résidente du driver et de ses processus (navigateur, rendu...)
+    dépasse max_browser_mb; la mémoire est relevée toutes les check_every
+    pages, avec celle du processus Python. Les ensembles d'URLs du crawl
+    (flux, pages visitées) gardent au plus max_urls éléments en mémoire et
+    déversent le reste sur disque (SpillSet); la frontière va dans un fichier
+    temporaire. La mémoire n'est mesurée que sous Linux (/proc): ailleurs,
+    seul max_pages s'applique.
+    """
+    
+    def __init__(self, max_pages: int = 200, max_browser_mb: float = 2048, check_every: int = 5,
+                 max_urls: int = 100_000):
+        """
+        Initialise les limites
+        
+        Args:
+            max_pages: Pages chargées avant de redémarrer le navigateur
+            max_browser_mb: Mémoire du navigateur (Mo) au-delà de laquelle il est redémarré
+            check_every: Intervalle des relevés de mémoire (en pages)
+            max_urls: Taille maximale en mémoire de chaque ensemble d'URLs
+        """
+        if min(max_pages, max_browser_mb, check_every, max_urls) < 1:
+            raise ValueError("Limites de ressources invalides: "
+                             f"{max_pages}, {max_browser_mb}, {check_every}, {max_urls}")
+        self.max_pages = max_pages
+        self.max_browser_mb = max_browser_mb
+        self.check_every = check_every
+        self.max_urls = max_urls
+    
+    def new_set(self) -> SpillSet:
+        """Ensemble d'URLs borné en mémoire"""
+        return SpillSet(self.max_urls)
+    
+    @staticmethod
+    def browser_rss(driver) -> Optional[int]:
+        """
+        Mémoire résidente du navigateur piloté par un driver
+        
+        Returns:
+            Octets (None si le processus du driver est inconnu ou hors Linux)
+        """
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is None:
+            return None
+        return _process_tree_rss(process.pid)
+
+
+class CrawlFrontier:
+    """
+    Frontière de crawl persistante (pages à visiter, visitées et flux trouvés)
+    
+    Stockée dans SQLite: chaque page traitée est enregistrée dans une
+    transaction avec ses liens et ses flux, ce qui permet de reprendre un
+    crawl interrompu (crash, navigateur bloqué, Ctrl-C) là où il s'était
+    arrêté. Les méthodes peuvent être appelées depuis plusieurs threads.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            url TEXT PRIMARY KEY,
+            depth INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            priority REAL NOT NULL DEFAULT 0,
+            seq INTEGER NOT NULL,
+            error TEXT,
+            updated REAL
+        );
+        CREATE TABLE IF NOT EXISTS videos (
+            url TEXT PRIMARY KEY,
+            page TEXT,
+            found REAL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    
+    def __init__(self, path: Optional[str] = ':memory:'):
+        """
+        Ouvre (ou crée) une frontière
+        
+        Args:
+            path: Fichier SQLite (':memory:' = frontière en mémoire,
+                None = fichier temporaire supprimé à la fermeture)
+        """
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='scrappeur-', suffix='.db')
+            os.close(fd)
+        self.path = path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+        # Fichiers de reprise créés avant l'ordonnancement par priorité
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(pages)')]
+        if 'priority' not in columns:
+            self.conn.execute('ALTER TABLE pages ADD COLUMN priority REAL NOT NULL DEFAULT 0')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS pages_pending ON pages (status, priority DESC, seq)')
+        self.conn.commit()
+        self._seq = self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM pages').fetchone()[0]
+    
+    def get_meta(self, key: str, default=None):
+        """Lit une information sur le crawl (URL de départ, paramètres...)"""
+        with self._lock:
+            row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+    
+    def set_meta(self, key: str, value):
+        """Enregistre une information sur le crawl"""
+        with self._lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                              (key, json.dumps(value)))
+    
+    def _insert_pages(self, pages) -> int:
+        """Ajoute des pages en attente (sans transaction propre); renvoie le nombre de nouvelles pages"""
+        added = 0
+        for url, depth, priority in pages:
+            self._seq += 1
+            cursor = self.conn.execute(
+                'INSERT OR IGNORE INTO pages (url, depth, priority, seq) VALUES (?, ?, ?, ?)',
+                (url, depth, priority, self._seq)
+            )
+            added += cursor.rowcount
+        return added
+    
+    def add(self, url: str, depth: int, priority: float = 0) -> bool:
+        """
+        Ajoute une page à visiter
+        
+        Returns:
+            True si la page était inconnue
+        """
+        with self._lock, self.conn:
+            return self._insert_pages([(url, depth, priority)]) == 1
+    
+    def candidates(self, limit: int = 100) -> List[Tuple[str, int]]:
+        """
+        Pages en attente, de la plus prioritaire à la moins prioritaire
+        
+        Args:
+            limit: Nombre maximal de pages renvoyées
+            
+        Returns:
+            Liste de tuples (url, profondeur)
+        """
+        with self._lock:
+            return self.conn.execute(
+                "SELECT url, depth FROM pages WHERE status = 'pending' "
+                "ORDER BY priority DESC, seq LIMIT ?", (limit,)
+            ).fetchall()
+    
+    def iter_candidates(self, batch: int = 100):
+        """
+        Parcourt toutes les pages en attente par priorité décroissante, par lots
+        
+        Chaque lot reprend après la dernière page du précédent (priorité, ordre
+        d'ajout): les pages réservées ou abandonnées entre-temps ne décalent rien.
+        
+        Args:
+            batch: Nombre de pages lues par requête
+            
+        Yields:
+            Tuples (url, profondeur)
+        """
+        query = "SELECT url, depth, priority, seq FROM pages WHERE status = 'pending' "
+        order = "ORDER BY priority DESC, seq LIMIT ?"
+        after = None
+        while True:
+            with self._lock:
+                if after is None:
+                    rows = self.conn.execute(query + order, (batch,)).fetchall()
+                else:
+                    rows = self.conn.execute(
+                        query + "AND (priority < ? OR (priority = ? AND seq > ?)) " + order,
+                        (after[0], after[0], after[1], batch)
+                    ).fetchall()
+            for url, depth, _, _ in rows:
+                yield url, depth
+            if len(rows) < batch:
+                return
+            after = rows[-1][2:]
+    
+    def claim(self, url: str) -> bool:
+        """
+        Marque une page en attente comme 'in_progress'
+        
+        Returns:
+            True si la page était encore en attente
+        """
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "UPDATE pages SET status = 'in_progress', updated = ? WHERE url = ? AND status = 'pending'",
+                (time.time(), url)
+            ).rowcount == 1
+    
+    def pop(self) -> Optional[Tuple[str, int]]:
+        """
+        Prend la page la plus prioritaire et la marque 'in_progress'
+        
+        Returns:
+            Tuple (url, profondeur), ou None si aucune page n'est en attente
+        """
+        with self._lock:
+            for url, depth in self.candidates(1):
+                if self.claim(url):
+                    return url, depth
+            return None
+    
+    def complete(self, url: str, links=(), videos=()) -> int:
+        """
+        Enregistre le résultat d'une page en une seule transaction
+        
+        Args:
+            url: Page traitée
+            links: Tuples (url, profondeur, priorité) des liens à visiter
+            videos: URLs des flux trouvés sur la page
+            
+        Returns:
+            Nombre de nouvelles pages ajoutées à la frontière
+        """
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE pages SET status = 'done', updated = ? WHERE url = ?", (now, url))
+            self.conn.executemany('INSERT OR IGNORE INTO videos (url, page, found) VALUES (?, ?, ?)',
+                                  [(video, url, now) for video in videos])
+            return self._insert_pages(links)
+    
+    def fail(self, url: str, error: str, status: str = 'failed'):
+        """Enregistre l'échec (ou l'abandon) d'une page"""
+        with self._lock, self.conn:
+            self.conn.execute('UPDATE pages SET status = ?, error = ?, updated = ? WHERE url = ?',
+                              (status, error, time.time(), url))
+    
+    def requeue_in_progress(self) -> int:
+        """Remet en attente les pages interrompues en cours de traitement"""
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "UPDATE pages SET status = 'pending' WHERE status = 'in_progress'"
+            ).rowcount
+    
+    def counts(self) -> Dict[str, int]:
+        """Nombre de pages par statut"""
+        with self._lock:
+            return dict(self.conn.execute('SELECT status, COUNT(*) FROM pages GROUP BY status'))
+    
+    def visited(self) -> List[str]:
+        """Pages déjà traitées (avec succès ou non)"""
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                "SELECT url FROM pages WHERE status NOT IN ('pending', 'in_progress')"
+            )]
+    
+    def videos(self) -> List[str]:
+        """Flux trouvés depuis le début du crawl"""
+        with self._lock:
+            return [row[0] for row in self.conn.execute('SELECT url FROM videos')]
+    
+    def close(self):
+        """Ferme la base (et supprime le fichier s'il est temporaire)"""
+        with self._lock:
+            self.conn.close()
+            if self._temporary:
+                for suffix in ('', '-wal', '-shm'):
+                    try:
+                        os.remove(self.path + suffix)
+                    except OSError:
+                        pass
+
+
+class HostRateLimiter:
+    """
+    Limiteur de débit par hôte (seau à jetons)
+    
+    Chaque hôte dispose de son propre seau: crawler plusieurs domaines ne
+    ralentit plus chacun d'eux, contrairement à une pause globale.
+    """
+    
+    def __init__(self, delay: float, burst: int = 1):
+        """
+        Initialise le limiteur
+        
+        Args:
+            delay: Intervalle moyen entre deux requêtes vers un même hôte (secondes)
+            burst: Nombre de requêtes autorisées d'affilée
+        """
+        self.delay = max(0.0, delay)
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+    
+    def wait_time(self, host: str) -> float:
+        """Temps à attendre avant qu'un jeton soit disponible pour cet hôte"""
+        if self.delay == 0 or host not in self._buckets:
+            return 0.0
+        tokens, last = self._buckets[host]
+        tokens = min(self.burst, tokens + (time.monotonic() - last) / self.delay)
+        return 0.0 if tokens >= 1 else (1 - tokens) * self.delay
+    
+    def acquire(self, host: str) -> bool:
+        """
+        Consomme un jeton pour cet hôte s'il y en a un
+        
+        Returns:
+            True si la requête peut partir immédiatement
+        """
+        if self.delay == 0:
+            return True
+        now = time.monotonic()
+        tokens, last = self._buckets.get(host, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) / self.delay)
+        if tokens < 1:
+            return False
+        self._buckets[host] = (tokens - 1, now)
+        return True
+
+
+class CrawlScheduler:
+    """
+    Choisit la prochaine page à visiter dans une frontière
+    
+    Les pages sont prises par priorité décroissante (voir
+    VideoScraper._score_link), en sautant celles dont l'hôte a épuisé son
+    débit, et le crawl s'arrête une fois le budget de pages ou de temps atteint.
+    Un hôte en attente ne bloque pas les autres: les MAX_LOOKAHEAD pages les
+    plus prioritaires sont parcourues jusqu'à trouver une page d'un hôte
+    disponible.
+    """
+    
+    # Nombre de pages lues par requête lors du parcours de la frontière
+    LOOKAHEAD = 100
+    # Nombre maximal de pages examinées par appel (coût borné quand tous les hôtes attendent)
+    MAX_LOOKAHEAD = 1000
+    
+    def __init__(self, frontier: CrawlFrontier, delay_per_host: float = 2, burst: int = 1,
+                 max_pages: int = None, max_duration: float = None, max_depth: int = None):
+        """
+        Initialise l'ordonnanceur
+        
+        Args:
+            frontier: Frontière de crawl
+            delay_per_host: Intervalle moyen entre deux requêtes vers un même hôte (secondes)
+            burst: Nombre de requêtes autorisées d'affilée vers un même hôte
+            max_pages: Nombre maximal de pages à visiter (None = illimité)
+            max_duration: Durée maximale du crawl (secondes, None = illimitée)
+            max_depth: Les pages plus profondes sont abandonnées (cas d'une reprise)
+        """
+        self.frontier = frontier
+        self.max_depth = max_depth
+        self.rate_limiter = HostRateLimiter(delay_per_host, burst)
+        self.max_pages = max_pages
+        self.max_duration = max_duration
+        self.pages_started = 0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def budget_exhausted(self) -> bool:
+        """True si le budget de pages ou de temps est atteint"""
+        if self.max_pages is not None and self.pages_started >= self.max_pages:
+            return True
+        if self.max_duration is not None and time.monotonic() - self.started_at >= self.max_duration:
+            return True
+        return False
+    
+    def try_next(self) -> Tuple[Optional[Tuple[str, int]], Optional[float]]:
+        """
+        Prend la prochaine page visitable immédiatement
+        
+        Returns:
+            ((url, profondeur), None) si une page est prête;
+            (None, attente) si toutes les pages examinées attendent leur hôte;
+            (None, None) si la frontière est vide ou le budget atteint
+        """
+        with self._lock:
+            if self.budget_exhausted():
+                return None, None
+            
+            # Hôte -> attente, pour ne pas réexaminer ses autres pages
+            blocked: Dict[str, float] = {}
+            scanned = 0
+            for url, depth in self.frontier.iter_candidates(self.LOOKAHEAD):
+                if scanned == self.MAX_LOOKAHEAD:
+                    break
+                scanned += 1
+                if self.max_depth is not None and depth > self.max_depth:
+                    self.frontier.fail(url, 'profondeur maximale dépassée', status='skipped')
+                    continue
+                
+                host = urlparse(url).netloc
+                if host in blocked:
+                    continue
+                wait = self.rate_limiter.wait_time(host)
+                if wait > 0:
+                    blocked[host] = wait
+                    continue
+                
+                # Jeton consommé seulement pour une page effectivement réservée
+                if self.frontier.claim(url):
+                    self.rate_limiter.acquire(host)
+                    self.pages_started += 1
+                    return (url, depth), None
+            
+            # Pages au-delà de la fenêtre examinée: elles seront vues au prochain appel
+            if not blocked and scanned < self.MAX_LOOKAHEAD:
+                return None, None
+            return None, max(0.01, min(blocked.values(), default=0))
+    
+    def next_page(self) -> Optional[Tuple[str, int]]:
+        """
+        Attend et prend la prochaine page à visiter
+        
+        Returns:
+            Tuple (url, profondeur), ou None si le crawl est terminé
+        """
+        while True:
+            item, wait = self.try_next()
+            if item is not None or wait is None:
+                return item
+            time.sleep(wait)
+
+
+def _new_visited_set(bloom_capacity: int = None, error_rate: float = 0.001,
+                     governor: 'ResourceGovernor' = None):
+    """
+    Crée l'ensemble des pages visitées d'un crawl
+    
+    Args:
+        bloom_capacity: Nombre de pages prévu (None = set Python exact)
+        error_rate: Taux de faux positifs du filtre de Bloom
+        governor: Limites de ressources (SpillSet borné au lieu d'un set)
+        
+    Returns:
+        set, SpillSet ou BloomFilter
+    """
+    if not bloom_capacity:
+        return governor.new_set() if governor is not None else set()
+    
+    visited = BloomFilter(bloom_capacity, error_rate)
+    logger.info(f"Pages visitées: filtre de Bloom de {visited.memory_bytes / 1e6:.1f} Mo "
+                f"({bloom_capacity} pages, {error_rate:.2%} de faux positifs)")
+    return visited
+
+
+def _open_crawl(frontier: CrawlFrontier, start_url: str, max_depth: int,
+                allowed_domains: List[str] = None, title: str = "SCRAPING RÉCURSIF") -> List[str]:
+    """
+    Initialise une frontière pour un nouveau crawl, ou prépare la reprise d'un crawl
+    
+    Args:
+        frontier: Frontière (vide ou issue d'un crawl interrompu)
+        start_url: URL de départ
+        max_depth: Profondeur maximale de récursion
+        allowed_domains: Liste des domaines autorisés (None = domaine de départ)
+        title: Titre affiché dans le log
         
-        return links
+    Returns:
+        Liste des domaines autorisés pour ce crawl
+    """
+    resumed = frontier.get_meta('start_url') is not None
+    if resumed:
+        start_url = frontier.get_meta('start_url')
+        if allowed_domains is None:
+            allowed_domains = frontier.get_meta('allowed_domains')
     
-    def scrape_page(self, url: str, wait_time: int = 10) -> List[str]:
+    logger.info(f"{'='*60}")
+    logger.info(title)
+    logger.info(f"{'='*60}")
+    logger.info(f"URL de départ: {start_url}")
+    logger.info(f"Profondeur maximale: {max_depth}")
+    
+    # Définir les domaines autorisés par défaut
+    if allowed_domains is None and start_url:
+        allowed_domains = [urlparse(start_url).netloc]
+    
+    if resumed:
+        requeued = frontier.requeue_in_progress()
+        counts = frontier.counts()
+        logger.info(f"Reprise du crawl ({frontier.path}): {len(frontier.visited())} page(s) déjà visitée(s), "
+                    f"{counts.get('pending', 0)} en attente dont {requeued} interrompue(s)")
+    else:
+        frontier.set_meta('start_url', start_url)
+        frontier.set_meta('allowed_domains', allowed_domains)
+        frontier.add(start_url, 0)
+    
+    logger.info(f"{'='*60}\n")
+    return allowed_domains
+
+
+class VideoScraperPool:
+    """Pool de navigateurs pour scraper plusieurs pages en parallèle"""
+    
+    def __init__(self, browser: str = 'chrome', headless: bool = False, workers: int = 4,
+                 classifier: VideoUrlClassifier = None, **scraper_options):
         """
-        Scrape une page pour détecter les flux vidéo
+        Initialise le pool
         
         Args:
-            url: URL de la page à scraper
-            wait_time: Temps d'attente pour le chargement (secondes)
-            
-        Returns:
-            Liste des URLs de flux vidéo détectées
+            browser: Type de navigateur ('chrome', 'firefox', 'edge')
+            headless: Mode sans interface graphique
+            workers: Nombre de navigateurs lancés en parallèle
+            classifier: Classifieur d'URLs vidéo partagé par tous les navigateurs
+            **scraper_options: Options transmises à chaque VideoScraper (tiered, js_domains...);
+                results_path ouvre un journal JSONL unique, partagé par le pool;
+                report_path et metrics_path portent sur les mesures de tout le pool
         """
-        if not self.driver:
-            self.start()
+        if workers < 1:
+            raise ValueError(f"Nombre de workers invalide: {workers}")
+        if scraper_options.get('tabs', 1) > 1:
+            raise ValueError("Le mode multi-onglets (tabs) s'utilise avec un VideoScraper seul")
         
-        logger.info(f"Chargement de la page: {url}")
-        self.video_urls.clear()
+        results_path = scraper_options.pop('results_path', None)
+        self.sink: Optional[ResultSink] = ResultSink(results_path) if results_path else None
+        self.report_path = scraper_options.pop('report_path', None)
+        self.metrics_path = scraper_options.pop('metrics_path', None)
         
-        try:
-            # Charge la page
-            self.driver.get(url)
-            
-            # Attend le chargement
-            logger.info(f"Attente de {wait_time} secondes pour le chargement complet...")
-            time.sleep(wait_time)
-            
-            # Scroll pour déclencher le chargement lazy
-            logger.info("Scroll de la page pour charger le contenu...")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
-            
-            # Extrait les URLs vidéo
-            logger.info("Analyse des flux réseau...")
-            self._extract_network_logs()
-            
-            logger.info("Analyse des éléments HTML...")
-            self._extract_video_elements()
-            
-            # Résultats
-            if self.video_urls:
-                logger.info(f"\n{'='*60}")
-                logger.info(f"✓ {len(self.video_urls)} flux vidéo détecté(s)")
-                logger.info(f"{'='*60}")
-                for i, video_url in enumerate(self.video_urls, 1):
-                    logger.info(f"{i}. {video_url}")
-            else:
-                logger.warning("Aucun flux vidéo détecté sur cette page")
-            
-            return list(self.video_urls)
+        if scraper_options.get('governor') is True:
+            scraper_options['governor'] = ResourceGovernor()
+        self.governor: Optional[ResourceGovernor] = scraper_options.get('governor')
         
-        except Exception as e:
-            logger.error(f"Erreur lors du scraping: {e}")
-            return []
+        self.browser = browser.lower()
+        self.headless = headless
+        self.workers = workers
+        self.classifier = classifier or VideoUrlClassifier()
+        self.scrapers: List[VideoScraper] = [
+            VideoScraper(browser=browser, headless=headless, classifier=self.classifier, **scraper_options)
+            for _ in range(workers)
+        ]
+        self.video_urls: Set[str] = self.governor.new_set() if self.governor is not None else set()
+        # Flux regroupés de tout le pool, et nombre d'URLs qu'ils couvrent
+        self.streams: List[StreamRecord] = []
+        self._streams_size = 0
+        self.fetch_manifests = scraper_options.get('fetch_manifests', True)
+        self.validate = scraper_options.get('validate', False)
+        # Mode tiered: chaque navigateur est lancé à la première page qui en a besoin
+        self.tiered = scraper_options.get('tiered', False)
+        self.validation: Dict[str, Dict] = {}
+        self.visited_urls: Set[str] = set()
+        self._lock = threading.Lock()
     
-    def scrape_recursive(self, start_url: str, max_depth: int = 2, wait_time: int = 10, 
-                         allowed_domains: List[str] = None, delay_between_requests: int = 2) -> List[str]:
+    def start(self):
+        """Démarre tous les navigateurs du pool (en parallèle)"""
+        logger.info(f"Démarrage de {self.workers} navigateur(s) {self.browser}...")
+        
+        threads = [
+            threading.Thread(target=scraper.start, daemon=True)
+            for scraper in self.scrapers if not scraper.driver
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        started = [scraper for scraper in self.scrapers if scraper.driver]
+        if not started:
+            raise RuntimeError("Aucun navigateur du pool n'a pu démarrer")
+        
+        if len(started) < len(self.scrapers):
+            logger.warning(f"Seulement {len(started)}/{len(self.scrapers)} navigateur(s) démarré(s)")
+        self.scrapers = started
+    
+    def scrape_recursive(self, start_url: str, max_depth: int = 2, wait_time: int = 10,
+                         allowed_domains: List[str] = None, delay_between_requests: int = 2,
+                         resume: str = None, max_pages: int = None,
+                         max_duration: float = None, bloom_capacity: int = None,
+                         bloom_error_rate: float = 0.001) -> List[str]:
         """
-        Scrape récursivement plusieurs pages pour détecter les flux vidéo
+        Scrape récursivement plusieurs pages avec tous les navigateurs du pool
+        
+        Les pages sont distribuées via une frontière partagée: chaque navigateur
+        prend la prochaine page disponible dès qu'il a terminé la précédente.
         
         Args:
             start_url: URL de départ
             max_depth: Profondeur maximale de récursion (0 = page actuelle uniquement)
-            wait_time: Temps d'attente pour le chargement de chaque page (secondes)
-            allowed_domains: Liste des domaines autorisés (None = tous les domaines)
-            delay_between_requests: Délai entre les requêtes (secondes)
+            wait_time: Temps d'attente maximal pour le chargement de chaque page (secondes)
+            allowed_domains: Liste des domaines autorisés (None = domaine de départ uniquement)
+            delay_between_requests: Délai entre deux requêtes vers un même hôte (secondes)
+            resume: Fichier de sauvegarde du crawl (créé s'il n'existe pas, repris sinon)
+            max_pages: Nombre maximal de pages à visiter (None = illimité)
+            max_duration: Durée maximale du crawl (secondes, None = illimitée)
+            bloom_capacity: Nombre de pages prévu; active un filtre de Bloom à la
+                place d'un set pour les pages visitées (très gros crawls)
+            bloom_error_rate: Taux de faux positifs du filtre de Bloom
             
         Returns:
             Liste des URLs de flux vidéo détectées
         """
-        if not self.driver:
+        if not self.tiered and not any(scraper.driver for scraper in self.scrapers):
             self.start()
         
         self.video_urls.clear()
-        self.visited_urls.clear()
-        self.found_links.clear()
+        self.visited_urls = _new_visited_set(bloom_capacity, bloom_error_rate, self.governor)
+        for scraper in self.scrapers:
+            scraper.canonical_stats = {'rewritten': 0, 'duplicates_avoided': 0}
         
-        logger.info(f"{'='*60}")
-        logger.info(f"SCRAPING RÉCURSIF")
-        logger.info(f"{'='*60}")
-        logger.info(f"URL de départ: {start_url}")
-        logger.info(f"Profondeur maximale: {max_depth}")
-        logger.info(f"{'='*60}\n")
+        # Un gros crawl garde sa frontière sur disque même sans reprise
+        frontier = CrawlFrontier(resume or (None if bloom_capacity or self.governor else ':memory:'))
+        start_url = self.scrapers[0].canonicalizer.canonicalize(start_url)
+        allowed_domains = _open_crawl(
+            frontier, start_url, max_depth, allowed_domains,
+            title=f"SCRAPING RÉCURSIF PARALLÈLE ({len(self.scrapers)} navigateurs)"
+        )
+        self.visited_urls.update(frontier.visited())
+        self.video_urls.update(frontier.videos())
+        scheduler = CrawlScheduler(frontier, delay_between_requests, max_pages=max_pages,
+                                   max_duration=max_duration, max_depth=max_depth)
         
-        # Définir les domaines autorisés par défaut
-        if allowed_domains is None and start_url:
-            domain = urlparse(start_url).netloc
-            allowed_domains = [domain]
+        # Réveille les workers en attente quand une page se termine
+        condition = threading.Condition(self._lock)
+        stop = threading.Event()
+        active = [0]
         
-        def _scrape_recursive_helper(url: str, current_depth: int):
-            """Fonction helper récursive"""
-            
-            # Arrête si déjà visitée
-            if url in self.visited_urls:
-                return
-            
-            # Arrête si profondeur dépassée
-            if current_depth > max_depth:
-                return
-            
-            self.visited_urls.add(url)
-            
-            logger.info(f"\n[Profondeur {current_depth}] Scraping: {url}")
-            
-            try:
-                # Charge la page
-                self.driver.get(url)
-                
-                # Attend le chargement
-                logger.info(f"Attente de {wait_time} secondes...")
-                time.sleep(wait_time)
-                
-                # Scroll pour déclencher le chargement lazy
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
-                
-                # Extrait les URLs vidéo
-                logger.info("Analyse des flux réseau...")
-                self._extract_network_logs()
-                
-                logger.info("Analyse des éléments HTML...")
-                self._extract_video_elements()
+        def _next_page() -> Optional[Tuple[str, int]]:
+            """Attend une page à traiter; None quand le crawl est terminé"""
+            with condition:
+                while not stop.is_set():
+                    item, wait = scheduler.try_next()
+                    if item is not None:
+                        active[0] += 1
+                        return item
+                    # Plus rien en attente: fini si aucun worker ne peut en ajouter
+                    if wait is None and active[0] == 0:
+                        condition.notify_all()
+                        return None
+                    # Attend la fin d'une page ou le prochain jeton d'un hôte
+                    condition.wait(wait)
+                return None
+        
+        def _worker(scraper: VideoScraper):
+            """Traite les pages de la frontière jusqu'à la fin du crawl"""
+            while True:
+                item = _next_page()
+                if item is None:
+                    return
                 
-                # Extrait les liens (seulement si pas au max de profondeur)
-                if current_depth < max_depth:
-                    logger.info("Extraction des liens pour récursion...")
-                    new_links = self._extract_links(url, allowed_domains)
+                url, depth = item
+                try:
+                    logger.info(f"\n[Profondeur {depth}] Scraping: {url}")
+                    scraper.video_urls.clear()
+                    new_links = scraper._analyze_page(
+                        url, wait_time,
+                        allowed_domains=allowed_domains,
+                        collect_links=depth < max_depth,
+                        depth=depth
+                    )
+                    with self._lock:
+                        self.visited_urls.add(url)
+                        if self.sink is not None:
+                            for record in scraper._page_records:
+                                if record['url'] not in self.video_urls:
+                                    self.sink.write(record)
+                        self.video_urls.update(scraper.video_urls)
+                        new_links = scraper._unvisited_links(new_links, self.visited_urls)
                     
-                    # Scrape récursivement les nouveaux liens
-                    for link in new_links:
-                        if link not in self.visited_urls:
-                            logger.info(f"Prochain lien à traiter: {link}")
-                            time.sleep(delay_between_requests)
-                            _scrape_recursive_helper(link, current_depth + 1)
-            
-            except Exception as e:
-                logger.error(f"Erreur lors du scraping récursif de {url}: {e}")
+                    # Journal écrit avant que la page soit enregistrée comme faite (reprise)
+                    if self.sink is not None and scraper._page_records:
+                        self.sink.flush()
+                    frontier.complete(url, links=scraper._link_entries(new_links, depth + 1),
+                                      videos=scraper._page_videos)
+                
+                except Exception as e:
+                    logger.error(f"Erreur lors du scraping récursif de {url}: {e}")
+                    frontier.fail(url, str(e))
+                    with self._lock:
+                        self.visited_urls.add(url)
+                finally:
+                    with condition:
+                        active[0] -= 1
+                        condition.notify_all()
         
-        # Lance le scraping récursif
-        _scrape_recursive_helper(start_url, 0)
+        threads = [
+            threading.Thread(target=_worker, args=(scraper,), daemon=True)
+            for scraper in self.scrapers
+        ]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            # join() par intervalles pour que Ctrl-C reste pris en compte
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            stop.set()
+            with condition:
+                condition.notify_all()
+            if resume:
+                logger.warning(f"Crawl interrompu: relancez avec resume='{resume}' pour le reprendre")
+            raise
+        finally:
+            if scheduler.budget_exhausted():
+                logger.warning(f"Budget atteint ({scheduler.pages_started} page(s)): "
+                               f"{frontier.counts().get('pending', 0)} page(s) restent en attente")
+            # Un worker encore occupé par une page écrit toujours dans la frontière
+            if not any(thread.is_alive() for thread in threads):
+                frontier.close()
         
         # Résultats
         logger.info(f"\n{'='*60}")
         logger.info(f"RÉSULTATS FINAUX")
         logger.info(f"{'='*60}")
         logger.info(f"Pages visitées: {len(self.visited_urls)}")
-        logger.info(f"Flux vidéo détectés: {len(self.video_urls)}")
+        rewritten = sum(scraper.canonical_stats['rewritten'] for scraper in self.scrapers)
+        duplicates = sum(scraper.canonical_stats['duplicates_avoided'] for scraper in self.scrapers)
+        logger.info(f"Liens canonicalisés: {rewritten} (chargements en double évités: {duplicates})")
+        self.collapse_streams()
+        if self.validate:
+            self.validate_streams()
+        logger.info(f"Flux vidéo détectés: {len(self.streams)} ({len(self.video_urls)} URL(s))")
         
         if self.video_urls:
             logger.info(f"\nListe des flux vidéo:")
-            for i, video_url in enumerate(self.video_urls, 1):
-                logger.info(f"{i}. {video_url}")
+            for i, stream in enumerate(self.streams, 1):
+                logger.info(f"{i}. {stream.summary()}")
         else:
             logger.warning("Aucun flux vidéo détecté")
         
+        _write_stats_reports(self.stats, self.report_path, self.metrics_path)
         logger.info(f"{'='*60}\n")
         
         return list(self.video_urls)
     
-    def save_results(self, filename: str = 'video_urls.txt'):
+    @property
+    def stats(self) -> ScrapeStats:
+        """Mesures cumulées de tous les navigateurs du pool"""
+        return ScrapeStats.merged(scraper.stats for scraper in self.scrapers)
+    
+    def collapse_streams(self) -> List[StreamRecord]:
+        """
+        Regroupe par flux les URLs détectées par l'ensemble du pool
+        
+        Returns:
+            Liste des flux
+        """
+        self.streams = _collapse_streams(self.video_urls, self.fetch_manifests)
+        self._streams_size = len(self.video_urls)
+        return self.streams
+    
+    def validate_streams(self, urls=None, workers: int = 32) -> Dict[str, Dict]:
+        """
+        Vérifie par HTTP les flux détectés par l'ensemble du pool
+        
+        Args:
+            urls: URLs à vérifier (défaut: une par flux de self.streams)
+            workers: Nombre de sondes simultanées
+            
+        Returns:
+            Dictionnaire URL -> résultat de la sonde
+        """
+        if urls is None and self._streams_size != len(self.video_urls):
+            self.collapse_streams()
+        results = _validate_streams(self.streams, urls, workers)
+        self.validation.update(results)
+        return results
+    
+    def save_results(self, filename: str = 'video_urls.txt', valid_only: bool = False):
         """
-        Sauvegarde les URLs détectées dans un fichier
+        Sauvegarde les URLs détectées par l'ensemble du pool
         
         Args:
             filename: Nom du fichier de sortie
+            valid_only: N'écrit pas les flux dont la vérification a échoué
         """
         if not self.video_urls:
             logger.warning("Aucune URL à sauvegarder")
             return
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"Flux vidéo détectés - {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'='*80}\n\n")
-                for i, url in enumerate(self.video_urls, 1):
-                    f.write(f"{i}. {url}\n")
-            
-            logger.info(f"✓ Résultats sauvegardés dans {filename}")
-        except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde: {e}")
+        if self._streams_size != len(self.video_urls):
+            self.collapse_streams()
+        _save_streams(filename, self.streams, valid_only)
     
     def close(self):
-        """Ferme le navigateur"""
-        if self.driver:
-            logger.info("Fermeture du navigateur...")
-            self.driver.quit()
-            self.driver = None
+        """Ferme tous les navigateurs du pool"""
+        if self.sink is not None:
+            self.sink.close()
+        for urls in (self.video_urls, self.visited_urls):
+            if isinstance(urls, SpillSet):
+                urls.close()
+        for scraper in self.scrapers:
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture d'un navigateur: {e}")
     
     def __enter__(self):
-        """Support du context manager"""
-        self.start()
+        """Support du context manager (navigateurs lancés à la demande en mode tiered)"""
+        if not self.tiered:
+            self.start()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -464,8 +5261,351 @@ class VideoScraper:
         self.close()
 
 
+class PageResult:
+    """Résultat de l'analyse d'une page par AsyncVideoScraper"""
+    
+    def __init__(self, url: str, videos: List[str] = None, streams: List[StreamRecord] = None,
+                 records: List[Dict] = None, error: str = None, elapsed: float = 0.0,
+                 timed_out: bool = False):
+        """
+        Args:
+            url: URL de la page
+            videos: URLs de flux détectées sur la page
+            streams: Flux regroupés (manifestes, fichiers isolés...)
+            records: Détections avec leurs métadonnées (format du journal JSONL)
+            error: Message d'erreur (None = page analysée)
+            elapsed: Durée de l'analyse (secondes)
+            timed_out: La page a dépassé son délai maximal
+        """
+        self.url = url
+        self.videos = videos or []
+        self.streams = streams or []
+        self.records = records or []
+        self.error = error
+        self.elapsed = elapsed
+        self.timed_out = timed_out
+    
+    @property
+    def ok(self) -> bool:
+        """La page a été analysée sans erreur"""
+        return self.error is None
+    
+    def to_dict(self) -> Dict:
+        """Représentation sérialisable (JSON) du résultat"""
+        return {
+            'url': self.url,
+            'videos': self.videos,
+            'streams': [stream.to_dict() for stream in self.streams],
+            'error': self.error,
+            'elapsed': round(self.elapsed, 3),
+            'timed_out': self.timed_out,
+        }
+
+
+class AsyncVideoScraper:
+    """
+    Interface asyncio: plusieurs navigateurs pilotés depuis une boucle d'événements
+    
+    Selenium étant bloquant, chaque navigateur garde un thread dédié (un par
+    session, pas un par page). La boucle distribue les URLs aux sessions
+    libres, applique un délai maximal par URL et propage l'annulation: la page
+    en cours est abrégée et la session ne reprend une URL qu'une fois libérée.
+    Le regroupement des flux et leur vérification HTTP sont lancés depuis la
+    boucle sur un pool commun, une fois le navigateur rendu à une autre page.
+    
+    Exemple:
+        async with AsyncVideoScraper(concurrency=4) as scraper:
+            async for result in scraper.iter_results(urls, timeout=60):
+                print(result.url, result.videos)
+    """
+    
+    def __init__(self, browser: str = 'chrome', headless: bool = True, concurrency: int = 4,
+                 classifier: VideoUrlClassifier = None, **scraper_options):
+        """
+        Initialise les sessions (les navigateurs sont lancés par start())
+        
+        Args:
+            browser: Type de navigateur ('chrome', 'firefox', 'edge')
+            headless: Mode sans interface graphique
+            concurrency: Nombre de navigateurs, donc de pages analysées en même temps
+            classifier: Classifieur d'URLs vidéo partagé par toutes les sessions
+            **scraper_options: Options transmises à chaque VideoScraper (tiered, blocking...);
+                results_path ouvre un journal JSONL unique, partagé par les sessions;
+                report_path et metrics_path sont écrits par close()
+        """
+        if concurrency < 1:
+            raise ValueError(f"Niveau de concurrence invalide: {concurrency}")
+        if scraper_options.get('tabs', 1) > 1:
+            raise ValueError("Le mode multi-onglets (tabs) s'utilise avec un VideoScraper seul")
+        
+        results_path = scraper_options.pop('results_path', None)
+        self.sink: Optional[ResultSink] = ResultSink(results_path) if results_path else None
+        self.report_path = scraper_options.pop('report_path', None)
+        self.metrics_path = scraper_options.pop('metrics_path', None)
+        
+        self.browser = browser.lower()
+        self.classifier = classifier or VideoUrlClassifier()
+        self.fetch_manifests = scraper_options.get('fetch_manifests', True)
+        self.validate = scraper_options.get('validate', False)
+        # (scraper, thread dédié) par session
+        self._sessions: List[Tuple[VideoScraper, ThreadPoolExecutor]] = [
+            (VideoScraper(browser=browser, headless=headless, classifier=self.classifier, **scraper_options),
+             ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"scraper-{i}"))
+            for i in range(concurrency)
+        ]
+        # Téléchargement des manifestes et sondes HTTP (requests est bloquant)
+        self._http_executor = ThreadPoolExecutor(max_workers=2 * concurrency, thread_name_prefix='scraper-http')
+        self._idle: Optional[asyncio.Queue] = None
+        self.video_urls: Set[str] = set()
+        # Flux regroupés de toutes les sessions, et nombre d'URLs qu'ils couvrent
+        self.streams: List[StreamRecord] = []
+        self._streams_size = 0
+    
+    async def start(self):
+        """Démarre tous les navigateurs (en parallèle)"""
+        loop = asyncio.get_running_loop()
+        logger.info(f"Démarrage de {len(self._sessions)} navigateur(s) {self.browser}...")
+        outcomes = await asyncio.gather(
+            *(loop.run_in_executor(executor, scraper.start) for scraper, executor in self._sessions),
+            return_exceptions=True
+        )
+        
+        started = []
+        for session, outcome in zip(self._sessions, outcomes):
+            if isinstance(outcome, BaseException) or not session[0].driver:
+                session[1].shutdown(wait=False)
+            else:
+                started.append(session)
+        if not started:
+            raise RuntimeError("Aucun navigateur n'a pu démarrer")
+        if len(started) < len(self._sessions):
+            logger.warning(f"Seulement {len(started)}/{len(self._sessions)} navigateur(s) démarré(s)")
+        
+        self._sessions = started
+        self._idle = asyncio.Queue()
+        for session in started:
+            self._idle.put_nowait(session)
+    
+    def _scrape_sync(self, scraper: VideoScraper, url: str, wait_time: float) -> PageResult:
+        """Analyse une page dans le thread de sa session (flux regroupés ensuite, voir _describe_streams)"""
+        started = time.perf_counter()
+        error = None
+        # Les flux déjà vus par la session sur une autre page restent à rapporter:
+        # le dédoublonnage se fait dans self.video_urls et le journal
+        scraper.video_urls.clear()
+        try:
+            scraper._analyze_page(url, wait_time, scroll_pause=2)
+        except Exception as e:
+            error = str(e)
+        
+        return PageResult(url, list(scraper._page_videos), records=list(scraper._page_records),
+                          error=error, elapsed=time.perf_counter() - started)
+    
+    def _describe_streams(self, videos: List[str]) -> List[StreamRecord]:
+        """Regroupe (et vérifie) les flux d'une page, dans le pool HTTP commun"""
+        streams = _collapse_streams(videos, self.fetch_manifests)
+        if self.validate:
+            _validate_streams(streams)
+        return streams
+    
+    def _release(self, session: Tuple[VideoScraper, ThreadPoolExecutor], job: 'asyncio.Future'):
+        """Rend une session disponible, dès que sa page est réellement terminée"""
+        if job.done():
+            self._idle.put_nowait(session)
+        else:
+            job.add_done_callback(lambda _: self._idle.put_nowait(session))
+    
+    async def scrape(self, url: str, wait_time: float = 10, timeout: float = None) -> PageResult:
+        """
+        Analyse une page dès qu'une session est libre
+        
+        Args:
+            url: URL de la page
+            wait_time: Temps d'attente maximal pour le chargement (secondes)
+            timeout: Durée maximale de l'analyse, attente d'une session non
+                comprise (secondes, None = illimitée)
+        
+        Returns:
+            Résultat de la page (error renseigné en cas d'échec ou de délai dépassé)
+        """
+        if self._idle is None:
+            await self.start()
+        
+        session = await self._idle.get()
+        scraper, executor = session
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        job = loop.run_in_executor(executor, self._scrape_sync, scraper, url, wait_time)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(job), timeout)
+        except asyncio.TimeoutError:
+            scraper._interrupt.set()
+            logger.warning(f"Délai dépassé ({timeout}s): {url}")
+            return PageResult(url, error=f"Délai dépassé ({timeout}s)", elapsed=timeout, timed_out=True)
+        except asyncio.CancelledError:
+            scraper._interrupt.set()
+            raise
+        finally:
+            self._release(session, job)
+        
+        # Sondes HTTP après la libération du navigateur, dans le reste du délai
+        if result.videos and result.error is None:
+            remaining = None if timeout is None else max(0.0, timeout - (loop.time() - started))
+            try:
+                result.streams = await asyncio.wait_for(
+                    loop.run_in_executor(self._http_executor, self._describe_streams, result.videos),
+                    remaining
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Délai dépassé ({timeout}s) pendant la vérification des flux: {url}")
+                result.error = f"Délai dépassé ({timeout}s)"
+                result.timed_out = True
+            result.elapsed = loop.time() - started
+        
+        if result.error:
+            logger.error(f"Erreur lors du scraping de {url}: {result.error}")
+        
+        # Journal et résultats cumulés (boucle d'événements: pas de verrou)
+        if self.sink is not None:
+            for record in result.records:
+                if record['url'] not in self.video_urls:
+                    self.sink.write(record)
+        self.video_urls.update(result.videos)
+        return result
+    
+    async def _iter_indexed(self, urls, wait_time: float, concurrency: Optional[int],
+                            timeout: Optional[float]):
+        """Produit (rang dans urls, résultat) au fil des pages terminées"""
+        if self._idle is None:
+            await self.start()
+        
+        # Deux pages par session: l'une dans le navigateur, l'autre en vérification HTTP
+        workers_count = min(concurrency or 2 * len(self._sessions), 2 * len(self._sessions))
+        pending = iter(enumerate(urls))
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def _worker():
+            try:
+                for index, url in pending:
+                    await results.put((index, await self.scrape(url, wait_time, timeout)))
+            finally:
+                results.put_nowait(None)
+        
+        workers = [asyncio.ensure_future(_worker()) for _ in range(workers_count)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await results.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def iter_results(self, urls, wait_time: float = 10, concurrency: int = None,
+                           timeout: float = None):
+        """
+        Analyse des pages et produit leurs résultats dans l'ordre où elles se terminent
+        
+        Interrompre l'itération (break, annulation de la tâche) annule les
+        pages en cours.
+        
+        Args:
+            urls: URLs des pages (itérable, consommé au fur et à mesure)
+            wait_time: Temps d'attente maximal pour le chargement de chaque page (secondes)
+            concurrency: Nombre maximal de pages simultanées (None = deux par session)
+            timeout: Durée maximale de l'analyse de chaque page (secondes)
+        
+        Yields:
+            PageResult de chaque page
+        """
+        async for _, result in self._iter_indexed(urls, wait_time, concurrency, timeout):
+            yield result
+    
+    async def scrape_many(self, urls, wait_time: float = 10, concurrency: int = None,
+                          timeout: float = None) -> List[PageResult]:
+        """
+        Analyse des pages en parallèle
+        
+        Args:
+            urls: URLs des pages
+            wait_time: Temps d'attente maximal pour le chargement de chaque page (secondes)
+            concurrency: Nombre maximal de pages simultanées (None = deux par session)
+            timeout: Durée maximale de l'analyse de chaque page (secondes)
+        
+        Returns:
+            Résultats dans l'ordre des URLs
+        """
+        urls = list(urls)
+        results: List[Optional[PageResult]] = [None] * len(urls)
+        async for index, result in self._iter_indexed(urls, wait_time, concurrency, timeout):
+            results[index] = result
+        logger.info(f"✓ {len(urls)} page(s) analysée(s), {len(self.video_urls)} URL(s) de flux")
+        return results
+    
+    @property
+    def stats(self) -> ScrapeStats:
+        """Mesures cumulées de toutes les sessions"""
+        return ScrapeStats.merged(scraper.stats for scraper, _ in self._sessions)
+    
+    def collapse_streams(self) -> List[StreamRecord]:
+        """
+        Regroupe par flux les URLs détectées par l'ensemble des sessions
+        
+        Returns:
+            Liste des flux
+        """
+        self.streams = _collapse_streams(self.video_urls, self.fetch_manifests)
+        self._streams_size = len(self.video_urls)
+        return self.streams
+    
+    def save_results(self, filename: str = 'video_urls.txt', valid_only: bool = False):
+        """
+        Sauvegarde les URLs détectées par l'ensemble des sessions
+        
+        Args:
+            filename: Nom du fichier de sortie
+            valid_only: N'écrit pas les flux dont la vérification a échoué
+        """
+        if not self.video_urls:
+            logger.warning("Aucune URL à sauvegarder")
+            return
+        if self._streams_size != len(self.video_urls):
+            self.collapse_streams()
+        _save_streams(filename, self.streams, valid_only)
+    
+    async def close(self):
+        """Ferme tous les navigateurs (après la fin des pages en cours)"""
+        if self.report_path or self.metrics_path:
+            _write_stats_reports(self.stats, self.report_path, self.metrics_path)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, scraper.close) for scraper, executor in self._sessions),
+            return_exceptions=True
+        )
+        for _, executor in self._sessions:
+            executor.shutdown(wait=False)
+        self._http_executor.shutdown(wait=False)
+        self._idle = None
+        if self.sink is not None:
+            self.sink.close()
+    
+    async def __aenter__(self):
+        """Support du context manager asynchrone"""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Support du context manager asynchrone"""
+        await self.close()
+
+
 def main():
     """Fonction principale avec menu interactif"""
+    _configure_logging()
     print("="*60)
     print("VIDEO STREAM SCRAPER")
     print("="*60)
@@ -563,5 +5703,308 @@ def main():
     input()
 
 
+# Codes de sortie de la ligne de commande
+EXIT_OK = 0
+EXIT_PARTIAL = 1      # au moins une URL de départ n'a pas pu être explorée
+EXIT_USAGE = 2        # arguments ou fichier de départ invalides
+EXIT_INTERRUPTED = 130
+
+
+def _read_seeds(path: str) -> List[str]:
+    """
+    Lit les URLs de départ (une par ligne, '#' pour les commentaires, '-' = entrée standard)
+    
+    Args:
+        path: Fichier des URLs
+    
+    Returns:
+        URLs http(s), sans doublons, dans l'ordre du fichier
+    """
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    
+    seeds = []
+    for line in lines:
+        url = line.split('#', 1)[0].strip()
+        if not url:
+            continue
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        seeds.append(url)
+    return list(dict.fromkeys(seeds))
+
+
+def _shard_seeds(seeds: List[str], shards: int) -> List[List[str]]:
+    """
+    Répartit les URLs de départ entre les processus, par hôte
+    
+    Toutes les URLs d'un même hôte vont au même processus: la limite de
+    débit par hôte reste respectée sans coordination entre processus.
+    
+    Returns:
+        Liste (non vide) des URLs de chaque processus
+    """
+    buckets: List[List[str]] = [[] for _ in range(shards)]
+    for seed in seeds:
+        host = urlsplit(seed).netloc.lower()
+        index = int.from_bytes(hashlib.md5(host.encode()).digest()[:4], 'big') % shards
+        buckets[index].append(seed)
+    return [bucket for bucket in buckets if bucket]
+
+
+def _crawl_shard(index: int, seeds: List[str], options: Dict) -> Dict:
+    """
+    Explore une part des URLs de départ avec son propre navigateur (processus fils)
+    
+    Les détections sont écrites au fil de l'eau dans '<out>.part<index>'.
+    
+    Args:
+        index: Numéro du processus
+        seeds: URLs de départ de ce processus
+        options: Options de la ligne de commande
+    
+    Returns:
+        Bilan: URLs en échec, pages, flux écrits, mesures (ScrapeStats), durée
+    """
+    # Processus neuf (spawn): l'import du module ne configure pas le journal
+    _configure_logging()
+    if options['quiet']:
+        logger.setLevel(logging.WARNING)
+    
+    # Redémarrage périodique du navigateur (--recycle-pages, --max-browser-mb)
+    limits = {name: options[key] for name, key in (('max_pages', 'recycle_pages'),
+                                                   ('max_browser_mb', 'max_browser_mb'))
+              if options[key]}
+    scraper = VideoScraper(
+        browser=options['browser'], headless=options['headless'],
+        results_path=f"{options['out']}.part{index}", tiered=options['tiered'],
+        tabs=options['tabs'], blocking=options['blocking'] or None,
+        offline=options['offline'], validate=options['validate'],
+        governor=ResourceGovernor(**limits) if limits else None,
+        page_load_strategy=options['page_load_strategy'], page_load_timeout=options['page_load_timeout'],
+        retries=options['retries'],
+    )
+    failed = []
+    started = time.perf_counter()
+    
+    def _crawl_all():
+        for seed in seeds:
+            try:
+                scraper.scrape_recursive(
+                    seed, max_depth=options['max_depth'], wait_time=options['wait_time'],
+                    delay_between_requests=options['delay'], max_pages=options['max_pages'],
+                )
+            except Exception as e:
+                logger.error(f"Échec de l'exploration de {seed}: {e}")
+                failed.append(seed)
+                continue
+            # Aucune page menée à bien (les erreurs d'extraction rattrapées ne comptent pas)
+            if not scraper.crawl_counts.get('done'):
+                failed.append(seed)
+    
+    try:
+        if options['profile']:
+            _run_profiled(_crawl_all, path=f"scrappeur-{index}.prof")
+        else:
+            _crawl_all()
+    except KeyboardInterrupt:
+        logger.warning(f"Processus {index} interrompu")
+    finally:
+        scraper.close()
+    
+    return {
+        'shard': index,
+        'seeds': len(seeds),
+        'failed': failed,
+        'streams': scraper.sink.written,
+        'stats': scraper.stats,
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def _merge_results(out: str, parts: List[str]) -> int:
+    """
+    Fusionne les journaux JSONL des processus dans out (une ligne par flux)
+    
+    Returns:
+        Nombre de flux distincts écrits
+    """
+    seen: Set[str] = set()
+    with open(out, 'w', encoding='utf-8') as f:
+        for part in parts:
+            if not os.path.exists(part):
+                continue
+            for record in ResultSink.read(part):
+                if record.get('url') in seen:
+                    continue
+                seen.add(record.get('url'))
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            os.remove(part)
+    return len(seen)
+
+
+def crawl_command(args) -> int:
+    """
+    Commande 'crawl': explore des milliers d'URLs de départ en plusieurs processus
+    
+    Returns:
+        Code de sortie
+    """
+    try:
+        seeds = _read_seeds(args.seeds)
+    except OSError as e:
+        print(f"❌ Fichier des URLs de départ illisible: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not seeds:
+        print("❌ Aucune URL de départ", file=sys.stderr)
+        return EXIT_USAGE
+    
+    shards = _shard_seeds(seeds, args.workers)
+    options = {key: getattr(args, key) for key in (
+        'browser', 'out', 'tiered', 'tabs', 'blocking', 'offline', 'validate', 'quiet',
+        'max_depth', 'wait_time', 'delay', 'max_pages', 'profile', 'recycle_pages', 'max_browser_mb',
+        'page_load_strategy', 'page_load_timeout', 'retries',
+    )}
+    options['headless'] = not args.show
+    
+    logger.info(f"{len(seeds)} URL(s) de départ réparties sur {len(shards)} processus")
+    started = time.perf_counter()
+    summaries, crashed, interrupted = [], [], False
+    
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # spawn: chaque processus part d'un interpréteur neuf (pas de threads hérités)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        futures = {executor.submit(_crawl_shard, index, shard, options): shard
+                   for index, shard in enumerate(shards)}
+        try:
+            for future in as_completed(futures):
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    logger.error(f"Processus en échec: {e}")
+                    crashed.extend(futures[future])
+                    continue
+                summaries.append(summary)
+                logger.info(f"✓ Processus {summary['shard']}: {summary['seeds']} URL(s) de départ, "
+                            f"{summary['streams']} flux en {summary['elapsed']:.0f}s")
+        except KeyboardInterrupt:
+            # Les processus fils reçoivent aussi le Ctrl-C et ferment leur navigateur
+            interrupted = True
+            for future in futures:
+                future.cancel()
+    
+    streams = _merge_results(args.out, [f"{args.out}.part{index}" for index in range(len(shards))])
+    stats = ScrapeStats.merged(summary['stats'] for summary in summaries)
+    failed = crashed + [seed for summary in summaries for seed in summary['failed']]
+    elapsed = time.perf_counter() - started
+    
+    if args.report or args.metrics:
+        _write_stats_reports(stats, args.report, args.metrics, extra={
+            'seeds': len(seeds), 'failed_seeds': failed, 'processes': len(shards),
+        })
+    
+    pages = stats.counters['pages']
+    print(f"\n{'='*60}")
+    print("BILAN DU CRAWL")
+    print(f"{'='*60}")
+    print(f"URLs de départ:   {len(seeds)} ({len(failed)} en échec)")
+    print(f"Processus:        {len(shards)}")
+    print(f"Pages analysées:  {pages} en {elapsed:.0f}s ({pages / elapsed if elapsed else 0:.2f} pages/s)")
+    print(f"Flux distincts:   {streams} -> {args.out}")
+    print(f"Erreurs:          {stats.counters['errors']}")
+    for seed in failed[:20]:
+        print(f"  échec: {seed}")
+    print(f"{'='*60}")
+    
+    if interrupted:
+        return EXIT_INTERRUPTED
+    return EXIT_PARTIAL if failed else EXIT_OK
+
+
+def _build_parser():
+    """Analyseur des arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(
+        prog='python -m video_scraper',
+        description="Détection de flux vidéo. Sans argument: menu interactif.",
+        epilog="--profile (avant ou après la commande) profile l'exécution avec cProfile.",
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    crawl = commands.add_parser('crawl', help="Explore une liste d'URLs de départ (traitement par lots)")
+    crawl.add_argument('--seeds', required=True, help="Fichier des URLs de départ, une par ligne ('-' = entrée standard)")
+    crawl.add_argument('--out', default='results.jsonl', help="Journal JSONL des flux détectés (défaut: results.jsonl)")
+    crawl.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help="Nombre de processus, un navigateur chacun (défaut: nombre de cœurs)")
+    crawl.add_argument('--max-depth', type=int, default=2, help="Profondeur maximale depuis chaque URL (défaut: 2)")
+    crawl.add_argument('--max-pages', type=int, default=None, help="Pages maximales par URL de départ")
+    crawl.add_argument('--wait-time', type=float, default=10, help="Attente maximale par page en secondes (défaut: 10)")
+    crawl.add_argument('--delay', type=float, default=2, help="Délai entre deux requêtes vers un hôte (défaut: 2)")
+    crawl.add_argument('--browser', choices=['chrome', 'firefox', 'edge'], default='chrome')
+    crawl.add_argument('--show', action='store_true', help="Affiche les navigateurs (pas de mode headless)")
+    crawl.add_argument('--tabs', type=int, default=1, help="Onglets en parallèle par navigateur")
+    crawl.add_argument('--tiered', action='store_true', help="HTTP d'abord, navigateur si nécessaire")
+    crawl.add_argument('--blocking', action='store_true', help="Bloque images, polices, publicités et segments")
+    crawl.add_argument('--validate', action='store_true', help="Vérifie les flux détectés par HTTP")
+    crawl.add_argument('--offline', action='store_true', help="N'utilise que les drivers déjà en cache")
+    crawl.add_argument('--page-load-strategy', choices=['normal', 'eager', 'none'], default='normal',
+                       help="Attente de driver.get: load, DOMContentLoaded ou aucune (défaut: normal)")
+    crawl.add_argument('--page-load-timeout', type=float, default=30,
+                       help="Chargement maximal d'une page en secondes, analysée en l'état au-delà (défaut: 30)")
+    crawl.add_argument('--retries', type=int, default=1,
+                       help="Nouveaux essais d'une page après un délai dépassé ou un navigateur bloqué (défaut: 1)")
+    crawl.add_argument('--recycle-pages', type=int, default=None,
+                       help="Redémarre le navigateur toutes les N pages (active ResourceGovernor)")
+    crawl.add_argument('--max-browser-mb', type=float, default=None,
+                       help="Redémarre le navigateur au-delà de cette mémoire en Mo (active ResourceGovernor)")
+    crawl.add_argument('--report', help="Rapport JSON des mesures de performance")
+    crawl.add_argument('--metrics', help="Fichier Prometheus (textfile collector)")
+    crawl.add_argument('--quiet', action='store_true', help="N'affiche que les avertissements et erreurs")
+    crawl.set_defaults(func=crawl_command)
+    return parser
+
+
+def cli(argv: List[str] = None) -> int:
+    """
+    Point d'entrée: menu interactif sans argument, sous-commande sinon
+    
+    Args:
+        argv: Arguments (défaut: sys.argv[1:])
+    
+    Returns:
+        Code de sortie
+    """
+    _configure_logging()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    profile = '--profile' in argv
+    argv = [arg for arg in argv if arg != '--profile']
+    
+    if not argv:
+        # --profile: profil cProfile du scraper (scrappeur.prof)
+        if profile:
+            _run_profiled(main)
+        else:
+            main()
+        return EXIT_OK
+    
+    args = _build_parser().parse_args(argv)
+    args.profile = profile
+    if getattr(args, 'workers', 1) < 1 or getattr(args, 'tabs', 1) < 1:
+        print("❌ --workers et --tabs doivent être au moins 1", file=sys.stderr)
+        return EXIT_USAGE
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
+    
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())